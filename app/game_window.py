@@ -2,41 +2,134 @@
 Main game window that orchestrates all components
 Updated to include Shop
 """
-from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QSplitter, QVBoxLayout
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QSplitter, QVBoxLayout, QLabel
 from PySide6.QtCore import QTimer, Qt
+from PySide6.QtGui import QKeySequence, QShortcut
 from ui.control_panel import ControlPanel
 from ui.stats_panel import StatsPanel
+from ui.history_chart import StatHistoryChart
 from ui.shop_panel import ShopPanel
-from engine3d.viewport import Viewport3D
+from ui.roster_panel import RosterPanel
 from logic.game_manager import GameManager
 from services.save_manager import SaveManager
+from services.settings_manager import SettingsManager
 from logic.shop import Shop
+from logic.simulation import SimulationWorker
+from logic.pet_model import ObservablePetModel
+from logic.stat_history import StatHistory
+from logic.analytic import GameAnalytics
+from ui.theme import ThemeManager
+from services.startup_profiler import StartupProfiler
+from services.profiler import SamplingProfiler
+
+# Actions whose results are (success, message) and have an animation clip
+PET_ACTIONS = ('feed', 'clean', 'sleep', 'play')
 
 class GameWindow(QMainWindow):
     """Main application window"""
     
-    def __init__(self):
+    def __init__(self, profiler=None, sampler=None):
         super().__init__()
         self.setWindowTitle("Macan Ternak - 3D Pet Simulator")
         self.setMinimumSize(1280, 720)
-        self.setStyleSheet("background-color: #f5f5f5;")
+        self.profiler = profiler or StartupProfiler()
+        self.sampler = sampler or SamplingProfiler()
+        
+        # One application stylesheet; Ctrl+T switches theme at runtime
+        with self.profiler.stage('settings + theme'):
+            self.settings_manager = SettingsManager()
+            self.theme = ThemeManager(self.settings_manager.get('theme', 'light'))
+            self.theme.apply()
         
         # Initialize managers
         self.save_manager = SaveManager()
-        self.game_manager = GameManager(self.save_manager)
+        self.analytics = GameAnalytics()
+        self.analytics.start_session()
+        self.game_manager = GameManager(self.save_manager, self.analytics)
         self.shop = Shop() # Initialize Shop
+        self.pet_model = ObservablePetModel()
+        self.stat_history = StatHistory()
+        
+        # Staged startup: only the window shell is built here. OpenGL and
+        # the viewport load on the first idle after show, the save on a
+        # background thread; the simulation starts once the save is in.
+        self.viewport = None
+        self.thumbnails = None
+        self._viewport_ready = False
+        self.simulation = None
+        self._shown_snapshot = None
+        self._load_future = None
+        self._startup_scheduled = False
         
         # Setup UI
-        self._setup_ui()
+        with self.profiler.stage('window shell'):
+            self._setup_ui()
+        self.control_panel.setEnabled(False)
+        self.roster_panel.setEnabled(False)
         
-        # Load saved game
-        self.game_manager.load_game()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._startup_scheduled:
+            self._startup_scheduled = True
+            # Queued behind the shell's first paint
+            QTimer.singleShot(0, self._finish_startup)
+            
+    def _finish_startup(self):
+        """Second stage: save load in the background, viewport on this thread"""
+        self.profiler.mark('shell_shown')
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix='save-load')
+        self._load_future = self._loader.submit(self._load_save)
+        
+        with self.profiler.stage('viewport (OpenGL import + init)'):
+            self._create_viewport()
         
         # Setup game loop
         self._setup_game_loop()
         
-        # Initial UI update
-        self._update_ui()
+    def _load_save(self):
+        with self.profiler.stage('load save (background)'):
+            self.game_manager.load_game()
+            
+    def _create_viewport(self):
+        from engine3d.viewport import Viewport3D
+        from engine3d.thumbnails import ThumbnailCache, ThumbnailRenderer
+        
+        self.viewport = Viewport3D(self.game_manager)
+        self.viewport_layout.removeWidget(self.viewport_placeholder)
+        self.viewport_placeholder.deleteLater()
+        self.viewport_layout.addWidget(self.viewport)
+        
+        # Clicking a tiger makes it the target of care actions
+        self.viewport.pet_picked.connect(self._on_pet_picked)
+        self.viewport.frameSwapped.connect(self._on_first_frame)
+        
+        # Roster thumbnails are drawn offscreen in the viewport's context
+        self.thumbnails = ThumbnailCache(ThumbnailRenderer(self.viewport))
+        self.roster_panel.set_thumbnails(self.thumbnails)
+        
+    def _on_first_frame(self):
+        self.viewport.frameSwapped.disconnect(self._on_first_frame)
+        self._viewport_ready = True
+        self.profiler.mark('first_frame')
+        self._maybe_report_startup()
+        
+    def _start_simulation(self):
+        """Third stage: the save is loaded, hand the GameManager to the worker"""
+        self._load_future.result()
+        self._loader.shutdown(wait=False)
+        # From here on the GameManager belongs to the simulation thread;
+        # the GUI only reads snapshots and submits commands
+        self.simulation = SimulationWorker(self.game_manager)
+        self.simulation.start()
+        self.control_panel.setEnabled(True)
+        self.roster_panel.setEnabled(True)
+        self.profiler.mark('save_loaded')
+        self._maybe_report_startup()
+        
+    def _maybe_report_startup(self):
+        if 'first_frame' in self.profiler.marks and 'save_loaded' in self.profiler.marks:
+            self.profiler.report()
         
     def _setup_ui(self):
         central_widget = QWidget()
@@ -46,23 +139,32 @@ class GameWindow(QMainWindow):
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.setSpacing(20)
         
-        # Left: Controls
+        # Left: Controls + Roster
+        left_column = QWidget()
+        left_layout = QVBoxLayout(left_column)
+        left_layout.setContentsMargins(0,0,0,0)
+        
         self.control_panel = ControlPanel()
-        self.control_panel.setFixedWidth(220)
-        main_layout.addWidget(self.control_panel)
+        left_layout.addWidget(self.control_panel)
+        
+        self.roster_panel = RosterPanel()
+        left_layout.addWidget(self.roster_panel, stretch=1)
+        
+        left_column.setFixedWidth(220)
+        main_layout.addWidget(left_column)
         
         # Center: Viewport (Styled container)
         viewport_container = QWidget()
-        viewport_container.setStyleSheet("""
-            background-color: black;
-            border-radius: 12px;
-            overflow: hidden;
-        """)
-        viewport_layout = QHBoxLayout(viewport_container)
-        viewport_layout.setContentsMargins(0,0,0,0)
+        viewport_container.setObjectName("viewportContainer")
+        viewport_container.setAttribute(Qt.WA_StyledBackground, True)
+        self.viewport_layout = QHBoxLayout(viewport_container)
+        self.viewport_layout.setContentsMargins(0,0,0,0)
         
-        self.viewport = Viewport3D(self.game_manager)
-        viewport_layout.addWidget(self.viewport)
+        # Replaced by Viewport3D once OpenGL has loaded
+        self.viewport_placeholder = QLabel("Loading 3D view...")
+        self.viewport_placeholder.setObjectName("viewportPlaceholder")
+        self.viewport_placeholder.setAlignment(Qt.AlignCenter)
+        self.viewport_layout.addWidget(self.viewport_placeholder)
         main_layout.addWidget(viewport_container, stretch=1)
         
         # Right: Stats + Shop
@@ -74,6 +176,9 @@ class GameWindow(QMainWindow):
         self.stats_panel = StatsPanel()
         right_layout.addWidget(self.stats_panel)
         
+        self.history_chart = StatHistoryChart(self.stat_history, self.theme)
+        right_layout.addWidget(self.history_chart)
+        
         self.shop_panel = ShopPanel(self.shop)
         right_layout.addWidget(self.shop_panel)
         
@@ -89,55 +194,131 @@ class GameWindow(QMainWindow):
         self.control_panel.sleep_clicked.connect(self._on_sleep)
         self.control_panel.play_clicked.connect(self._on_play)
         
+        # Connect Roster
+        self.roster_panel.pet_selected.connect(self._on_pet_picked)
+        self.roster_panel.adopt_clicked.connect(self._on_adopt)
+        
         # Connect Shop
         self.shop_panel.item_purchased.connect(self._on_item_purchased)
         
+        # Panels repaint only for fields whose displayed value changed
+        self.stats_panel.bind(self.pet_model)
+        self.shop_panel.bind(self.pet_model)
+        
+        QShortcut(QKeySequence("Ctrl+T"), self, activated=self._on_toggle_theme)
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self._on_toggle_sampler)
+        
     def _setup_game_loop(self):
+        # Cheap poll: drain command results, redraw panels on a new snapshot
         self.game_timer = QTimer()
         self.game_timer.timeout.connect(self._game_update)
-        self.game_timer.start(1000)
+        self.game_timer.start(33)
         
     def _game_update(self):
-        self.game_manager.update()
-        self._update_ui()
-        self.viewport.update_scene()
-        
-    def _update_ui(self):
-        pet = self.game_manager.pet
-        self.stats_panel.update_stats(
-            hunger=pet.hunger,
-            energy=pet.energy,
-            mood=pet.mood,
-            cleanliness=pet.cleanliness,
-            level=pet.level,
-            exp=pet.exp,
-            exp_to_next=pet.exp_to_next_level
-        )
-        # Update coins in Shop UI
-        self.shop_panel.update_coins(pet.coins)
+        if self.simulation is None:
+            if self._load_future is None or not self._load_future.done():
+                return
+            self._start_simulation()
+            
+        for tag, result, error in self.simulation.poll_results():
+            if error is None:
+                self._on_command_result(tag, result)
+                
+        snapshot = self.simulation.latest
+        if snapshot is not self._shown_snapshot:
+            # Command results publish too; the history takes one sample per tick
+            new_tick = self._shown_snapshot is None or snapshot.tick != self._shown_snapshot.tick
+            self._shown_snapshot = snapshot
+            self._update_ui(snapshot)
+            self.viewport.update_scene(snapshot)
+            self.roster_panel.update_roster(snapshot)
+            if new_tick:
+                self.stat_history.record(snapshot.time, snapshot.pet)
+                self.history_chart.refresh()
+        # One batch of change events per frame
+        self.pet_model.flush()
+        self._update_thumbnails()
+        
+    def _update_thumbnails(self):
+        """Render a few missing roster thumbnails per poll"""
+        if not self._viewport_ready:
+            return
+        if self.thumbnails.set_appearance(self.thumbnails.render.appearance()):
+            self.roster_panel.set_thumbnails(self.thumbnails)
+        ready = self.thumbnails.render_pending(budget=2)
+        if ready:
+            self.roster_panel.roster_model.thumbnails_ready(ready)
+        
+    def _update_ui(self, snapshot):
+        """Stage the active pet's values; widgets update on the next flush"""
+        self.pet_model.apply(snapshot.pet)
         
+    def _submit(self, tag, func, *args):
+        """Send an action to the simulation (ignored until the save has loaded)"""
+        if self.simulation is not None:
+            self.simulation.submit(tag, func, *args)
+            
     def _on_feed(self):
-        success, message = self.game_manager.feed_pet()
-        self.stats_panel.show_notification(message, success)
+        self._submit('feed', self.game_manager.feed_pet)
         
     def _on_clean(self):
-        success, message = self.game_manager.clean_pet()
-        self.stats_panel.show_notification(message, success)
+        self._submit('clean', self.game_manager.clean_pet)
         
     def _on_sleep(self):
-        success, message = self.game_manager.sleep_pet()
-        self.stats_panel.show_notification(message, success)
+        self._submit('sleep', self.game_manager.sleep_pet)
         
     def _on_play(self):
-        success, message = self.game_manager.play_with_pet()
-        self.stats_panel.show_notification(message, success)
+        self._submit('play', self.game_manager.play_with_pet)
+        
+    def _on_pet_picked(self, index):
+        """Handle a tiger clicked in the viewport or the roster"""
+        self._submit('select', self.game_manager.select_pet, index)
+            
+    def _on_adopt(self):
+        """Add a tiger and make it the active one"""
+        def adopt():
+            index = self.game_manager.add_pet()
+            self.game_manager.select_pet(index)
+            return index
+        self._submit('adopt', adopt)
         
     def _on_item_purchased(self, item):
-        """Handle shop purchase"""
-        pet = self.game_manager.pet
-        success, msg, new_coins = self.shop.buy_item(item, pet)
-        self.stats_panel.show_notification(msg, success)
+        """Handle shop purchase (applied to the active pet on the worker)"""
+        self._submit('buy', lambda: self.shop.buy_item(item, self.game_manager.pet))
+        
+    def _on_toggle_theme(self):
+        """Switch to the next theme and remember it"""
+        self.settings_manager.set('theme', self.theme.toggle())
+        
+    def _on_toggle_sampler(self):
+        """Start or stop the sampling profiler (GUI and worker threads)"""
+        paths = self.sampler.toggle()
+        if self.sampler.running:
+            self.stats_panel.show_notification("Profiling... Ctrl+Shift+P to stop", True)
+        elif paths:
+            self.stats_panel.show_notification(f"Profile saved: {paths[0].name}", True)
         
+    def _on_command_result(self, tag, result):
+        """Feedback for a command the simulation thread has finished"""
+        if tag in PET_ACTIONS:
+            success, message = result
+            if success:
+                self.viewport.play_action(tag)
+                self.analytics.log_action(tag)
+            self.stats_panel.show_notification(message, success)
+        elif tag == 'buy':
+            success, msg, _ = result
+            self.stats_panel.show_notification(msg, success)
+        elif tag == 'adopt':
+            self.stats_panel.show_notification(f"Tiger #{result + 1} joined the herd! 🐯", True)
+            
     def closeEvent(self, event):
-        self.game_manager.save_game()
-        event.accept()
\ No newline at end of file
+        if self.simulation is not None:
+            self.simulation.stop()
+        # Closed before the save was even read: don't overwrite it with defaults
+        if self._load_future is not None:
+            self._load_future.result()
+            self.game_manager.save_game()
+        self.analytics.end_session()
+        self.sampler.stop()
+        event.accept()
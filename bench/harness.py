@@ -0,0 +1,133 @@
+"""
+Benchmark timing and baseline comparison
+Each case is timed in rounds of an auto-calibrated number of calls (like
+timeit's autorange). The fastest round is what gets compared: noise from
+other processes only ever adds time, so the minimum is the most repeatable
+figure, and suspected regressions are re-timed before the gate fails.
+"""
+import json
+import platform
+import statistics
+import sys
+import time
+
+DEFAULT_THRESHOLD = 0.5  # fail when the fastest round is more than 50% slower than baseline
+DEFAULT_RETRIES = 2      # re-time a suspected regression this many times before failing
+
+
+class Case:
+    """A named benchmark: setup(param) returns the zero-argument call to time"""
+
+    def __init__(self, name, setup, params=(None,), quick_params=None):
+        self.name = name
+        self.setup = setup
+        self.params = tuple(params)
+        self.quick_params = tuple(quick_params) if quick_params is not None else self.params
+
+    def key(self, param):
+        return self.name if param is None else f"{self.name}[{param}]"
+
+
+def _time_calls(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def measure(func, min_time=0.2, rounds=5):
+    """Per-call timing: calibrate so a round lasts min_time/rounds, then repeat"""
+    target = min_time / rounds
+    number = 1
+    while True:
+        elapsed = _time_calls(func, number)
+        if elapsed >= target:
+            break
+        # Jump close to the target instead of doubling from 1 every time
+        number = max(number * 2, int(number * target / max(elapsed, 1e-9) * 1.1))
+    samples = [elapsed / number] + [_time_calls(func, number) / number for _ in range(rounds - 1)]
+    return {
+        'median_s': statistics.median(samples),
+        'min_s': min(samples),
+        'max_s': max(samples),
+        'number': number,
+        'rounds': rounds,
+    }
+
+
+def run_cases(cases, quick=False, min_time=0.2, rounds=5, select=None, out=None):
+    """Run every (case, param) whose key contains `select`; returns a result dict"""
+    results = {}
+    for case in cases:
+        for param in (case.quick_params if quick else case.params):
+            key = case.key(param)
+            if select and select not in key:
+                continue
+            result = measure(case.setup(param), min_time, rounds)
+            results[key] = result
+            if out is not None:
+                print(f"{key:<36} {format_time(result['median_s']):>10}  "
+                      f"(min {format_time(result['min_s'])}, {result['number']} x {rounds})", file=out)
+    return {'machine': machine_info(), 'results': results}
+
+
+def remeasure(cases, results, keys, min_time=0.2, rounds=5):
+    """Time `keys` again, keeping whichever run of each had the faster round"""
+    by_key = {case.key(param): (case, param) for case in cases
+              for param in case.params + case.quick_params}
+    for key in keys:
+        case, param = by_key[key]
+        result = measure(case.setup(param), min_time, rounds)
+        if result['min_s'] < results['results'][key]['min_s']:
+            results['results'][key] = result
+
+
+def machine_info():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+    }
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Rows (key, baseline_s, current_s, ratio, regressed) for keys in both runs"""
+    rows = []
+    base = baseline.get('results', {})
+    for key, result in current.get('results', {}).items():
+        if key not in base:
+            continue
+        old = base[key]['min_s']
+        new = result['min_s']
+        ratio = new / old if old > 0 else float('inf')
+        rows.append((key, old, new, ratio, ratio > 1.0 + threshold))
+    return rows
+
+
+def print_comparison(rows, threshold, out=None):
+    out = out or sys.stdout
+    print(f"\n{'benchmark':<36} {'baseline':>10} {'current':>10} {'change':>8}", file=out)
+    for key, old, new, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{key:<36} {format_time(old):>10} {format_time(new):>10} {(ratio - 1) * 100:+7.1f}%{flag}",
+              file=out)
+    failed = sum(1 for row in rows if row[4])
+    print(f"\n{failed} regression(s) beyond {threshold * 100:.0f}%", file=out)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_results(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
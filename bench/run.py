@@ -0,0 +1,215 @@
+"""
+Game logic benchmark suite
+Times pet, shop, save and analytics operations plus a full GameManager tick
+from 1 to 100k pets, writes JSON and compares against bench/baseline.json.
+
+Usage:
+    python -m bench.run                          # full run, compare to baseline
+    python -m bench.run --quick --select tick    # subset, smaller herds
+    python -m bench.run --json out.json --save-baseline
+"""
+import argparse
+import atexit
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from bench.harness import (Case, DEFAULT_RETRIES, DEFAULT_THRESHOLD, compare, load_results,
+                           print_comparison, remeasure, run_cases, save_results)
+from logic.analytic import GameAnalytics
+from logic.game_manager import GameManager
+from logic.leaderboard import Leaderboard
+from logic.shop import Shop
+from logic.tiger_pet import TigerPet
+from services.save_manager import SaveManager
+
+BASELINE = Path(__file__).with_name('baseline.json')
+HERD_SIZES = (1, 10, 100, 1000, 10000, 100000)
+BOARD_SIZES = (1000, 1000000)
+
+
+class NullSaveManager:
+    """Autosave target that keeps nothing, so ticks measure the simulation only"""
+
+    def save_game(self, data):
+        return True
+
+    def load_game(self):
+        return None
+
+
+def _scratch_dir():
+    path = tempfile.mkdtemp(prefix='macan-bench-')
+    # Saves and analytics go here rather than into ~/.macan_ternak
+    atexit.register(shutil.rmtree, path, True)
+    return Path(path)
+
+
+def exp_for_levels(levels):
+    """Total exp that takes a fresh pet up `levels` levels"""
+    return sum(math.floor(100 * (1.2 ** (level - 1))) for level in range(1, levels + 1))
+
+
+def bench_pet_update(_):
+    pet = TigerPet()
+
+    def step():
+        pet.hunger = pet.energy = pet.mood = pet.cleanliness = 100.0
+        pet.update(1.0)
+    return step
+
+
+def bench_add_exp(levels):
+    amount = exp_for_levels(levels)
+
+    def gain():
+        TigerPet().add_exp(amount)
+    return gain
+
+
+def bench_buy_item(_):
+    shop = Shop()
+    item = shop.items[0]
+    pet = TigerPet()
+
+    def buy():
+        pet.coins = item.price
+        pet.hunger = 0.0
+        shop.buy_item(item, pet)
+    return buy
+
+
+def bench_save_round_trip(pets):
+    save_manager = SaveManager(_scratch_dir() / 'savegame.json')
+    source = GameManager(save_manager)
+    for _ in range(pets - 1):
+        source.add_pet()
+    target = GameManager(save_manager)
+
+    def round_trip():
+        source.save_game()
+        target.load_game()
+    return round_trip
+
+
+def _scratch_analytics():
+    analytics = GameAnalytics()
+    analytics.stats_file = _scratch_dir() / 'analytics.json'
+    analytics.stats = analytics._load_stats()
+    return analytics
+
+
+def bench_analytics_log(_):
+    analytics = _scratch_analytics()
+    actions = ('feed', 'clean', 'sleep', 'play')
+
+    def log():
+        for action in actions:
+            analytics.log_action(action)
+        analytics.update_max_level(3)
+    return log
+
+
+def bench_analytics_session(_):
+    analytics = _scratch_analytics()
+
+    def session():
+        analytics.start_session()
+        analytics.end_session()
+        del analytics.stats['sessions'][:]  # keep the file size constant
+    return session
+
+
+def bench_manager_tick(pets):
+    manager = GameManager(NullSaveManager())
+    manager.pets = [TigerPet() for _ in range(pets)]
+
+    def tick():
+        manager.last_update_time -= 1.0  # one simulated second per tick
+        manager.update()
+    return tick
+
+
+def _board(entries):
+    rng = random.Random(entries)
+    return Leaderboard({entry: rng.randrange(entries * 10) for entry in range(entries)}), rng
+
+
+def bench_leaderboard_update(entries):
+    board, rng = _board(entries)
+
+    def update():
+        board.set(rng.randrange(entries), rng.randrange(entries * 10))
+    return update
+
+
+def bench_leaderboard_query(entries):
+    board, rng = _board(entries)
+
+    def query():
+        board.top(10)
+        board.around(board.at(rng.randrange(1, entries + 1))[0], 5)
+    return query
+
+
+CASES = [
+    Case('pet.update', bench_pet_update),
+    Case('pet.add_exp', bench_add_exp, params=(1, 10, 50)),
+    Case('shop.buy_item', bench_buy_item),
+    Case('save.round_trip', bench_save_round_trip, params=(1, 100), quick_params=(1,)),
+    Case('analytics.log_action', bench_analytics_log),
+    Case('analytics.end_session', bench_analytics_session),
+    Case('manager.tick', bench_manager_tick, params=HERD_SIZES, quick_params=HERD_SIZES[:4]),
+    Case('leaderboard.update', bench_leaderboard_update, params=BOARD_SIZES, quick_params=BOARD_SIZES[:1]),
+    Case('leaderboard.query', bench_leaderboard_query, params=BOARD_SIZES, quick_params=BOARD_SIZES[:1]),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Game logic benchmarks with a regression gate")
+    parser.add_argument('--quick', action='store_true', help="skip the largest sizes")
+    parser.add_argument('--select', help="only run benchmarks whose name contains this")
+    parser.add_argument('--min-time', type=float, default=0.2, help="seconds of timing per benchmark")
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--json', help="write results to this JSON file")
+    parser.add_argument('--baseline', default=str(BASELINE), help="baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before failing (0.5 = 50%%)")
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help="re-time suspected regressions this many times before failing")
+    parser.add_argument('--save-baseline', action='store_true', help="overwrite the baseline with this run")
+    args = parser.parse_args(argv)
+
+    results = run_cases(CASES, quick=args.quick, min_time=args.min_time, rounds=args.rounds,
+                        select=args.select, out=sys.stdout)
+
+    status = 0
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+    elif not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+    else:
+        baseline = load_results(args.baseline)
+        rows = compare(results, baseline, args.threshold)
+        for _ in range(args.retries):
+            suspects = [row[0] for row in rows if row[4]]
+            if not suspects:
+                break
+            print(f"\nRe-timing {len(suspects)} suspected regression(s): {', '.join(suspects)}")
+            remeasure(CASES, results, suspects, args.min_time, args.rounds)
+            rows = compare(results, baseline, args.threshold)
+        print_comparison(rows, args.threshold)
+        status = 1 if any(row[4] for row in rows) else 0
+    # Written last so confirmed re-timings are what gets saved
+    if args.json:
+        save_results(results, args.json)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
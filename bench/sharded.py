@@ -0,0 +1,73 @@
+"""
+Scaling benchmark for the sharded simulation
+Ticks the same herd with increasing worker counts and reports pet updates
+per second and the speedup over one worker, next to the object-per-pet
+TigerPet loop for reference.
+
+Usage:
+    python -m bench.sharded --pets 1000000 --workers 1,2,4,8 --ticks 50
+"""
+import argparse
+import json
+import sys
+import time
+
+from bench.harness import format_time, machine_info
+from logic.sharded import ShardedSimulation
+from logic.tiger_pet import TigerPet
+
+
+def time_ticks(simulation, ticks):
+    simulation.tick(1.0)  # workers are up and pages are touched
+    start = time.perf_counter()
+    for _ in range(ticks):
+        simulation.tick(1.0)
+    return (time.perf_counter() - start) / ticks
+
+
+def time_objects(pets, ticks):
+    herd = [TigerPet() for _ in range(pets)]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for pet in herd:
+            pet.update(1.0)
+    return (time.perf_counter() - start) / ticks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sharded simulation scaling benchmark")
+    parser.add_argument('--pets', type=int, default=1_000_000)
+    parser.add_argument('--workers', default='0,1,2,4', help="comma-separated worker counts (0 = in-process)")
+    parser.add_argument('--ticks', type=int, default=20)
+    parser.add_argument('--reference', type=int, default=100_000,
+                        help="pets for the TigerPet loop reference (0 to skip)")
+    parser.add_argument('--json', help="write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = {'machine': machine_info(), 'pets': args.pets, 'runs': []}
+    if args.reference:
+        per_tick = time_objects(args.reference, max(1, args.ticks // 10))
+        results['reference'] = {'pets': args.reference, 'tick_s': per_tick,
+                                'pets_per_s': args.reference / per_tick}
+        print(f"TigerPet loop   {args.reference:>9} pets  {format_time(per_tick):>10}/tick  "
+              f"{args.reference / per_tick:>14,.0f} pets/s")
+
+    single = None
+    for workers in (int(w) for w in args.workers.split(',')):
+        with ShardedSimulation(args.pets, workers=workers) as simulation:
+            per_tick = time_ticks(simulation, args.ticks)
+        if workers == 1:
+            single = per_tick
+        speedup = f"{single / per_tick:5.2f}x" if single else ''
+        results['runs'].append({'workers': workers, 'tick_s': per_tick, 'pets_per_s': args.pets / per_tick})
+        print(f"{workers:>2} worker(s)    {args.pets:>9} pets  {format_time(per_tick):>10}/tick  "
+              f"{args.pets / per_tick:>14,.0f} pets/s  {speedup}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
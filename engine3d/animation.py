@@ -0,0 +1,227 @@
+"""
+Keyframe animation baked into pose tables
+Clips are authored as per-channel keyframes, baked once at BAKE_RATE into
+a (clip, frame, channel) table and sampled with linear interpolation.
+Many pets are evaluated with one vectorised table lookup.
+"""
+import numpy as np
+
+BAKE_RATE = 60.0  # samples per second
+
+# Order of values in a baked pose
+CHANNELS = ('body_scale', 'body_height', 'head_pitch', 'tail_angle', 'spin_speed')
+CHANNEL_DEFAULTS = {
+    'body_scale': 1.0,
+    'body_height': 0.0,
+    'head_pitch': 0.0,
+    'tail_angle': 20.0,
+    'spin_speed': 30.0,   # degrees per second of turntable rotation
+}
+
+# Each channel is a list of (time, value) keys. A channel shorter than the
+# clip repeats with its own period, so breathing can loop inside a long clip.
+CLIPS = {
+    'idle': {
+        'duration': 4.0,
+        'loop': True,
+        'channels': {
+            'body_scale': [(0.0, 1.0), (0.5, 1.05), (1.5, 0.95), (2.0, 1.0)],
+            'tail_angle': [(0.0, 20.0), (1.0, 30.0), (2.0, 20.0), (3.0, 10.0), (4.0, 20.0)],
+        },
+    },
+    'eat': {
+        'duration': 2.0,
+        'loop': False,
+        'channels': {
+            'head_pitch': [(0.0, 0.0), (0.25, -30.0), (0.5, 0.0)],
+            'tail_angle': [(0.0, 20.0), (0.15, 40.0), (0.3, 20.0)],
+            'spin_speed': [(0.0, 0.0)],
+        },
+    },
+    'sleep': {
+        'duration': 6.0,
+        'loop': True,
+        'channels': {
+            'body_height': [(0.0, -0.25)],
+            'body_scale': [(0.0, 0.98), (1.5, 1.02), (3.0, 0.98)],
+            'head_pitch': [(0.0, -20.0)],
+            'tail_angle': [(0.0, 5.0)],
+            'spin_speed': [(0.0, 0.0)],
+        },
+    },
+    'play': {
+        'duration': 2.4,
+        'loop': False,
+        'channels': {
+            'body_height': [(0.0, 0.0), (0.3, 0.5), (0.6, 0.0), (0.9, 0.5), (1.2, 0.0)],
+            'body_scale': [(0.0, 1.0), (0.3, 1.08), (0.6, 0.95), (0.9, 1.08), (1.2, 1.0)],
+            'tail_angle': [(0.0, 20.0), (0.1, 50.0), (0.2, 0.0), (0.3, 20.0)],
+            'spin_speed': [(0.0, 180.0), (2.0, 180.0), (2.4, 30.0)],
+        },
+    },
+}
+
+# PetState value -> looping clip; actions override it for one clip length
+STATE_CLIPS = {
+    'happy': 'idle',
+    'neutral': 'idle',
+    'hungry': 'idle',
+    'dirty': 'idle',
+    'sad': 'idle',
+    'tired': 'sleep',
+}
+ACTION_CLIPS = {
+    'feed': 'eat',
+    'clean': 'play',
+    'sleep': 'sleep',
+    'play': 'play',
+}
+
+
+def state_clip(state_value):
+    """Looping clip for a PetState value"""
+    return STATE_CLIPS.get(state_value, 'idle')
+
+
+def _bake_channel(keys, times):
+    key_times = np.array([k[0] for k in keys], dtype=np.float64)
+    key_values = np.array([k[1] for k in keys], dtype=np.float64)
+    if len(keys) == 1:
+        return np.full(len(times), key_values[0])
+    period = key_times[-1]
+    local = np.mod(times, period) if period > 0 else times
+    return np.interp(local, key_times, key_values)
+
+
+class PoseTable:
+    """All clips baked into one float32 array of shape (clips, frames, channels)"""
+
+    def __init__(self, clips=CLIPS, rate=BAKE_RATE):
+        self.rate = rate
+        self.clip_names = list(clips)
+        self.clip_index = {name: i for i, name in enumerate(self.clip_names)}
+        self.durations = np.array([clips[name]['duration'] for name in self.clip_names])
+        self.looping = np.array([clips[name]['loop'] for name in self.clip_names])
+        # Looping clips bake one extra frame equal to frame 0 so lerp wraps cleanly
+        self.frame_counts = np.array([int(round(d * rate)) + 1 for d in self.durations])
+
+        max_frames = int(self.frame_counts.max())
+        self.table = np.zeros((len(self.clip_names), max_frames, len(CHANNELS)), dtype=np.float32)
+        for ci, name in enumerate(self.clip_names):
+            clip = clips[name]
+            count = self.frame_counts[ci]
+            times = np.arange(count) / rate
+            for chi, channel in enumerate(CHANNELS):
+                keys = clip['channels'].get(channel)
+                if keys is None:
+                    self.table[ci, :, chi] = CHANNEL_DEFAULTS[channel]
+                    continue
+                values = _bake_channel(keys, times)
+                self.table[ci, :count, chi] = values
+                self.table[ci, count:, chi] = values[-1]
+
+    def sample_many(self, clip_ids, times):
+        """Poses for arrays of clip ids and clip-local times -> (n, channels)"""
+        clip_ids = np.asarray(clip_ids, dtype=np.intp)
+        times = np.asarray(times, dtype=np.float64)
+        durations = self.durations[clip_ids]
+        local = np.where(self.looping[clip_ids], np.mod(times, durations), np.clip(times, 0.0, durations))
+        position = local * self.rate
+        last = self.frame_counts[clip_ids] - 1
+        i0 = np.minimum(position.astype(np.intp), last)
+        i1 = np.minimum(i0 + 1, last)
+        frac = (position - i0)[:, None].astype(np.float32)
+        a = self.table[clip_ids, i0]
+        b = self.table[clip_ids, i1]
+        return a + (b - a) * frac
+
+    def sample(self, clip, time):
+        """Pose dict for one clip name at clip-local time"""
+        values = self.sample_many([self.clip_index[clip]], [time])[0]
+        return dict(zip(CHANNELS, (float(v) for v in values)))
+
+
+class AnimationController:
+    """Chooses a clip from PetState and recent actions, and tracks its clock"""
+
+    def __init__(self, table=None):
+        self.table = table or PoseTable()
+        self.state_clip = 'idle'
+        self.action_clip = None
+        self.clip_time = 0.0
+        self.rotation = 0.0
+
+    @property
+    def current_clip(self):
+        return self.action_clip or self.state_clip
+
+    def set_state(self, state_value):
+        clip = state_clip(state_value)
+        if clip != self.state_clip:
+            self.state_clip = clip
+            if self.action_clip is None:
+                self.clip_time = 0.0
+
+    def trigger(self, action):
+        """Play the clip for an action once, then fall back to the state clip"""
+        clip = ACTION_CLIPS.get(action)
+        if clip is not None:
+            self.action_clip = clip
+            self.clip_time = 0.0
+
+    def update(self, dt):
+        """Advance the clock and return the current pose dict"""
+        self.clip_time += dt
+        if self.action_clip is not None:
+            duration = self.table.durations[self.table.clip_index[self.action_clip]]
+            if self.clip_time >= duration:
+                self.action_clip = None
+                self.clip_time = 0.0
+        pose = self.table.sample(self.current_clip, self.clip_time)
+        self.rotation = (self.rotation + pose['spin_speed'] * dt) % 360.0
+        pose['rotation'] = self.rotation
+        return pose
+
+
+class HerdAnimator:
+    """Batched animation for many pets sharing one pose table"""
+
+    def __init__(self, count, table=None, seed=0):
+        self.table = table or PoseTable()
+        rng = np.random.default_rng(seed)
+        idle = self.table.clip_index['idle']
+        self.clip_ids = np.full(count, idle, dtype=np.intp)
+        # Looping clip each pet returns to after an action clip
+        self.state_clip_ids = self.clip_ids.copy()
+        # Random phases so a herd doesn't breathe in lockstep
+        self.times = rng.uniform(0.0, self.table.durations[idle], count)
+        self.rotations = rng.uniform(0.0, 360.0, count)
+
+    def set_clip(self, indices, clip):
+        self.clip_ids[indices] = self.table.clip_index[clip]
+        self.times[indices] = 0.0
+
+    def set_states(self, state_values):
+        """Follow each pet's PetState value; pets mid-action switch when it ends"""
+        clip_index = self.table.clip_index
+        ids = np.fromiter((clip_index[state_clip(value)] for value in state_values),
+                          np.intp, len(self.clip_ids))
+        changed = np.flatnonzero(ids != self.state_clip_ids)
+        if not changed.size:
+            return changed
+        on_state_clip = changed[self.clip_ids[changed] == self.state_clip_ids[changed]]
+        self.state_clip_ids[changed] = ids[changed]
+        for clip_id in np.unique(ids[on_state_clip]):
+            self.set_clip(on_state_clip[ids[on_state_clip] == clip_id], self.table.clip_names[clip_id])
+        return changed
+
+    def update(self, dt):
+        """Advance every pet and return an (n, channels) pose array"""
+        self.times += dt
+        finished = ~self.table.looping[self.clip_ids] & (self.times >= self.table.durations[self.clip_ids])
+        if finished.any():
+            self.clip_ids[finished] = self.state_clip_ids[finished]
+            self.times[finished] = 0.0
+        poses = self.table.sample_many(self.clip_ids, self.times)
+        self.rotations = (self.rotations + poses[:, CHANNELS.index('spin_speed')] * dt) % 360.0
+        return poses
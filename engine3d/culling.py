@@ -0,0 +1,163 @@
+"""
+View-frustum culling and a uniform spatial grid for herd scenes
+The grid buckets objects by ground-plane (x, z) cell so frustum and
+proximity queries only look at cells near the query, not every pet.
+"""
+import math
+
+from engine3d import transforms
+
+OUTSIDE, INTERSECT, INSIDE = 0, 1, 2
+
+
+class Frustum:
+    """Six planes (a, b, c, d) with inside meaning a*x + b*y + c*z + d >= 0"""
+
+    def __init__(self, clip_matrix):
+        m = clip_matrix
+        row = [(m[i], m[4 + i], m[8 + i], m[12 + i]) for i in range(4)]
+        planes = []
+        for axis in range(3):
+            for sign in (1, -1):
+                planes.append(tuple(row[3][k] + sign * row[axis][k] for k in range(4)))
+        self.planes = []
+        for a, b, c, d in planes:
+            length = math.sqrt(a * a + b * b + c * c) or 1.0
+            self.planes.append((a / length, b / length, c / length, d / length))
+        self._inverse = transforms.invert(clip_matrix)
+
+    @classmethod
+    def from_matrices(cls, projection, view):
+        return cls(transforms.multiply(projection, view))
+
+    def corners(self):
+        """World-space corners of the near and far planes"""
+        if self._inverse is None:
+            return []
+        return [transforms.transform_homogeneous(self._inverse, (x, y, z))
+                for z in (-1, 1) for y in (-1, 1) for x in (-1, 1)]
+
+    def intersects_sphere(self, center, radius):
+        x, y, z = center
+        for a, b, c, d in self.planes:
+            if a * x + b * y + c * z + d < -radius:
+                return False
+        return True
+
+    def classify_aabb(self, bounds_min, bounds_max):
+        """OUTSIDE, INTERSECT or INSIDE for an axis-aligned box"""
+        result = INSIDE
+        for a, b, c, d in self.planes:
+            # Corner furthest along the plane normal, and the opposite one
+            px = bounds_max[0] if a >= 0 else bounds_min[0]
+            py = bounds_max[1] if b >= 0 else bounds_min[1]
+            pz = bounds_max[2] if c >= 0 else bounds_min[2]
+            if a * px + b * py + c * pz + d < 0:
+                return OUTSIDE
+            nx = bounds_min[0] if a >= 0 else bounds_max[0]
+            ny = bounds_min[1] if b >= 0 else bounds_max[1]
+            nz = bounds_min[2] if c >= 0 else bounds_max[2]
+            if a * nx + b * ny + c * nz + d < 0:
+                result = INTERSECT
+        return result
+
+
+class SpatialGrid:
+    """Uniform grid over the ground plane holding bounding spheres"""
+
+    def __init__(self, cell_size=4.0):
+        self.cell_size = cell_size
+        self.cells = {}      # (ix, iz) -> {obj_id: (center, radius)}
+        self.objects = {}    # obj_id -> (cell key, center, radius)
+        self.max_radius = 0.0
+        self.y_min = 0.0
+        self.y_max = 0.0
+
+    def __len__(self):
+        return len(self.objects)
+
+    def _key(self, x, z):
+        return (math.floor(x / self.cell_size), math.floor(z / self.cell_size))
+
+    def insert(self, obj_id, center, radius):
+        if obj_id in self.objects:
+            self.remove(obj_id)
+        key = self._key(center[0], center[2])
+        self.cells.setdefault(key, {})[obj_id] = (center, radius)
+        self.objects[obj_id] = (key, center, radius)
+        if len(self.objects) == 1:
+            self.y_min, self.y_max = center[1] - radius, center[1] + radius
+        else:
+            self.y_min = min(self.y_min, center[1] - radius)
+            self.y_max = max(self.y_max, center[1] + radius)
+        self.max_radius = max(self.max_radius, radius)
+
+    def remove(self, obj_id):
+        key, _, _ = self.objects.pop(obj_id)
+        cell = self.cells[key]
+        del cell[obj_id]
+        if not cell:
+            del self.cells[key]
+
+    def move(self, obj_id, center):
+        key, _, radius = self.objects[obj_id]
+        new_key = self._key(center[0], center[2])
+        if new_key == key:
+            self.cells[key][obj_id] = (center, radius)
+            self.objects[obj_id] = (key, center, radius)
+        else:
+            self.insert(obj_id, center, radius)
+
+    def clear(self):
+        self.cells.clear()
+        self.objects.clear()
+        self.max_radius = 0.0
+        self.y_min = self.y_max = 0.0
+
+    def cell_bounds(self, key):
+        """Cell box padded by the largest radius so straddling objects are covered"""
+        pad = self.max_radius
+        x0, z0 = key[0] * self.cell_size, key[1] * self.cell_size
+        return ((x0 - pad, self.y_min, z0 - pad),
+                (x0 + self.cell_size + pad, self.y_max, z0 + self.cell_size + pad))
+
+    def _cells_in_rect(self, x0, z0, x1, z1):
+        ix0, iz0 = self._key(x0 - self.max_radius, z0 - self.max_radius)
+        ix1, iz1 = self._key(x1 + self.max_radius, z1 + self.max_radius)
+        span = (ix1 - ix0 + 1) * (iz1 - iz0 + 1)
+        if span > len(self.cells):
+            return [key for key in self.cells if ix0 <= key[0] <= ix1 and iz0 <= key[1] <= iz1]
+        return [(ix, iz) for ix in range(ix0, ix1 + 1) for iz in range(iz0, iz1 + 1) if (ix, iz) in self.cells]
+
+    def query_frustum(self, frustum):
+        """Ids of objects whose bounding sphere touches the frustum"""
+        corners = frustum.corners()
+        if corners:
+            xs = [c[0] for c in corners]
+            zs = [c[2] for c in corners]
+            keys = self._cells_in_rect(min(xs), min(zs), max(xs), max(zs))
+        else:
+            keys = list(self.cells)
+
+        visible = []
+        for key in keys:
+            cell = self.cells[key]
+            state = frustum.classify_aabb(*self.cell_bounds(key))
+            if state == INSIDE:
+                visible.extend(cell)
+            elif state == INTERSECT:
+                for obj_id, (center, radius) in cell.items():
+                    if frustum.intersects_sphere(center, radius):
+                        visible.append(obj_id)
+        return visible
+
+    def query_radius(self, center, radius):
+        """Ids of objects whose bounding sphere is within `radius` of center"""
+        cx, cy, cz = center
+        result = []
+        for key in self._cells_in_rect(cx - radius, cz - radius, cx + radius, cz + radius):
+            for obj_id, ((x, y, z), r) in self.cells[key].items():
+                reach = radius + r
+                if (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 <= reach * reach:
+                    result.append(obj_id)
+        return result
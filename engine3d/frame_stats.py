@@ -0,0 +1,275 @@
+"""
+Frame-time instrumentation for the 3D viewport
+Collects CPU section timings, GPU timer queries and draw statistics
+"""
+import csv
+import ctypes
+import json
+import math
+import time
+from collections import deque
+from pathlib import Path
+from services.metrics import REGISTRY
+
+FRAME_SECONDS = REGISTRY.histogram('macan_frame_seconds', 'Viewport paintGL CPU time in seconds',
+                                   buckets=(0.002, 0.004, 0.008, 0.0167, 0.033, 0.05, 0.1, 0.25))
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+class GpuTimer:
+    """GL_TIME_ELAPSED queries kept in a small ring so results are read without stalling"""
+
+    RING_SIZE = 4
+
+    def __init__(self):
+        self.supported = False
+        self._queries = []
+        self._pending = deque()
+        self._free = deque()
+        self._active = None
+
+    def initialize(self):
+        """Create the query objects (needs a current GL context)"""
+        try:
+            from OpenGL import GL
+            if not self._context_supports_timer_queries(GL):
+                return False
+            self._queries = [int(q) for q in GL.glGenQueries(self.RING_SIZE)]
+            self._free = deque(self._queries)
+            self.supported = True
+        except Exception as e:
+            print(f"GPU timer queries unavailable: {e}")
+            self.supported = False
+        return self.supported
+
+    def _context_supports_timer_queries(self, GL):
+        version = GL.glGetString(GL.GL_VERSION) or b""
+        try:
+            major, minor = (int(v) for v in version.split(b" ")[0].split(b".")[:2])
+        except ValueError:
+            major, minor = 0, 0
+        if (major, minor) >= (3, 3):
+            return True
+        extensions = GL.glGetString(GL.GL_EXTENSIONS) or b""
+        return b"GL_ARB_timer_query" in extensions or b"GL_EXT_timer_query" in extensions
+
+    def begin(self, record):
+        """Start timing the frame described by record"""
+        if not self.supported or not self._free:
+            return
+        from OpenGL import GL
+        query = self._free.popleft()
+        GL.glBeginQuery(GL.GL_TIME_ELAPSED, query)
+        self._active = (query, record)
+
+    def end(self):
+        if self._active is None:
+            return
+        from OpenGL import GL
+        GL.glEndQuery(GL.GL_TIME_ELAPSED)
+        self._pending.append(self._active)
+        self._active = None
+
+    def collect(self):
+        """Read back finished queries into their frame records"""
+        if not self._pending:
+            return
+        from OpenGL import GL
+        while self._pending:
+            query, record = self._pending[0]
+            available = ctypes.c_int(0)
+            GL.glGetQueryObjectiv(query, GL.GL_QUERY_RESULT_AVAILABLE, ctypes.byref(available))
+            if not available.value:
+                break
+            elapsed_ns = ctypes.c_uint64(0)
+            GL.glGetQueryObjectui64v(query, GL.GL_QUERY_RESULT, ctypes.byref(elapsed_ns))
+            record['gpu_ms'] = elapsed_ns.value / 1e6
+            self._pending.popleft()
+            self._free.append(query)
+
+    def release(self):
+        if self._queries:
+            try:
+                from OpenGL import GL
+                GL.glDeleteQueries(len(self._queries), self._queries)
+            except Exception:
+                pass
+        self._queries = []
+        self._pending.clear()
+        self._free.clear()
+        self.supported = False
+
+
+class FrameStats:
+    """Rolling per-frame statistics for Viewport3D.paintGL()"""
+
+    SECTIONS = ('camera', 'ground', 'tiger')
+    FIELDS = ('frame', 'timestamp', 'frame_ms', 'cpu_ms', 'gpu_ms',
+              'camera_ms', 'ground_ms', 'tiger_ms', 'draw_calls', 'vertices',
+              'objects_drawn', 'objects_culled')
+
+    def __init__(self, history=3600, window=300):
+        self.history = deque(maxlen=history)
+        self.window = window
+        self.gpu = GpuTimer()
+        self.overlay_visible = False
+        self.trace_dir = Path.home() / '.macan_ternak' / 'traces'
+
+        self.frame_index = 0
+        self._current = None
+        self._frame_start = 0.0
+        self._last_frame_start = None
+        self._section = None
+        self._section_start = 0.0
+        self._summary = None
+
+    def begin_frame(self):
+        """Mark the start of a paintGL() call"""
+        self.gpu.collect()
+        now = time.perf_counter()
+        frame_ms = (now - self._last_frame_start) * 1000.0 if self._last_frame_start else 0.0
+        self._last_frame_start = now
+        self._frame_start = now
+
+        self._current = {
+            'frame': self.frame_index,
+            'timestamp': time.time(),
+            'frame_ms': frame_ms,
+            'cpu_ms': 0.0,
+            'gpu_ms': None,
+            'camera_ms': 0.0,
+            'ground_ms': 0.0,
+            'tiger_ms': 0.0,
+            'draw_calls': 0,
+            'vertices': 0,
+            'objects_drawn': 0,
+            'objects_culled': 0,
+        }
+        self.gpu.begin(self._current)
+
+    def begin_section(self, name):
+        self._section = name
+        self._section_start = time.perf_counter()
+
+    def end_section(self):
+        if self._current is None or self._section is None:
+            return
+        key = f"{self._section}_ms"
+        self._current[key] = self._current.get(key, 0.0) + (time.perf_counter() - self._section_start) * 1000.0
+        self._section = None
+
+    def add_draw(self, vertices, calls=1):
+        """Count a draw submission (glBegin/glEnd block or array draw)"""
+        if self._current is not None:
+            self._current['draw_calls'] += calls
+            self._current['vertices'] += vertices
+
+    def set_visibility(self, drawn, culled):
+        """Record how many scene objects survived frustum culling"""
+        if self._current is not None:
+            self._current['objects_drawn'] = drawn
+            self._current['objects_culled'] = culled
+
+    def end_frame(self):
+        """Mark the end of a paintGL() call"""
+        if self._current is None:
+            return
+        self.gpu.end()
+        self._current['cpu_ms'] = (time.perf_counter() - self._frame_start) * 1000.0
+        FRAME_SECONDS.observe(self._current['cpu_ms'] / 1000.0)
+        self.history.append(self._current)
+        self._current = None
+        self.frame_index += 1
+        # Overlay text only needs to refresh a few times per second
+        if self.frame_index % 15 == 0:
+            self._summary = None
+
+    def reset(self):
+        """Drop retained frames (e.g. after a warm-up)"""
+        self.history.clear()
+        self._last_frame_start = None
+        self._summary = None
+
+    def invalidate_summary(self):
+        self._summary = None
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        return self.overlay_visible
+
+    def summary(self):
+        """Rolling p50/p95/p99 over the last `window` frames"""
+        if self._summary is not None:
+            return self._summary
+
+        recent = list(self.history)[-self.window:]
+        frame_times = sorted(f['frame_ms'] for f in recent if f['frame_ms'] > 0)
+        cpu_times = sorted(f['cpu_ms'] for f in recent)
+        gpu_times = sorted(f['gpu_ms'] for f in recent if f['gpu_ms'] is not None)
+        last = recent[-1] if recent else {}
+
+        self._summary = {
+            'frames': len(recent),
+            'frame_p50': percentile(frame_times, 50),
+            'frame_p95': percentile(frame_times, 95),
+            'frame_p99': percentile(frame_times, 99),
+            'cpu_p50': percentile(cpu_times, 50),
+            'cpu_p95': percentile(cpu_times, 95),
+            'gpu_p50': percentile(gpu_times, 50) if gpu_times else None,
+            'gpu_p95': percentile(gpu_times, 95) if gpu_times else None,
+            'gpu_supported': self.gpu.supported,
+            'draw_calls': last.get('draw_calls', 0),
+            'vertices': last.get('vertices', 0),
+            'objects_drawn': last.get('objects_drawn', 0),
+            'objects_culled': last.get('objects_culled', 0),
+        }
+        for section in self.SECTIONS:
+            values = [f[f"{section}_ms"] for f in recent]
+            self._summary[f"{section}_avg"] = sum(values) / len(values) if values else 0.0
+        return self._summary
+
+    def overlay_lines(self):
+        """Text lines shown by the on-screen overlay"""
+        s = self.summary()
+        lines = [
+            f"frame p50 {s['frame_p50']:.2f}  p95 {s['frame_p95']:.2f}  p99 {s['frame_p99']:.2f} ms",
+            f"cpu   p50 {s['cpu_p50']:.2f}  p95 {s['cpu_p95']:.2f} ms",
+        ]
+        if s['gpu_p50'] is not None:
+            lines.append(f"gpu   p50 {s['gpu_p50']:.2f}  p95 {s['gpu_p95']:.2f} ms")
+        else:
+            lines.append("gpu   n/a")
+        lines.append("  ".join(f"{name} {s[name + '_avg']:.2f}" for name in self.SECTIONS) + " ms")
+        lines.append(f"draws {s['draw_calls']}  verts {s['vertices']}")
+        lines.append(f"objects drawn {s['objects_drawn']}  culled {s['objects_culled']}")
+        return lines
+
+    def export_trace(self, directory=None):
+        """Write the retained frames as CSV and JSON, returns both paths"""
+        directory = Path(directory) if directory else self.trace_dir
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            stamp = time.strftime('%Y%m%d-%H%M%S')
+            csv_path = directory / f"frame_trace_{stamp}.csv"
+            json_path = directory / f"frame_trace_{stamp}.json"
+            frames = list(self.history)
+
+            with open(csv_path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                writer.writeheader()
+                writer.writerows(frames)
+
+            self._summary = None
+            with open(json_path, 'w') as f:
+                json.dump({'summary': self.summary(), 'frames': frames}, f, indent=2)
+            return csv_path, json_path
+        except Exception as e:
+            print(f"Error exporting frame trace: {e}")
+            return None
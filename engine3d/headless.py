@@ -0,0 +1,207 @@
+"""
+Headless render benchmark for Viewport3D
+Drives the viewport's scene code into an offscreen FBO so rendering can be
+measured in CI without opening GameWindow.
+
+Usage:
+    python -m engine3d.headless --frames 300 --herd 1,10,100 --camera orbit
+    python -m engine3d.headless --software --dump-dir renders/ --dump-every 60
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+from engine3d.frame_stats import percentile
+from engine3d.tiger_model import HERD_SPACING, herd_layout
+from logic.simulation import world_snapshot
+
+def camera_at(path, t, herd_extent):
+    """Camera (distance, rotation_x, rotation_y) along a named path, t in [0, 1)"""
+    base = 5.0 + herd_extent
+    if path == 'orbit':
+        return base, 30.0, 360.0 * t
+    if path == 'zoom':
+        return base * (0.5 + 0.5 * math.cos(2 * math.pi * t)) + 2.0, 30.0, 45.0
+    if path == 'flyover':
+        return base, 10.0 + 70.0 * t, 45.0 + 90.0 * t
+    return base, 30.0, 45.0  # static
+
+
+class HeadlessRenderer:
+    """Offscreen GL context + FBO hosting a Viewport3D that is never shown"""
+
+    def __init__(self, width=1280, height=720):
+        from PySide6.QtGui import QOpenGLContext, QOffscreenSurface, QSurfaceFormat
+        from PySide6.QtOpenGL import QOpenGLFramebufferObject, QOpenGLFramebufferObjectFormat
+        from engine3d.viewport import Viewport3D
+        from logic.game_manager import GameManager
+
+        self.width = width
+        self.height = height
+
+        fmt = QSurfaceFormat()
+        fmt.setDepthBufferSize(24)
+        fmt.setVersion(2, 1)
+        fmt.setProfile(QSurfaceFormat.CompatibilityProfile)
+
+        self.context = QOpenGLContext()
+        self.context.setFormat(fmt)
+        if not self.context.create():
+            raise RuntimeError("Could not create an offscreen OpenGL context")
+
+        self.surface = QOffscreenSurface()
+        self.surface.setFormat(self.context.format())
+        self.surface.create()
+        if not self.context.makeCurrent(self.surface):
+            raise RuntimeError("Could not make the offscreen OpenGL context current")
+
+        fbo_format = QOpenGLFramebufferObjectFormat()
+        fbo_format.setAttachment(QOpenGLFramebufferObject.CombinedDepthStencil)
+        self.fbo = QOpenGLFramebufferObject(width, height, fbo_format)
+        self.fbo.bind()
+
+        # The save manager is never touched: the benchmark does not tick or save
+        self.game_manager = GameManager(None)
+        self.viewport = Viewport3D(self.game_manager)
+        self.viewport.anim_timer.stop()
+        self.viewport.initializeGL()
+        self.viewport.resizeGL(width, height)
+
+    def render_frame(self):
+        """Advance animation one step and render into the FBO, waiting for the GPU"""
+        from OpenGL.GL import glFinish
+        self.viewport._animate(1.0 / 60.0)
+        self.viewport.paintGL()
+        glFinish()
+
+    def grab(self):
+        return self.fbo.toImage()
+
+    def release(self):
+        self.viewport.frame_stats.gpu.release()
+        self.fbo.release()
+        self.context.doneCurrent()
+
+
+def run_benchmark(renderer, frames, herd_size, camera_path, dump_dir=None, dump_every=0):
+    """Render `frames` frames and return a result dict"""
+    viewport = renderer.viewport
+    viewport.herd_positions = herd_layout(herd_size)
+    viewport.update_scene(world_snapshot(renderer.game_manager))
+    herd_extent = math.sqrt(herd_size) * HERD_SPACING
+
+    # Warm-up frame so shader/driver setup is not counted
+    renderer.render_frame()
+    viewport.frame_stats.reset()
+
+    frame_times = []
+    start = time.perf_counter()
+    for i in range(frames):
+        distance, rot_x, rot_y = camera_at(camera_path, i / frames, herd_extent)
+        viewport.camera_distance = distance
+        viewport.camera_rotation_x = rot_x
+        viewport.camera_rotation_y = rot_y
+
+        frame_start = time.perf_counter()
+        renderer.render_frame()
+        frame_times.append((time.perf_counter() - frame_start) * 1000.0)
+
+        if dump_dir and dump_every and i % dump_every == 0:
+            path = os.path.join(dump_dir, f"herd{herd_size}_{camera_path}_{i:05d}.png")
+            renderer.grab().save(path)
+    elapsed = time.perf_counter() - start
+
+    frame_times.sort()
+    viewport.frame_stats.gpu.collect()
+    viewport.frame_stats.invalidate_summary()
+    summary = viewport.frame_stats.summary()
+    return {
+        'herd_size': herd_size,
+        'camera': camera_path,
+        'frames': frames,
+        'fps': frames / elapsed if elapsed > 0 else 0.0,
+        'frame_p50_ms': percentile(frame_times, 50),
+        'frame_p95_ms': percentile(frame_times, 95),
+        'frame_p99_ms': percentile(frame_times, 99),
+        'cpu_p50_ms': summary['cpu_p50'],
+        'gpu_p50_ms': summary['gpu_p50'],
+        'draw_calls': summary['draw_calls'],
+        'vertices': summary['vertices'],
+    }
+
+
+def format_result(result):
+    """One summary line of a run_benchmark result"""
+    gpu = f"{result['gpu_p50_ms']:.2f}" if result['gpu_p50_ms'] is not None else "n/a"
+    return (f"herd {result['herd_size']:>5}  {result['fps']:8.1f} fps  "
+            f"p50 {result['frame_p50_ms']:.2f} ms  p95 {result['frame_p95_ms']:.2f} ms  "
+            f"gpu {gpu} ms  draws {result['draw_calls']}  verts {result['vertices']}")
+
+
+def _size(text):
+    try:
+        width, height = (int(v) for v in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+    return width, height
+
+
+def _herd_sizes(text):
+    try:
+        return [int(v) for v in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma separated integers, got {text!r}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offscreen Viewport3D render benchmark")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--herd', type=_herd_sizes, default='1,10,100', help="comma separated herd sizes")
+    parser.add_argument('--camera', default='orbit', choices=['static', 'orbit', 'zoom', 'flyover'])
+    parser.add_argument('--size', type=_size, default='1280x720', help="render target WIDTHxHEIGHT")
+    parser.add_argument('--software', action='store_true', help="force Mesa software rasterization")
+    parser.add_argument('--dump-dir', help="write PNG frames here for visual regression")
+    parser.add_argument('--dump-every', type=int, default=0, help="dump every Nth frame")
+    parser.add_argument('--json', help="write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Must be set before QApplication is created
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    if args.software:
+        os.environ['LIBGL_ALWAYS_SOFTWARE'] = '1'
+        os.environ['QT_OPENGL'] = 'software'
+
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+
+    width, height = args.size
+    if args.dump_dir:
+        os.makedirs(args.dump_dir, exist_ok=True)
+    dump_every = args.dump_every or (args.frames if args.dump_dir else 0)
+
+    renderer = HeadlessRenderer(width, height)
+    results = []
+    try:
+        for herd_size in args.herd:
+            result = run_benchmark(renderer, args.frames, herd_size, args.camera,
+                                   args.dump_dir, dump_every)
+            results.append(result)
+            print(format_result(result))
+    finally:
+        renderer.release()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+Model loading pipeline: OBJ / glTF parsing, binary mesh cache, background loading
+Parsed meshes are written to ~/.macan_ternak/cache/meshes/<source hash>.mesh as
+interleaved float32 vertices (position, normal, uv) and uint32 indices, so a
+second launch maps the file instead of re-parsing text.
+"""
+import base64
+import hashlib
+import json
+import mmap
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+CACHE_MAGIC = b'MTMC'
+CACHE_VERSION = 1
+# magic, version, vertex count, index count, floats per vertex, then bounds min/max
+CACHE_HEADER = struct.Struct('<4sIIII6f')
+VERTEX_FLOATS = 8  # px py pz nx ny nz u v
+
+MODELS_DIR = Path(__file__).resolve().parent.parent / 'assets' / 'models'
+MODEL_EXTENSIONS = ('.glb', '.gltf', '.obj')
+
+
+class MeshData:
+    """Interleaved vertex/index arrays ready for VBO upload"""
+
+    kind = 'mesh'
+
+    def __init__(self, vertices, indices, source=None, from_cache=False, buffer=None, bounds=None):
+        self.vertices = vertices    # float32 (N, 8)
+        self.indices = indices      # uint32 (M,)
+        self.source = source
+        self.from_cache = from_cache
+        self.gl_buffers = None      # (vbo, ibo) once uploaded by the viewport
+        self._buffer = buffer       # keeps the mmap alive
+        if bounds is not None:
+            self.bounds_min, self.bounds_max = tuple(bounds[:3]), tuple(bounds[3:])
+        elif len(vertices):
+            self.bounds_min = tuple(float(v) for v in vertices[:, :3].min(axis=0))
+            self.bounds_max = tuple(float(v) for v in vertices[:, :3].max(axis=0))
+        else:
+            self.bounds_min = self.bounds_max = (0.0, 0.0, 0.0)
+
+    @property
+    def vertex_count(self):
+        return len(self.vertices)
+
+    @property
+    def index_count(self):
+        return len(self.indices)
+
+
+def _compute_normals(positions, indices):
+    """Smooth vertex normals from triangle faces"""
+    normals = np.zeros_like(positions)
+    tris = indices.reshape(-1, 3)
+    v0, v1, v2 = positions[tris[:, 0]], positions[tris[:, 1]], positions[tris[:, 2]]
+    face_normals = np.cross(v1 - v0, v2 - v0)
+    for corner in range(3):
+        np.add.at(normals, tris[:, corner], face_normals)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    lengths[lengths == 0] = 1.0
+    return normals / lengths
+
+
+def _interleave(positions, normals, uvs, indices):
+    count = len(positions)
+    vertices = np.zeros((count, VERTEX_FLOATS), dtype=np.float32)
+    vertices[:, 0:3] = positions
+    vertices[:, 3:6] = normals if normals is not None else _compute_normals(positions, indices)
+    if uvs is not None:
+        vertices[:, 6:8] = uvs
+    return vertices
+
+
+def parse_obj(path):
+    """Parse a Wavefront OBJ file into MeshData (polygons are fan-triangulated)"""
+    positions, texcoords, normals = [], [], []
+    vertex_lookup = {}
+    out_pos, out_uv, out_norm, indices = [], [], [], []
+    has_normals = False
+
+    def resolve(index, count):
+        index = int(index)
+        return index - 1 if index > 0 else count + index
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            tag = parts[0]
+            if tag == 'v':
+                positions.append((float(parts[1]), float(parts[2]), float(parts[3])))
+            elif tag == 'vt':
+                texcoords.append((float(parts[1]), float(parts[2]) if len(parts) > 2 else 0.0))
+            elif tag == 'vn':
+                normals.append((float(parts[1]), float(parts[2]), float(parts[3])))
+            elif tag == 'f':
+                face = []
+                for corner in parts[1:]:
+                    key = corner
+                    if key not in vertex_lookup:
+                        refs = corner.split('/')
+                        vi = resolve(refs[0], len(positions))
+                        ti = resolve(refs[1], len(texcoords)) if len(refs) > 1 and refs[1] else None
+                        ni = resolve(refs[2], len(normals)) if len(refs) > 2 and refs[2] else None
+                        vertex_lookup[key] = len(out_pos)
+                        out_pos.append(positions[vi])
+                        out_uv.append(texcoords[ti] if ti is not None else (0.0, 0.0))
+                        out_norm.append(normals[ni] if ni is not None else (0.0, 0.0, 0.0))
+                        has_normals = has_normals or ni is not None
+                    face.append(vertex_lookup[key])
+                for i in range(1, len(face) - 1):
+                    indices.extend((face[0], face[i], face[i + 1]))
+
+    index_array = np.asarray(indices, dtype=np.uint32)
+    position_array = np.asarray(out_pos, dtype=np.float32).reshape(-1, 3)
+    normal_array = np.asarray(out_norm, dtype=np.float32).reshape(-1, 3) if has_normals else None
+    uv_array = np.asarray(out_uv, dtype=np.float32).reshape(-1, 2)
+    return MeshData(_interleave(position_array, normal_array, uv_array, index_array), index_array, source=str(path))
+
+
+GLTF_COMPONENT_TYPES = {5121: np.uint8, 5123: np.uint16, 5125: np.uint32, 5126: np.float32}
+GLTF_TYPE_SIZES = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4}
+
+
+def _read_gltf_document(path):
+    """Return (json document, list of buffer bytes) for .gltf or .glb"""
+    path = Path(path)
+    raw = path.read_bytes()
+    embedded = None
+    if raw[:4] == b'glTF':
+        offset = 12
+        document = None
+        while offset < len(raw):
+            length, chunk_type = struct.unpack_from('<II', raw, offset)
+            chunk = raw[offset + 8:offset + 8 + length]
+            if chunk_type == 0x4E4F534A:    # JSON
+                document = json.loads(chunk.decode('utf-8'))
+            elif chunk_type == 0x004E4942:  # BIN
+                embedded = chunk
+            offset += 8 + length
+    else:
+        document = json.loads(raw.decode('utf-8'))
+
+    buffers = []
+    for buf in document.get('buffers', []):
+        uri = buf.get('uri')
+        if uri is None:
+            buffers.append(embedded)
+        elif uri.startswith('data:'):
+            buffers.append(base64.b64decode(uri.split(',', 1)[1]))
+        else:
+            buffers.append((path.parent / uri).read_bytes())
+    return document, buffers
+
+
+def _read_accessor(document, buffers, index):
+    accessor = document['accessors'][index]
+    view = document['bufferViews'][accessor['bufferView']]
+    dtype = np.dtype(GLTF_COMPONENT_TYPES[accessor['componentType']])
+    width = GLTF_TYPE_SIZES[accessor['type']]
+    count = accessor['count']
+    data = buffers[view['buffer']]
+    start = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+    stride = view.get('byteStride') or dtype.itemsize * width
+
+    if stride == dtype.itemsize * width:
+        array = np.frombuffer(data, dtype=dtype, count=count * width, offset=start)
+    else:
+        rows = np.frombuffer(data, dtype=np.uint8, count=stride * (count - 1) + dtype.itemsize * width,
+                             offset=start)
+        array = np.lib.stride_tricks.as_strided(rows, shape=(count, dtype.itemsize * width),
+                                                strides=(stride, 1)).copy().view(dtype)
+    return array.reshape(count, width) if width > 1 else array
+
+
+def parse_gltf(path):
+    """Parse every triangle primitive of a glTF 2.0 file into one MeshData
+
+    Node transforms are not applied; models are expected to be authored
+    at the origin, as the tiger placeholder is.
+    """
+    document, buffers = _read_gltf_document(path)
+    positions, normals, uvs, indices = [], [], [], []
+    base = 0
+    all_have_normals = True
+
+    for mesh in document.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            if primitive.get('mode', 4) != 4:
+                continue
+            attributes = primitive['attributes']
+            pos = _read_accessor(document, buffers, attributes['POSITION']).astype(np.float32)
+            positions.append(pos)
+            if 'NORMAL' in attributes:
+                normals.append(_read_accessor(document, buffers, attributes['NORMAL']).astype(np.float32))
+            else:
+                all_have_normals = False
+            if 'TEXCOORD_0' in attributes:
+                uvs.append(_read_accessor(document, buffers, attributes['TEXCOORD_0']).astype(np.float32))
+            else:
+                uvs.append(np.zeros((len(pos), 2), dtype=np.float32))
+            if 'indices' in primitive:
+                prim_indices = _read_accessor(document, buffers, primitive['indices']).astype(np.uint32)
+            else:
+                prim_indices = np.arange(len(pos), dtype=np.uint32)
+            indices.append(prim_indices + base)
+            base += len(pos)
+
+    if not positions:
+        raise ValueError(f"No triangle primitives in {path}")
+    index_array = np.concatenate(indices)
+    normal_array = np.concatenate(normals) if all_have_normals else None
+    vertices = _interleave(np.concatenate(positions), normal_array, np.concatenate(uvs), index_array)
+    return MeshData(vertices, index_array, source=str(path))
+
+
+def parse_model(path):
+    suffix = Path(path).suffix.lower()
+    if suffix == '.obj':
+        return parse_obj(path)
+    if suffix in ('.gltf', '.glb'):
+        return parse_gltf(path)
+    raise ValueError(f"Unsupported model format: {suffix}")
+
+
+class MeshCache:
+    """Binary mesh cache keyed by a hash of the source file"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.macan_ternak' / 'cache' / 'meshes'
+
+    def key_for(self, path):
+        digest = hashlib.sha1()
+        digest.update(f"v{CACHE_VERSION}:{Path(path).suffix.lower()}:".encode())
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def path_for(self, key):
+        return self.cache_dir / f"{key}.mesh"
+
+    def load(self, key, source=None):
+        """Map a cached mesh, or return None if missing/invalid"""
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, vertex_count, index_count, stride, *bounds = CACHE_HEADER.unpack_from(buffer, 0)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION or stride != VERTEX_FLOATS:
+                buffer.close()
+                return None
+            offset = CACHE_HEADER.size
+            vertices = np.frombuffer(buffer, dtype=np.float32, count=vertex_count * stride, offset=offset)
+            offset += vertices.nbytes
+            indices = np.frombuffer(buffer, dtype=np.uint32, count=index_count, offset=offset)
+            return MeshData(vertices.reshape(vertex_count, stride), indices,
+                            source=source, from_cache=True, buffer=buffer, bounds=bounds)
+        except Exception as e:
+            print(f"Error reading mesh cache {path}: {e}")
+            return None
+
+    def store(self, key, mesh):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.path_for(key)
+            tmp_path = path.with_suffix('.tmp')
+            header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, mesh.vertex_count, mesh.index_count,
+                                       VERTEX_FLOATS, *mesh.bounds_min, *mesh.bounds_max)
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                f.write(np.ascontiguousarray(mesh.vertices, dtype=np.float32).tobytes())
+                f.write(np.ascontiguousarray(mesh.indices, dtype=np.uint32).tobytes())
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"Error writing mesh cache: {e}")
+            return False
+
+
+def load_mesh(path, cache=None):
+    """Load a model through the binary cache, parsing and caching on a miss"""
+    cache = cache or MeshCache()
+    key = cache.key_for(path)
+    mesh = cache.load(key, source=str(path))
+    if mesh is None:
+        mesh = parse_model(path)
+        cache.store(key, mesh)
+    return mesh
+
+
+def find_model(name, models_dir=MODELS_DIR):
+    """Return the first assets/models/<name>.<ext> that exists"""
+    for ext in MODEL_EXTENSIONS:
+        path = Path(models_dir) / f"{name}{ext}"
+        if path.exists():
+            return path
+    return None
+
+
+class ModelHandle:
+    """Result slot for a background load; `mesh` is None until ready"""
+
+    def __init__(self, path):
+        self.path = path
+        self.mesh = None
+        self.error = None
+        self.future = None
+
+    @property
+    def ready(self):
+        return self.mesh is not None
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+
+class ModelLoader:
+    """Loads models on a worker thread; callers keep drawing a placeholder meanwhile"""
+
+    def __init__(self, cache=None, max_workers=1):
+        self.cache = cache or MeshCache()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='model-loader')
+        self._handles = {}
+
+    def request(self, path):
+        path = str(path)
+        handle = self._handles.get(path)
+        if handle is None:
+            handle = ModelHandle(path)
+            self._handles[path] = handle
+            handle.future = self._executor.submit(self._load, handle)
+        return handle
+
+    def _load(self, handle):
+        try:
+            handle.mesh = load_mesh(handle.path, self.cache)
+        except Exception as e:
+            handle.error = e
+            print(f"Error loading model {handle.path}: {e}")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,159 @@
+"""
+Ray-cast picking against a bounding-volume hierarchy of pet bounds
+The BVH is built once per herd change with numpy, then flattened into
+plain lists so a pick is a short Python traversal (well under 1 ms at 100k).
+"""
+import numpy as np
+
+from engine3d import transforms
+
+LEAF_SIZE = 4
+
+
+def unproject_ray(x, y, width, height, projection, view):
+    """World-space ray (origin, direction) through widget pixel (x, y)"""
+    inverse = transforms.invert(transforms.multiply(projection, view))
+    if inverse is None:
+        return None
+    ndc_x = 2.0 * x / width - 1.0
+    ndc_y = 1.0 - 2.0 * y / height
+    near = transforms.transform_homogeneous(inverse, (ndc_x, ndc_y, -1.0))
+    far = transforms.transform_homogeneous(inverse, (ndc_x, ndc_y, 1.0))
+    direction = (far[0] - near[0], far[1] - near[1], far[2] - near[2])
+    length = (direction[0] ** 2 + direction[1] ** 2 + direction[2] ** 2) ** 0.5 or 1.0
+    return near, (direction[0] / length, direction[1] / length, direction[2] / length)
+
+
+def _slab(origin, inv_dir, bmin, bmax, t_max):
+    """Entry distance of the ray into the box, or None if it misses before t_max"""
+    t0, t1 = 0.0, t_max
+    for axis in range(3):
+        near = (bmin[axis] - origin[axis]) * inv_dir[axis]
+        far = (bmax[axis] - origin[axis]) * inv_dir[axis]
+        if near > far:
+            near, far = far, near
+        if near > t0:
+            t0 = near
+        if far < t1:
+            t1 = far
+        if t0 > t1:
+            return None
+    return t0
+
+
+class BVH:
+    """Binary BVH over axis-aligned boxes (median split on the longest axis)"""
+
+    def __init__(self, bounds_min, bounds_max, ids=None):
+        bounds_min = np.asarray(bounds_min, dtype=np.float64).reshape(-1, 3)
+        bounds_max = np.asarray(bounds_max, dtype=np.float64).reshape(-1, 3)
+        count = len(bounds_min)
+        self.ids = list(range(count)) if ids is None else list(ids)
+
+        order = np.arange(count)
+        centers = (bounds_min + bounds_max) * 0.5
+        node_min, node_max, node_left, node_start, node_count = [], [], [], [], []
+
+        # Iterative build: each entry is (node index, start, end) into `order`
+        if count:
+            node_min.append(None)
+            node_max.append(None)
+            node_left.append(-1)
+            node_start.append(0)
+            node_count.append(0)
+        stack = [(0, 0, count)] if count else []
+        while stack:
+            node, start, end = stack.pop()
+            idx = order[start:end]
+            node_min[node] = bounds_min[idx].min(axis=0).tolist()
+            node_max[node] = bounds_max[idx].max(axis=0).tolist()
+            if end - start <= LEAF_SIZE:
+                node_start[node] = start
+                node_count[node] = end - start
+                continue
+
+            c = centers[idx]
+            axis = int(np.argmax(c.max(axis=0) - c.min(axis=0)))
+            mid = (end - start) // 2
+            part = np.argpartition(c[:, axis], mid)
+            order[start:end] = idx[part]
+
+            left = len(node_min)
+            for _ in range(2):
+                node_min.append(None)
+                node_max.append(None)
+                node_left.append(-1)
+                node_start.append(0)
+                node_count.append(0)
+            node_left[node] = left
+            stack.append((left, start, start + mid))
+            stack.append((left + 1, start + mid, end))
+
+        self.node_min = node_min
+        self.node_max = node_max
+        self.node_left = node_left
+        self.node_start = node_start
+        self.node_count = node_count
+        self.order = order.tolist()
+        self.prim_min = bounds_min.tolist()
+        self.prim_max = bounds_max.tolist()
+
+    def __len__(self):
+        return len(self.prim_min)
+
+    def intersect(self, origin, direction, t_max=float('inf')):
+        """(id, distance) of the nearest box hit by the ray, or None"""
+        if not self.node_min:
+            return None
+        inv_dir = tuple(1.0 / d if d != 0.0 else float('inf') for d in direction)
+        node_min, node_max, node_left = self.node_min, self.node_max, self.node_left
+        best_t, best = t_max, None
+
+        root_t = _slab(origin, inv_dir, node_min[0], node_max[0], best_t)
+        if root_t is None:
+            return None
+        stack = [(root_t, 0)]
+        while stack:
+            t_enter, node = stack.pop()
+            if t_enter > best_t:
+                continue
+            left = node_left[node]
+            if left < 0:
+                start = self.node_start[node]
+                for i in self.order[start:start + self.node_count[node]]:
+                    t = _slab(origin, inv_dir, self.prim_min[i], self.prim_max[i], best_t)
+                    if t is not None and t < best_t:
+                        best_t, best = t, i
+                continue
+            t_left = _slab(origin, inv_dir, node_min[left], node_max[left], best_t)
+            t_right = _slab(origin, inv_dir, node_min[left + 1], node_max[left + 1], best_t)
+            # Push the farther child first so the nearer one is explored first
+            if t_left is not None and t_right is not None:
+                if t_left < t_right:
+                    stack.append((t_right, left + 1))
+                    stack.append((t_left, left))
+                else:
+                    stack.append((t_left, left))
+                    stack.append((t_right, left + 1))
+            elif t_left is not None:
+                stack.append((t_left, left))
+            elif t_right is not None:
+                stack.append((t_right, left + 1))
+
+        if best is None:
+            return None
+        return self.ids[best], best_t
+
+
+def ground_boxes(positions, half_width, y_min, y_max):
+    """(min, max) arrays of upright boxes at (x, z) ground positions"""
+    xz = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    bounds_min = np.empty((len(xz), 3))
+    bounds_max = np.empty((len(xz), 3))
+    bounds_min[:, 0] = xz[:, 0] - half_width
+    bounds_max[:, 0] = xz[:, 0] + half_width
+    bounds_min[:, 1] = y_min
+    bounds_max[:, 1] = y_max
+    bounds_min[:, 2] = xz[:, 1] - half_width
+    bounds_max[:, 2] = xz[:, 1] + half_width
+    return bounds_min, bounds_max
@@ -0,0 +1,207 @@
+"""
+Scene graph with cached world transforms
+Nodes keep a local transform; world matrices are recomputed only for
+nodes whose own transform or an ancestor's transform changed.
+"""
+from engine3d import transforms
+
+
+class Material:
+    """Colour plus optional atlas region; draw lists are grouped by material key"""
+
+    def __init__(self, key, color, texture=None, texture_color=None):
+        self.key = key
+        self.color = list(color)
+        self.texture = texture
+        # Tint while the texture is bound (it modulates the texels); defaults to color
+        self.texture_color = list(texture_color) if texture_color is not None else None
+
+    def tint(self, textured):
+        """glColor to draw with, depending on whether the atlas region is bound"""
+        return self.texture_color if textured and self.texture_color is not None else self.color
+
+
+class CubeMesh:
+    kind = 'cube'
+
+    def __init__(self, width, height, depth):
+        self.size = (width, height, depth)
+
+
+class SphereMesh:
+    kind = 'sphere'
+
+    def __init__(self, radius):
+        self.radius = radius
+
+
+class SceneNode:
+    """A node with a local transform, optional mesh/material and children"""
+
+    def __init__(self, name, mesh=None, material=None,
+                 translation=(0.0, 0.0, 0.0), rotation=(0.0, 0.0, 1.0, 0.0), scale=(1.0, 1.0, 1.0)):
+        self.name = name
+        self.mesh = mesh
+        self.material = material
+        self._visible = True
+        self.parent = None
+        self.children = []
+        self.graph = None
+
+        self._translation = tuple(translation)
+        self._rotation = tuple(rotation)
+        self._scale = tuple(scale)
+        self._local = None
+        self._world = None
+        self._local_dirty = True
+        self._world_dirty = True
+
+    # --- Hierarchy ---
+
+    def add_child(self, node):
+        node.parent = self
+        self.children.append(node)
+        node._attach(self.graph)
+        node._mark_world_dirty()
+        if self.graph is not None:
+            self.graph.structure_changed()
+        return node
+
+    def _attach(self, graph):
+        self.graph = graph
+        for child in self.children:
+            child._attach(graph)
+
+    def walk(self):
+        """Depth-first iteration over this node and its descendants"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    @property
+    def visible(self):
+        return self._visible
+
+    @visible.setter
+    def visible(self, value):
+        if value != self._visible:
+            self._visible = value
+            if self.graph is not None:
+                self.graph.structure_changed()
+
+    # --- Transforms ---
+
+    @property
+    def translation(self):
+        return self._translation
+
+    @translation.setter
+    def translation(self, value):
+        value = tuple(value)
+        if value != self._translation:
+            self._translation = value
+            self._mark_local_dirty()
+
+    @property
+    def rotation(self):
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value):
+        value = tuple(value)
+        if value != self._rotation:
+            self._rotation = value
+            self._mark_local_dirty()
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        value = tuple(value)
+        if value != self._scale:
+            self._scale = value
+            self._mark_local_dirty()
+
+    def _mark_local_dirty(self):
+        self._local_dirty = True
+        self._mark_world_dirty()
+
+    def _mark_world_dirty(self):
+        # A node that is already dirty has dirty descendants too
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._world_dirty and node is not self:
+                continue
+            node._world_dirty = True
+            stack.extend(node.children)
+
+    def local_matrix(self):
+        if self._local_dirty:
+            self._local = transforms.compose(self._translation, self._rotation, self._scale)
+            self._local_dirty = False
+        return self._local
+
+    def world_matrix(self):
+        """Cached parent.world * local"""
+        if self._world_dirty:
+            local = self.local_matrix()
+            if self.parent is None:
+                self._world = local
+            else:
+                self._world = transforms.multiply(self.parent.world_matrix(), local)
+            self._world_dirty = False
+            if self.graph is not None:
+                self.graph.world_updates += 1
+        return self._world
+
+
+class SceneGraph:
+    """Root container producing a flattened, material-sorted draw list"""
+
+    def __init__(self):
+        self.root = SceneNode('root')
+        self.root._attach(self)
+        self.world_updates = 0
+        self._draw_list = None
+
+    def add(self, node):
+        return self.root.add_child(node)
+
+    def find(self, name):
+        for node in self.root.walk():
+            if node.name == name:
+                return node
+        return None
+
+    def structure_changed(self):
+        """Invalidate the draw list (nodes added, mesh/material/visibility changed)"""
+        self._draw_list = None
+
+    def draw_list(self):
+        """[(material, [nodes...]), ...] sorted by material key
+
+        Only the grouping is cached; world matrices are read from the nodes
+        at draw time so transform changes don't rebuild the list.
+        """
+        if self._draw_list is None:
+            groups = {}
+            for node in self._visible_nodes():
+                if node.mesh is not None:
+                    key = node.material.key if node.material else ''
+                    groups.setdefault(key, (node.material, []))[1].append(node)
+            self._draw_list = [groups[key] for key in sorted(groups)]
+        return self._draw_list
+
+    def _visible_nodes(self):
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not node.visible:
+                continue
+            yield node
+            stack.extend(reversed(node.children))
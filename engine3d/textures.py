@@ -0,0 +1,322 @@
+"""
+Texture subsystem: atlas packing, mipmaps, on-disk cache and an LRU budget
+Each pet skin is one atlas (stripes, eye, ground, plus any PNG overrides).
+Decoded, mipmapped atlases are stored zlib-compressed under
+~/.macan_ternak/cache/textures/ so startup never re-decodes PNGs.
+"""
+import hashlib
+import json
+import struct
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+TEXTURE_CACHE_VERSION = 1
+TEXTURES_DIR = Path(__file__).resolve().parent.parent / 'assets' / 'textures'
+ATLAS_GUTTER = 4  # pixels of edge padding so mip levels don't bleed between regions
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+# --- Procedural placeholder textures (RGBA uint8, row 0 is the bottom) ---
+
+def generate_stripes(size=128):
+    """White fur with dark diagonal tiger stripes; tinted by glColor at draw time"""
+    y, x = np.mgrid[0:size, 0:size]
+    wave = np.sin((x + y * 0.35) / size * np.pi * 6 + np.sin(y / size * np.pi * 2) * 1.5)
+    image = np.full((size, size, 4), 255, dtype=np.uint8)
+    dark = wave > 0.55
+    image[dark, :3] = 40
+    return image
+
+
+def generate_eye(size=32):
+    y, x = np.mgrid[0:size, 0:size]
+    r = np.hypot(x - size / 2 + 0.5, y - size / 2 + 0.5) / (size / 2)
+    image = np.zeros((size, size, 4), dtype=np.uint8)
+    image[..., 3] = 255
+    image[r < 0.9, :3] = (230, 190, 40)   # amber iris
+    image[r < 0.45, :3] = (10, 10, 10)    # pupil
+    image[(r > 0.15) & (r < 0.25) & (x > y), :3] = 250  # highlight
+    return image
+
+
+def generate_ground(size=128, seed=7):
+    rng = np.random.default_rng(seed)
+    noise = rng.integers(0, 40, size=(size, size), dtype=np.int16)
+    image = np.empty((size, size, 4), dtype=np.uint8)
+    image[..., 0] = np.clip(200 + noise - 20, 0, 255)
+    image[..., 1] = np.clip(225 + noise - 20, 0, 255)
+    image[..., 2] = np.clip(200 + noise - 20, 0, 255)
+    image[..., 3] = 255
+    return image
+
+
+PROCEDURAL_TEXTURES = {
+    'stripes': generate_stripes,
+    'eye': generate_eye,
+    'ground': generate_ground,
+}
+
+
+def decode_png(path):
+    """Decode an image file to RGBA uint8 with row 0 at the bottom (GL convention)"""
+    from PySide6.QtGui import QImage
+    image = QImage(str(path)).convertToFormat(QImage.Format_RGBA8888)
+    if image.isNull():
+        raise ValueError(f"Could not decode {path}")
+    w, h = image.width(), image.height()
+    rows = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.sizeInBytes())
+    rows = rows.reshape(h, image.bytesPerLine())[:, :w * 4].reshape(h, w, 4)
+    return np.flipud(rows).copy()
+
+
+# --- Atlas packing and mipmaps ---
+
+def _next_pow2(n):
+    return 1 << max(0, int(n - 1).bit_length())
+
+
+def pack_shelves(sizes, gutter=ATLAS_GUTTER):
+    """Shelf-pack {name: (w, h)} into a power-of-two square
+
+    Returns ({name: (x, y)}, atlas_size) where x, y is the top-left of the
+    region's interior (gutter excluded).
+    """
+    items = sorted(sizes.items(), key=lambda kv: (-kv[1][1], kv[0]))
+    total_area = sum((w + 2 * gutter) * (h + 2 * gutter) for _, (w, h) in items)
+    widest = max((w + 2 * gutter for _, (w, _h) in items), default=1)
+    atlas = _next_pow2(max(widest, int(total_area ** 0.5)))
+
+    while True:
+        positions = {}
+        x = y = shelf_height = 0
+        fits = True
+        for name, (w, h) in items:
+            cell_w, cell_h = w + 2 * gutter, h + 2 * gutter
+            if x + cell_w > atlas:
+                x, y = 0, y + shelf_height
+                shelf_height = 0
+            if y + cell_h > atlas:
+                fits = False
+                break
+            positions[name] = (x + gutter, y + gutter)
+            x += cell_w
+            shelf_height = max(shelf_height, cell_h)
+        if fits:
+            return positions, atlas
+        atlas *= 2
+
+
+def build_atlas(images, gutter=ATLAS_GUTTER):
+    """Pack RGBA images into one atlas; returns (atlas, {name: (u0, v0, u1, v1)})"""
+    positions, size = pack_shelves({name: (img.shape[1], img.shape[0]) for name, img in images.items()}, gutter)
+    atlas = np.zeros((size, size, 4), dtype=np.uint8)
+    regions = {}
+    for name, img in images.items():
+        x, y = positions[name]
+        h, w = img.shape[:2]
+        # Edge-replicate into the gutter so filtering at region borders stays in-region
+        padded = np.pad(img, ((gutter, gutter), (gutter, gutter), (0, 0)), mode='edge')
+        atlas[y - gutter:y + h + gutter, x - gutter:x + w + gutter] = padded
+        # Half-texel inset keeps bilinear samples inside the region
+        regions[name] = ((x + 0.5) / size, (y + 0.5) / size, (x + w - 0.5) / size, (y + h - 0.5) / size)
+    return atlas, regions
+
+
+def build_mip_chain(image):
+    """Box-filtered mip levels down to 1x1 (image must be square power of two)"""
+    levels = [image]
+    current = image.astype(np.uint16)
+    while current.shape[0] > 1:
+        current = (current[0::2, 0::2] + current[1::2, 0::2] + current[0::2, 1::2] + current[1::2, 1::2] + 2) // 4
+        levels.append(current.astype(np.uint8))
+    return levels
+
+
+class TextureAtlas:
+    """A mipmapped atlas plus its UV regions; uploaded to GL on first bind"""
+
+    def __init__(self, key, mips, regions, from_cache=False):
+        self.key = key
+        self.mips = mips
+        self.regions = regions
+        self.from_cache = from_cache
+        self.gl_id = None
+
+    @property
+    def size(self):
+        return self.mips[0].shape[0]
+
+    @property
+    def nbytes(self):
+        return sum(level.nbytes for level in self.mips)
+
+    def upload(self):
+        from OpenGL import GL
+        self.gl_id = int(GL.glGenTextures(1))
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self.gl_id)
+        GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
+        for level, data in enumerate(self.mips):
+            GL.glTexImage2D(GL.GL_TEXTURE_2D, level, GL.GL_RGBA, data.shape[1], data.shape[0], 0,
+                            GL.GL_RGBA, GL.GL_UNSIGNED_BYTE, np.ascontiguousarray(data))
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR_MIPMAP_LINEAR)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_LINEAR)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_S, GL.GL_CLAMP_TO_EDGE)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_T, GL.GL_CLAMP_TO_EDGE)
+
+    def bind(self):
+        from OpenGL import GL
+        if self.gl_id is None:
+            self.upload()
+        else:
+            GL.glBindTexture(GL.GL_TEXTURE_2D, self.gl_id)
+
+    def release(self):
+        """Free the GL texture (the CPU-side mips stay until the atlas is dropped)"""
+        if self.gl_id is not None:
+            try:
+                from OpenGL import GL
+                GL.glDeleteTextures([self.gl_id])
+            except Exception:
+                pass
+            self.gl_id = None
+
+
+class TextureDiskCache:
+    """Decoded atlases stored as zlib-compressed mip chains"""
+
+    MAGIC = b'MTTX'
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.macan_ternak' / 'cache' / 'textures'
+
+    def path_for(self, key):
+        return self.cache_dir / f"{key}.tex"
+
+    def load(self, key):
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+        try:
+            raw = path.read_bytes()
+            if raw[:4] != self.MAGIC:
+                return None
+            (header_len,) = struct.unpack_from('<I', raw, 4)
+            header = json.loads(raw[8:8 + header_len].decode('utf-8'))
+            if header.get('version') != TEXTURE_CACHE_VERSION:
+                return None
+            data = zlib.decompress(raw[8 + header_len:])
+            mips, offset = [], 0
+            for w, h in header['levels']:
+                count = w * h * 4
+                mips.append(np.frombuffer(data, dtype=np.uint8, count=count, offset=offset).reshape(h, w, 4))
+                offset += count
+            regions = {name: tuple(uv) for name, uv in header['regions'].items()}
+            return TextureAtlas(key, mips, regions, from_cache=True)
+        except Exception as e:
+            print(f"Error reading texture cache {path}: {e}")
+            return None
+
+    def store(self, atlas):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            header = json.dumps({
+                'version': TEXTURE_CACHE_VERSION,
+                'levels': [(level.shape[1], level.shape[0]) for level in atlas.mips],
+                'regions': atlas.regions,
+            }).encode('utf-8')
+            payload = zlib.compress(b''.join(np.ascontiguousarray(level).tobytes() for level in atlas.mips), 6)
+            path = self.path_for(atlas.key)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(self.MAGIC + struct.pack('<I', len(header)) + header + payload)
+            tmp_path.replace(path)
+            return True
+        except Exception as e:
+            print(f"Error writing texture cache: {e}")
+            return False
+
+
+def skin_sources(skin='default', textures_dir=TEXTURES_DIR):
+    """{texture name: PNG path or None for procedural}; skins may override any name"""
+    sources = {name: None for name in PROCEDURAL_TEXTURES}
+    for directory in (Path(textures_dir), Path(textures_dir) / skin):
+        if directory.is_dir():
+            for png in sorted(directory.glob('*.png')):
+                sources[png.stem] = png
+    return sources
+
+
+def skin_key(sources):
+    """Cache key from PNG bytes (hashed, never decoded) and generator names"""
+    digest = hashlib.sha1(f"atlas-v{TEXTURE_CACHE_VERSION}".encode())
+    for name in sorted(sources):
+        path = sources[name]
+        digest.update(name.encode())
+        if path is None:
+            digest.update(b'procedural')
+        else:
+            digest.update(hashlib.sha1(Path(path).read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def load_skin_atlas(skin='default', textures_dir=TEXTURES_DIR, cache=None):
+    """Load a skin's atlas from the disk cache, building and caching it on a miss"""
+    cache = cache or TextureDiskCache()
+    sources = skin_sources(skin, textures_dir)
+    key = skin_key(sources)
+    atlas = cache.load(key)
+    if atlas is not None:
+        return atlas
+
+    images = {}
+    for name, path in sources.items():
+        images[name] = PROCEDURAL_TEXTURES[name]() if path is None else decode_png(path)
+    image, regions = build_atlas(images)
+    atlas = TextureAtlas(key, build_mip_chain(image), regions)
+    cache.store(atlas)
+    return atlas
+
+
+class TextureManager:
+    """Keeps skin atlases within a byte budget, evicting least recently used"""
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES, loader=load_skin_atlas):
+        self.budget_bytes = budget_bytes
+        self.loader = loader
+        self._atlases = OrderedDict()
+        self.used_bytes = 0
+        self.evictions = 0
+
+    def get(self, skin='default'):
+        atlas = self._atlases.get(skin)
+        if atlas is not None:
+            self._atlases.move_to_end(skin)
+            return atlas
+
+        atlas = self.loader(skin)
+        self._atlases[skin] = atlas
+        self.used_bytes += atlas.nbytes
+        self._enforce_budget(keep=skin)
+        return atlas
+
+    def _enforce_budget(self, keep):
+        while self.used_bytes > self.budget_bytes and len(self._atlases) > 1:
+            skin, atlas = next(iter(self._atlases.items()))
+            if skin == keep:
+                break
+            del self._atlases[skin]
+            self.used_bytes -= atlas.nbytes
+            atlas.release()
+            self.evictions += 1
+
+    def loaded_skins(self):
+        return list(self._atlases)
+
+    def release_all(self):
+        for atlas in self._atlases.values():
+            atlas.release()
+        self._atlases.clear()
+        self.used_bytes = 0
@@ -0,0 +1,127 @@
+"""
+Pet thumbnails for the roster
+A thumbnail depends only on the pet's state and fur colour, so images are
+cached per (state, colour) signature: a roster of hundreds of pets needs a
+handful of offscreen renders, and a pet is redrawn only when it changes.
+"""
+from engine3d.animation import STATE_CLIPS
+from engine3d.tiger_model import tiger_color_for
+
+THUMBNAIL_SIZE = 64
+
+
+def thumbnail_signature(pet):
+    """Everything a thumbnail depends on, for a TigerPet or PetSnapshot"""
+    state = getattr(pet.state, 'value', pet.state)
+    return state, tiger_color_for(pet)
+
+
+class ThumbnailCache:
+    """Images by signature; misses are queued and rendered in small batches"""
+
+    def __init__(self, render):
+        self.render = render    # signature -> image
+        self.images = {}
+        self.pending = {}       # ordered set of signatures to render
+        self.renders = 0
+        self.appearance = None
+
+    def __len__(self):
+        return len(self.images)
+
+    def get(self, signature):
+        """Cached image, or None after queueing a render"""
+        image = self.images.get(signature)
+        if image is None:
+            self.pending[signature] = None
+        return image
+
+    def render_pending(self, budget=4):
+        """Render up to `budget` queued signatures; returns the ones rendered"""
+        done = []
+        while self.pending and len(done) < budget:
+            signature = next(iter(self.pending))
+            del self.pending[signature]
+            self.images[signature] = self.render(signature)
+            self.renders += 1
+            done.append(signature)
+        return done
+
+    def invalidate(self):
+        """Drop every image; rows re-request theirs when next painted"""
+        self.images.clear()
+        self.pending.clear()
+
+    def set_appearance(self, key):
+        """Invalidate when the shared look (skin, loaded mesh) changes"""
+        if key != self.appearance:
+            self.appearance = key
+            self.invalidate()
+            return True
+        return False
+
+
+class ThumbnailRenderer:
+    """Renders one posed tiger into a small FBO using the viewport's GL context"""
+
+    def __init__(self, viewport, size=THUMBNAIL_SIZE):
+        self.viewport = viewport
+        self.size = size
+        self._fbo = None
+
+    def __call__(self, signature):
+        from OpenGL.GL import (glViewport, glClearColor, glClear, glMatrixMode, glLoadMatrixf,
+                               glLoadIdentity, glEnable, glDisable, GL_COLOR_BUFFER_BIT,
+                               GL_DEPTH_BUFFER_BIT, GL_PROJECTION, GL_MODELVIEW, GL_TEXTURE,
+                               GL_TEXTURE_2D)
+        from PySide6.QtGui import QPixmap
+        from engine3d import transforms
+
+        state, color = signature
+        viewport = self.viewport
+        pose = viewport.pose_table.sample(STATE_CLIPS.get(state, 'idle'), 0.0)
+
+        viewport.makeCurrent()
+        try:
+            fbo = self._framebuffer()
+            fbo.bind()
+            glViewport(0, 0, self.size, self.size)
+            viewport._apply_gl_state()
+            glClearColor(0.0, 0.0, 0.0, 0.0)
+            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+            glMatrixMode(GL_PROJECTION)
+            glLoadMatrixf(transforms.perspective(40.0, 1.0, 0.1, 20.0))
+            glMatrixMode(GL_MODELVIEW)
+            glLoadMatrixf(transforms.look_at((2.2, 1.2, 2.8), (0.0, 0.0, 0.0), (0, 1, 0)))
+
+            if viewport._atlas is not None:
+                glEnable(GL_TEXTURE_2D)
+                viewport._atlas.bind()
+            viewport._draw_tiger(30.0, pose['body_scale'], pose['body_height'],
+                                 pose['head_pitch'], pose['tail_angle'], color=list(color))
+            glMatrixMode(GL_TEXTURE)
+            glLoadIdentity()
+            glMatrixMode(GL_MODELVIEW)
+            glDisable(GL_TEXTURE_2D)
+
+            image = fbo.toImage()
+            fbo.release()
+            # Leave the context as the next paintGL() expects it
+            glClearColor(0.2, 0.3, 0.4, 1.0)
+            viewport._apply_projection()
+        finally:
+            viewport.doneCurrent()
+        return QPixmap.fromImage(image)
+
+    def appearance(self):
+        """Key for what every thumbnail shares: skin and whether the mesh is in"""
+        viewport = self.viewport
+        return viewport.skin, 'model' in viewport.tiger_model.nodes
+
+    def _framebuffer(self):
+        if self._fbo is None:
+            from PySide6.QtOpenGL import QOpenGLFramebufferObject, QOpenGLFramebufferObjectFormat
+            fbo_format = QOpenGLFramebufferObjectFormat()
+            fbo_format.setAttachment(QOpenGLFramebufferObject.CombinedDepthStencil)
+            self._fbo = QOpenGLFramebufferObject(self.size, self.size, fbo_format)
+        return self._fbo
@@ -0,0 +1,105 @@
+"""
+Placeholder tiger built as a scene graph
+Part layout matches the original hand-written glPushMatrix chain.
+"""
+import math
+
+from engine3d import transforms
+from engine3d.scene_graph import SceneGraph, SceneNode, Material, CubeMesh, SphereMesh
+
+# name: (parent, mesh, material, translation)
+TIGER_PARTS = {
+    'body': ('root', CubeMesh(1.5, 1.0, 1.0), 'fur', (0.0, 0.0, 0.0)),
+    'head': ('root', CubeMesh(0.7, 0.7, 0.7), 'fur', (0.9, 0.2, 0.0)),
+    'eye_left': ('head', SphereMesh(0.08), 'eye', (0.3, 0.15, 0.25)),
+    'eye_right': ('head', SphereMesh(0.08), 'eye', (0.3, 0.15, -0.25)),
+    'leg_front_left': ('root', CubeMesh(0.2, 0.4, 0.2), 'fur_dark', (0.5, -0.8, 0.4)),
+    'leg_front_right': ('root', CubeMesh(0.2, 0.4, 0.2), 'fur_dark', (0.5, -0.8, -0.4)),
+    'leg_back_left': ('root', CubeMesh(0.2, 0.4, 0.2), 'fur_dark', (-0.5, -0.8, 0.4)),
+    'leg_back_right': ('root', CubeMesh(0.2, 0.4, 0.2), 'fur_dark', (-0.5, -0.8, -0.4)),
+    'tail': ('root', CubeMesh(0.6, 0.15, 0.15), 'fur', (-0.9, 0.2, 0.0)),
+}
+
+HERD_SPACING = 2.5
+
+# Fur colour by condition
+COLOR_SAD = (0.6, 0.6, 0.7)
+COLOR_HUNGRY = (0.8, 0.4, 0.2)
+COLOR_NORMAL = (1.0, 0.6, 0.2)
+
+
+def herd_layout(count, spacing=HERD_SPACING):
+    """Place `count` tigers on a square grid centred on the origin"""
+    side = max(1, math.ceil(math.sqrt(count)))
+    offset = (side - 1) * spacing / 2
+    return [((i % side) * spacing - offset, (i // side) * spacing - offset) for i in range(count)]
+
+
+def instance_matrix(rotation, scale, body_height):
+    """Whole-tiger transform of one drawn instance (what set_pose puts on the root)"""
+    return transforms.compose((0.0, body_height, 0.0), (rotation, 0.0, 1.0, 0.0), (scale, scale, scale))
+
+
+def tiger_color_for(pet):
+    """Fur colour for a pet (or snapshot): gray when sad, darker when hungry"""
+    if pet.mood < 30:
+        return COLOR_SAD
+    if pet.hunger < 30:
+        return COLOR_HUNGRY
+    return COLOR_NORMAL
+
+
+class TigerModel:
+    """Scene graph for one tiger plus helpers to pose and recolor it"""
+
+    def __init__(self, color=(1.0, 0.7, 0.1)):
+        self.graph = SceneGraph()
+        self.materials = {
+            'fur': Material('fur', color, texture='stripes'),
+            'fur_dark': Material('fur_dark', [c * 0.8 for c in color], texture='stripes'),
+            # Black without a texture atlas, untinted iris and pupil with one
+            'eye': Material('eye', (0.0, 0.0, 0.0), texture='eye', texture_color=(1.0, 1.0, 1.0)),
+        }
+
+        self.root = self.graph.add(SceneNode('tiger'))
+        nodes = {'root': self.root}
+        for name, (parent, mesh, material, translation) in TIGER_PARTS.items():
+            node = SceneNode(name, mesh=mesh, material=self.materials.get(material),
+                             translation=translation)
+            nodes[parent].add_child(node)
+            nodes[name] = node
+        self.nodes = nodes
+        self.tail = nodes['tail']
+
+    def attach_mesh(self, mesh, size=2.0):
+        """Replace the procedural parts with a loaded mesh scaled to `size` units"""
+        extent = max(hi - lo for lo, hi in zip(mesh.bounds_min, mesh.bounds_max)) or 1.0
+        factor = size / extent
+        center = [(lo + hi) / 2 for lo, hi in zip(mesh.bounds_min, mesh.bounds_max)]
+        for name in TIGER_PARTS:
+            self.nodes[name].visible = False
+        node = SceneNode('model', mesh=mesh, material=self.materials['fur'],
+                         translation=[-c * factor for c in center], scale=(factor, factor, factor))
+        self.root.add_child(node)
+        self.nodes['model'] = node
+
+    def set_color(self, color):
+        """Recolor fur materials (no transform or draw-list invalidation)"""
+        self.materials['fur'].color[:] = color
+        self.materials['fur_dark'].color[:] = [c * 0.8 for c in color]
+
+    def set_pose(self, rotation=None, scale=None, tail_angle=None, body_height=None, head_pitch=None):
+        """Update animated transforms; unchanged values don't dirty anything"""
+        if rotation is not None:
+            self.root.rotation = (rotation, 0.0, 1.0, 0.0)
+        if scale is not None:
+            self.root.scale = (scale, scale, scale)
+        if body_height is not None:
+            self.root.translation = (0.0, body_height, 0.0)
+        if tail_angle is not None:
+            self.tail.rotation = (tail_angle, 0.0, 0.0, 1.0)
+        if head_pitch is not None:
+            self.nodes['head'].rotation = (head_pitch, 0.0, 0.0, 1.0)
+
+    def draw_list(self):
+        return self.graph.draw_list()
@@ -0,0 +1,139 @@
+"""
+4x4 matrix helpers for the scene graph
+Matrices are flat 16-element lists in OpenGL column-major order, so they
+can be handed straight to glMultMatrixf/glLoadMatrixf.
+"""
+import math
+
+IDENTITY = (1.0, 0.0, 0.0, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            0.0, 0.0, 0.0, 1.0)
+
+
+def identity():
+    return list(IDENTITY)
+
+
+def translation(x, y, z):
+    m = identity()
+    m[12], m[13], m[14] = x, y, z
+    return m
+
+
+def scaling(x, y, z):
+    m = identity()
+    m[0], m[5], m[10] = x, y, z
+    return m
+
+
+def rotation(angle_deg, x, y, z):
+    """Same convention as glRotatef"""
+    length = math.sqrt(x * x + y * y + z * z)
+    if angle_deg == 0 or length == 0:
+        return identity()
+    x, y, z = x / length, y / length, z / length
+    a = math.radians(angle_deg)
+    c, s = math.cos(a), math.sin(a)
+    t = 1.0 - c
+    return [
+        t * x * x + c,     t * x * y + s * z, t * x * z - s * y, 0.0,
+        t * x * y - s * z, t * y * y + c,     t * y * z + s * x, 0.0,
+        t * x * z + s * y, t * y * z - s * x, t * z * z + c,     0.0,
+        0.0,               0.0,               0.0,               1.0,
+    ]
+
+
+def multiply(a, b):
+    """Return a * b (b is applied first, as with successive glMultMatrix calls)"""
+    out = [0.0] * 16
+    for col in range(4):
+        b0, b1, b2, b3 = b[col * 4], b[col * 4 + 1], b[col * 4 + 2], b[col * 4 + 3]
+        for row in range(4):
+            out[col * 4 + row] = a[row] * b0 + a[4 + row] * b1 + a[8 + row] * b2 + a[12 + row] * b3
+    return out
+
+
+def compose(translate, rotate, scale):
+    """T * R * S for a (x, y, z) translation, (angle, x, y, z) rotation and (x, y, z) scale"""
+    m = rotation(*rotate) if rotate[0] else identity()
+    if scale != (1.0, 1.0, 1.0):
+        sx, sy, sz = scale
+        for i in range(3):
+            m[i] *= sx
+            m[4 + i] *= sy
+            m[8 + i] *= sz
+    m[12], m[13], m[14] = translate
+    return m
+
+
+def transform_point(m, p):
+    x, y, z = p
+    return (m[0] * x + m[4] * y + m[8] * z + m[12],
+            m[1] * x + m[5] * y + m[9] * z + m[13],
+            m[2] * x + m[6] * y + m[10] * z + m[14])
+
+
+def perspective(fov_y_deg, aspect, near, far):
+    """Same matrix as gluPerspective"""
+    f = 1.0 / math.tan(math.radians(fov_y_deg) / 2)
+    m = [0.0] * 16
+    m[0] = f / aspect
+    m[5] = f
+    m[10] = (far + near) / (near - far)
+    m[11] = -1.0
+    m[14] = 2 * far * near / (near - far)
+    return m
+
+
+def _normalize(v):
+    length = math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2]) or 1.0
+    return (v[0] / length, v[1] / length, v[2] / length)
+
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def look_at(eye, target, up):
+    """Same matrix as gluLookAt"""
+    f = _normalize((target[0] - eye[0], target[1] - eye[1], target[2] - eye[2]))
+    s = _normalize(_cross(f, up))
+    u = _cross(s, f)
+    return [
+        s[0], u[0], -f[0], 0.0,
+        s[1], u[1], -f[1], 0.0,
+        s[2], u[2], -f[2], 0.0,
+        -(s[0] * eye[0] + s[1] * eye[1] + s[2] * eye[2]),
+        -(u[0] * eye[0] + u[1] * eye[1] + u[2] * eye[2]),
+        f[0] * eye[0] + f[1] * eye[1] + f[2] * eye[2],
+        1.0,
+    ]
+
+
+def invert(m):
+    """General 4x4 inverse (Gauss-Jordan); returns None if singular"""
+    # Work on row-major rows of [m | I]
+    rows = [[m[col * 4 + row] for col in range(4)] + [1.0 if i == row else 0.0 for i in range(4)]
+            for row in range(4)]
+    for col in range(4):
+        pivot = max(range(col, 4), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        p = rows[col][col]
+        rows[col] = [v / p for v in rows[col]]
+        for r in range(4):
+            if r != col and rows[r][col] != 0.0:
+                factor = rows[r][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return [rows[row][4 + col] for col in range(4) for row in range(4)]
+
+
+def transform_homogeneous(m, p):
+    """Transform (x, y, z, 1) and divide by w"""
+    x, y, z = p
+    w = m[3] * x + m[7] * y + m[11] * z + m[15]
+    return ((m[0] * x + m[4] * y + m[8] * z + m[12]) / w,
+            (m[1] * x + m[5] * y + m[9] * z + m[13]) / w,
+            (m[2] * x + m[6] * y + m[10] * z + m[14]) / w)
@@ -2,16 +2,54 @@
 3D viewport using OpenGL for rendering the tiger
 """
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QSurfaceFormat
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QSurfaceFormat, QPainter, QColor, QFont
 from OpenGL.GL import *
 from OpenGL.GLU import *
+from engine3d.frame_stats import FrameStats
+from engine3d.tiger_model import TigerModel, herd_layout, instance_matrix, tiger_color_for
+from engine3d.model_loader import ModelLoader, find_model
+from engine3d.textures import TextureManager
+from engine3d.culling import Frustum, SpatialGrid
+from engine3d.animation import AnimationController, HerdAnimator, PoseTable
+from engine3d.picking import BVH, ground_boxes, unproject_ray
+from engine3d import transforms
+import ctypes
 import math
+import time
+
+# (normal, corner signs) per face, wound counter-clockwise from outside
+CUBE_FACES = (
+    ((0, 0, 1), ((-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1))),        # Front
+    ((0, 0, -1), ((1, -1, -1), (-1, -1, -1), (-1, 1, -1), (1, 1, -1))),   # Back
+    ((0, 1, 0), ((-1, 1, 1), (1, 1, 1), (1, 1, -1), (-1, 1, -1))),        # Top
+    ((0, -1, 0), ((-1, -1, -1), (1, -1, -1), (1, -1, 1), (-1, -1, 1))),   # Bottom
+    ((1, 0, 0), ((1, -1, 1), (1, -1, -1), (1, 1, -1), (1, 1, 1))),        # Right
+    ((-1, 0, 0), ((-1, -1, -1), (-1, -1, 1), (-1, 1, 1), (-1, 1, -1))),   # Left
+)
+CUBE_FACE_UVS = ((0, 0), (1, 0), (1, 1), (0, 1))
+
+FOV_Y = 45
+NEAR_PLANE = 0.1
+FAR_PLANE = 100.0
+
+# Conservative bounding sphere of one posed tiger (spin, breathing, tail)
+TIGER_BOUNDS_CENTER_Y = -0.2
+TIGER_BOUNDS_RADIUS = 1.8
+HERD_CELL_SIZE = 8.0
+
+# Upright pick box around a spinning tiger (head to tail, feet to raised head)
+TIGER_PICK_HALF_WIDTH = 1.3
+TIGER_PICK_Y_MIN = -1.0
+TIGER_PICK_Y_MAX = 1.1
+CLICK_SLOP = 4  # pixels a press may move and still count as a click
 
 
 class Viewport3D(QOpenGLWidget):
     """OpenGL widget for 3D rendering"""
     
+    pet_picked = Signal(int)
+    
     def __init__(self, game_manager):
         super().__init__()
         self.game_manager = game_manager
@@ -23,16 +61,52 @@ class Viewport3D(QOpenGLWidget):
         
         # Mouse tracking
         self.last_mouse_pos = None
+        self._press_pos = None
         self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.StrongFocus)
         
+        # Frame instrumentation (F3 toggles overlay, F4 exports a trace)
+        self.frame_stats = FrameStats()
+        self._aspect = 1.0
         
-        # Tiger animation
-        self.tiger_scale = 1.0
-        self.tiger_scale_direction = 0.01
+        # Tiger animation: keyframed clips baked into a shared pose table
+        self.pose_table = PoseTable()
+        self.animation = AnimationController(self.pose_table)
+        self.tiger_pose = self.animation.update(0.0)
         self.tiger_rotation = 0.0
+        self.herd_animator = None
+        self._herd_poses = None
+        self._last_anim_time = None
         # Change color to "Golden Tiger"
         self.tiger_color = [1.0, 0.7, 0.1] 
         self.tiger_happy = False
+        self.tiger_model = TigerModel(self.tiger_color)
+        # Fur colour of every snapshot pet, by herd index
+        self.herd_colors = []
+        
+        # Optional assets/models/tiger.* loaded in the background; the
+        # procedural tiger is drawn as a placeholder until it is ready
+        self.model_loader = ModelLoader()
+        model_path = find_model('tiger')
+        self.tiger_mesh_handle = self.model_loader.request(model_path) if model_path else None
+        
+        # Skin atlases (stripes/eye/ground), uploaded on first bind
+        self.texture_manager = TextureManager()
+        self.skin = 'default'
+        self._atlas = None
+        self._quadric = None
+        
+        # Ground-plane (x, z) placement of each drawn tiger
+        # Each tiger is a bounding sphere in a spatial grid used for culling
+        # Tiger i is GameManager.pets[i]; the selected one follows the pet's
+        # state and actions, the rest are animated in one batch
+        self.herd_grid = SpatialGrid(cell_size=HERD_CELL_SIZE)
+        self.selected_index = 0
+        self._pet_count = 1
+        self._pick_bvh = None
+        self.herd_positions = [(0.0, 0.0)]
+        self.view_matrix = transforms.identity()
+        self.projection_matrix = transforms.identity()
         
         # Animation timer
         self.anim_timer = QTimer()
@@ -49,6 +123,13 @@ class Viewport3D(QOpenGLWidget):
         
     def initializeGL(self):
         """Initialize OpenGL settings"""
+        self._apply_gl_state()
+        glClearColor(0.2, 0.3, 0.4, 1.0)  # Dark blue background
+        self.frame_stats.gpu.initialize()
+        self._atlas = self.texture_manager.get(self.skin)
+        
+    def _apply_gl_state(self):
+        """Fixed-function state used by the scene (restored after QPainter overlays)"""
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_LIGHTING)
         glEnable(GL_LIGHT0)
@@ -60,193 +141,312 @@ class Viewport3D(QOpenGLWidget):
         glLightfv(GL_LIGHT0, GL_AMBIENT, [0.3, 0.3, 0.3, 1.0])
         glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
         
-        glClearColor(0.2, 0.3, 0.4, 1.0)  # Dark blue background
-        
     def resizeGL(self, w, h):
         """Handle window resize"""
+        self._aspect = w / h if h != 0 else 1
         glViewport(0, 0, w, h)
+        self._apply_projection()
+        
+    def _apply_projection(self):
+        self.projection_matrix = transforms.perspective(FOV_Y, self._aspect, NEAR_PLANE, FAR_PLANE)
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45, w / h if h != 0 else 1, 0.1, 100.0)
+        glLoadMatrixf(self.projection_matrix)
         glMatrixMode(GL_MODELVIEW)
         
+    @property
+    def herd_positions(self):
+        return self._herd_positions
+        
+    @herd_positions.setter
+    def herd_positions(self, positions):
+        """Place tigers at (x, z) ground positions and rebuild the culling grid"""
+        self._herd_positions = list(positions)
+        self.herd_grid.clear()
+        for i, (x, z) in enumerate(self._herd_positions):
+            self.herd_grid.insert(i, (x, TIGER_BOUNDS_CENTER_Y, z), TIGER_BOUNDS_RADIUS)
+        count = len(self._herd_positions)
+        self.herd_animator = HerdAnimator(count, self.pose_table) if count > 1 else None
+        self._herd_poses = self.herd_animator.update(0.0) if self.herd_animator else None
+        # Picking BVH is rebuilt on the next click
+        self._pick_bvh = None
+        
     def paintGL(self):
         """Render the scene"""
+        stats = self.frame_stats
+        stats.begin_frame()
+        
+        painter = None
+        if stats.overlay_visible:
+            painter = QPainter(self)
+            painter.beginNativePainting()
+            self._apply_gl_state()
+            self._apply_projection()
+            
+        self._render_scene()
+        
+        if painter is not None:
+            painter.endNativePainting()
+            self._draw_stats_overlay(painter)
+            painter.end()
+            
+        stats.end_frame()
+        
+    def _render_scene(self):
+        """Issue the GL calls for one frame"""
+        stats = self.frame_stats
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
         
         # Setup camera
+        stats.begin_section('camera')
         cam_x = self.camera_distance * math.sin(math.radians(self.camera_rotation_y)) * math.cos(math.radians(self.camera_rotation_x))
         cam_y = self.camera_distance * math.sin(math.radians(self.camera_rotation_x))
         cam_z = self.camera_distance * math.cos(math.radians(self.camera_rotation_y)) * math.cos(math.radians(self.camera_rotation_x))
         
-        gluLookAt(cam_x, cam_y, cam_z, 0, 0, 0, 0, 1, 0)
+        # The camera orbits the selected tiger, so switching pets recentres it
+        positions = self._herd_positions
+        target_x, target_z = positions[self.selected_index] if self.selected_index < len(positions) else (0.0, 0.0)
+        self.view_matrix = transforms.look_at((cam_x + target_x, cam_y, cam_z + target_z),
+                                              (target_x, 0, target_z), (0, 1, 0))
+        glLoadMatrixf(self.view_matrix)
+        
+        # Only tigers whose bounds touch the view frustum are submitted
+        frustum = Frustum.from_matrices(self.projection_matrix, self.view_matrix)
+        visible = self.herd_grid.query_frustum(frustum)
+        stats.set_visibility(len(visible), len(self.herd_grid) - len(visible))
+        stats.end_section()
+        
+        # One texture bind per frame; parts select their atlas region
+        # through the texture matrix instead of rebinding
+        if self._atlas is not None:
+            glEnable(GL_TEXTURE_2D)
+            self._atlas.bind()
         
         # Draw ground plane
+        stats.begin_section('ground')
         self._draw_ground()
+        stats.end_section()
         
         # Draw tiger (placeholder cube with stripes)
-        self._draw_tiger()
+        stats.begin_section('tiger')
+        pose = self.tiger_pose
+        herd_poses = self._herd_poses
+        herd_colors = self.herd_colors
+        selected = self.selected_index
+        for index in sorted(visible):
+            x, z = positions[index]
+            glPushMatrix()
+            glTranslatef(x, 0, z)
+            if index == selected:
+                self._draw_tiger(pose['rotation'], pose['body_scale'], pose['body_height'],
+                                 pose['head_pitch'], pose['tail_angle'])
+                if herd_poses is not None:
+                    self._draw_selection_ring()
+            else:
+                scale, height, pitch, tail, _ = herd_poses[index]
+                color = herd_colors[index] if index < len(herd_colors) else None
+                self._draw_tiger(self.herd_animator.rotations[index], scale, height, pitch, tail, color)
+            glPopMatrix()
+        stats.end_section()
+        
+        glMatrixMode(GL_TEXTURE)
+        glLoadIdentity()
+        glMatrixMode(GL_MODELVIEW)
+        glDisable(GL_TEXTURE_2D)
+        
+    def _draw_stats_overlay(self, painter):
+        """Draw rolling frame-time percentiles over the scene"""
+        lines = self.frame_stats.overlay_lines()
+        painter.setFont(QFont("monospace", 9))
+        line_height = painter.fontMetrics().height()
+        width = max(painter.fontMetrics().horizontalAdvance(line) for line in lines) + 16
+        painter.fillRect(8, 8, width, line_height * len(lines) + 12, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(255, 255, 255))
+        for i, line in enumerate(lines):
+            painter.drawText(16, 14 + line_height * (i + 1) - 4, line)
         
     def _draw_ground(self):
         """Draw a simple ground plane"""
         glDisable(GL_LIGHTING)
+        self._use_texture_region('ground')
         glBegin(GL_QUADS)
         glColor3f(0.3, 0.5, 0.3)  # Green ground
+        glTexCoord2f(0, 0)
         glVertex3f(-5, -1, -5)
+        glTexCoord2f(1, 0)
         glVertex3f(5, -1, -5)
+        glTexCoord2f(1, 1)
         glVertex3f(5, -1, 5)
+        glTexCoord2f(0, 1)
         glVertex3f(-5, -1, 5)
         glEnd()
         glEnable(GL_LIGHTING)
-        
-    def _draw_tiger(self):
-        """Draw tiger placeholder (animated cube)"""
-        glPushMatrix()
-        
-        # Apply rotation
-        glRotatef(self.tiger_rotation, 0, 1, 0)
-        
-        # Apply breathing animation
-        scale = self.tiger_scale
-        glScalef(scale, scale, scale)
-        
-        # Set color based on mood
-        glColor3fv(self.tiger_color)
-        
-        # Draw body (main cube)
-        self._draw_cube(1.5, 1.0, 1.0)
-        
-        # Draw head
-        glPushMatrix()
-        glTranslatef(0.9, 0.2, 0)
-        glColor3f(self.tiger_color[0], self.tiger_color[1], self.tiger_color[2])
-        self._draw_cube(0.7, 0.7, 0.7)
-        
-        # Draw eyes
-        glColor3f(0, 0, 0)
-        glPushMatrix()
-        glTranslatef(0.3, 0.15, 0.25)
-        self._draw_sphere(0.08)
-        glPopMatrix()
-        
-        glPushMatrix()
-        glTranslatef(0.3, 0.15, -0.25)
-        self._draw_sphere(0.08)
-        glPopMatrix()
-        
-        glPopMatrix()
-        
-        # Draw legs
-        glColor3f(self.tiger_color[0] * 0.8, self.tiger_color[1] * 0.8, self.tiger_color[2] * 0.8)
-        positions = [
-            (0.5, -0.8, 0.4),
-            (0.5, -0.8, -0.4),
-            (-0.5, -0.8, 0.4),
-            (-0.5, -0.8, -0.4)
-        ]
-        for pos in positions:
-            glPushMatrix()
-            glTranslatef(*pos)
-            self._draw_cube(0.2, 0.4, 0.2)
-            glPopMatrix()
-        
-        # Draw tail
-        glPushMatrix()
-        glTranslatef(-0.9, 0.2, 0)
-        glRotatef(20 + math.sin(self.tiger_rotation * 0.1) * 10, 0, 0, 1)
-        glColor3f(self.tiger_color[0], self.tiger_color[1], self.tiger_color[2])
-        self._draw_cube(0.6, 0.15, 0.15)
-        glPopMatrix()
-        
-        glPopMatrix()
+        self.frame_stats.add_draw(4)
+        
+    def _draw_tiger(self, rotation, scale, height, head_pitch, tail_angle, color=None):
+        """Draw the tiger scene graph, one colour change per material"""
+        model = self.tiger_model
+        handle = self.tiger_mesh_handle
+        if handle is not None and handle.ready and 'model' not in model.nodes:
+            model.attach_mesh(handle.mesh)
+        model.set_color(color or self.tiger_color)
+        # Every tiger shares one model. Spin, scale and bounce are pushed per
+        # instance and the model root stays at identity, so only the head and
+        # tail are re-posed between tigers and the other parts stay cached.
+        model.set_pose(head_pitch=float(head_pitch), tail_angle=float(tail_angle))
+        glMultMatrixf(instance_matrix(float(rotation), float(scale), float(height)))
+        
+        for material, nodes in model.draw_list():
+            textured = self._use_texture_region(material.texture)
+            glColor3fv(material.tint(textured))
+            for node in nodes:
+                glPushMatrix()
+                glMultMatrixf(node.world_matrix())
+                self._draw_mesh(node.mesh)
+                glPopMatrix()
+                
+    def _draw_selection_ring(self, radius=1.4, segments=32):
+        """Ring on the ground under the selected tiger of a herd"""
+        glDisable(GL_LIGHTING)
+        glDisable(GL_TEXTURE_2D)
+        glColor3f(1.0, 1.0, 0.3)
+        glBegin(GL_LINE_LOOP)
+        for i in range(segments):
+            angle = 2 * math.pi * i / segments
+            glVertex3f(radius * math.cos(angle), -0.98, radius * math.sin(angle))
+        glEnd()
+        glEnable(GL_LIGHTING)
+        self.frame_stats.add_draw(segments)
+        
+    def _use_texture_region(self, region):
+        """Map 0..1 texcoords onto an atlas region, or disable texturing; True if textured"""
+        if self._atlas is None:
+            return False
+        uv = self._atlas.regions.get(region) if region else None
+        if uv is None:
+            glDisable(GL_TEXTURE_2D)
+            return False
+        glEnable(GL_TEXTURE_2D)
+        u0, v0, u1, v1 = uv
+        glMatrixMode(GL_TEXTURE)
+        glLoadIdentity()
+        glTranslatef(u0, v0, 0)
+        glScalef(u1 - u0, v1 - v0, 1)
+        glMatrixMode(GL_MODELVIEW)
+        return True
+        
+    def _draw_mesh(self, mesh):
+        """Dispatch a scene graph mesh to its immediate-mode drawer"""
+        if mesh.kind == 'cube':
+            self._draw_cube(*mesh.size)
+        elif mesh.kind == 'sphere':
+            self._draw_sphere(mesh.radius)
+        elif mesh.kind == 'mesh':
+            self._draw_mesh_data(mesh)
+            
+    def _draw_mesh_data(self, mesh):
+        """Draw a loaded mesh from VBOs, uploading them on first use"""
+        if mesh.gl_buffers is None:
+            vbo, ibo = glGenBuffers(2)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, mesh.vertices.nbytes, mesh.vertices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, mesh.indices.nbytes, mesh.indices, GL_STATIC_DRAW)
+            mesh.gl_buffers = (vbo, ibo)
+            
+        vbo, ibo = mesh.gl_buffers
+        stride = mesh.vertices.strides[0]
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))
+        glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(24))
+        glDrawElements(GL_TRIANGLES, mesh.index_count, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.frame_stats.add_draw(mesh.index_count)
         
     def _draw_cube(self, width, height, depth):
-        """Draw a cube with given dimensions"""
+        """Draw a cube with given dimensions (texcoords span 0..1 per face)"""
         w, h, d = width / 2, height / 2, depth / 2
         
         glBegin(GL_QUADS)
-        
-        # Front
-        glNormal3f(0, 0, 1)
-        glVertex3f(-w, -h, d)
-        glVertex3f(w, -h, d)
-        glVertex3f(w, h, d)
-        glVertex3f(-w, h, d)
-        
-        # Back
-        glNormal3f(0, 0, -1)
-        glVertex3f(-w, -h, -d)
-        glVertex3f(-w, h, -d)
-        glVertex3f(w, h, -d)
-        glVertex3f(w, -h, -d)
-        
-        # Top
-        glNormal3f(0, 1, 0)
-        glVertex3f(-w, h, -d)
-        glVertex3f(-w, h, d)
-        glVertex3f(w, h, d)
-        glVertex3f(w, h, -d)
-        
-        # Bottom
-        glNormal3f(0, -1, 0)
-        glVertex3f(-w, -h, -d)
-        glVertex3f(w, -h, -d)
-        glVertex3f(w, -h, d)
-        glVertex3f(-w, -h, d)
-        
-        # Right
-        glNormal3f(1, 0, 0)
-        glVertex3f(w, -h, -d)
-        glVertex3f(w, h, -d)
-        glVertex3f(w, h, d)
-        glVertex3f(w, -h, d)
-        
-        # Left
-        glNormal3f(-1, 0, 0)
-        glVertex3f(-w, -h, -d)
-        glVertex3f(-w, -h, d)
-        glVertex3f(-w, h, d)
-        glVertex3f(-w, h, -d)
-        
+        for normal, corners in CUBE_FACES:
+            glNormal3f(*normal)
+            for (sx, sy, sz), (u, v) in zip(corners, CUBE_FACE_UVS):
+                glTexCoord2f(u, v)
+                glVertex3f(sx * w, sy * h, sz * d)
         glEnd()
+        self.frame_stats.add_draw(24)
         
     def _draw_sphere(self, radius):
         """Draw a simple sphere"""
-        quadric = gluNewQuadric()
-        gluSphere(quadric, radius, 16, 16)
-        gluDeleteQuadric(quadric)
-        
-    def _animate(self):
-        """Update animations"""
-        # Breathing animation
-        self.tiger_scale += self.tiger_scale_direction
-        if self.tiger_scale > 1.05 or self.tiger_scale < 0.95:
-            self.tiger_scale_direction *= -1
-            
-        # Rotation
-        self.tiger_rotation += 0.5
-        if self.tiger_rotation >= 360:
-            self.tiger_rotation = 0
+        if self._quadric is None:
+            self._quadric = gluNewQuadric()
+            gluQuadricTexture(self._quadric, GL_TRUE)
+        gluSphere(self._quadric, radius, 16, 16)
+        # gluSphere emits one quad strip per stack
+        self.frame_stats.add_draw(16 * 17 * 2, calls=16)
+        
+    def _animate(self, dt=None):
+        """Advance animation clocks (real time unless a fixed dt is given)"""
+        now = time.perf_counter()
+        if dt is None:
+            dt = now - self._last_anim_time if self._last_anim_time is not None else 0.0
+            dt = min(dt, 0.1)  # don't jump after stalls
+        self._last_anim_time = now
+        
+        self.tiger_pose = self.animation.update(dt)
+        self.tiger_rotation = self.tiger_pose['rotation']
+        if self.herd_animator is not None:
+            self._herd_poses = self.herd_animator.update(dt)
             
         self.update()
         
-    def update_scene(self):
-        """Update scene based on pet state"""
-        pet = self.game_manager.pet
+    def play_action(self, action):
+        """Play the clip for a pet action ('feed', 'clean', 'sleep', 'play')"""
+        self.animation.trigger(action)
+        
+    def pick(self, x, y):
+        """Index of the nearest tiger under widget pixel (x, y), or None"""
+        if self._pick_bvh is None:
+            bounds = ground_boxes(self._herd_positions, TIGER_PICK_HALF_WIDTH,
+                                  TIGER_PICK_Y_MIN, TIGER_PICK_Y_MAX)
+            self._pick_bvh = BVH(*bounds)
+        ray = unproject_ray(x, y, max(1, self.width()), max(1, self.height()),
+                            self.projection_matrix, self.view_matrix)
+        if ray is None:
+            return None
+        hit = self._pick_bvh.intersect(*ray)
+        return hit[0] if hit else None
+        
+    def update_scene(self, snapshot):
+        """Update scene from a simulation WorldSnapshot"""
+        pets = snapshot.pets
+        if len(pets) != self._pet_count:
+            self._pet_count = len(pets)
+            self.herd_positions = herd_layout(len(pets))
+        self.selected_index = snapshot.active_pet_index
+        
+        pet = snapshot.pet
+        self.animation.set_state(pet.state)
+        if self.herd_animator is not None:
+            self.herd_animator.set_states([p.state for p in pets])
         
         # Change color based on mood
-        if pet.mood < 30:
-            self.tiger_color = [0.6, 0.6, 0.7]  # Gray when sad
-        elif pet.hunger < 30:
-            self.tiger_color = [0.8, 0.4, 0.2]  # Darker when hungry
-        else:
-            self.tiger_color = [1.0, 0.6, 0.2]  # Normal orange
+        self.tiger_color = list(tiger_color_for(pet))
+        self.herd_colors = [tiger_color_for(p) for p in pets]
             
     def mousePressEvent(self, event):
         """Handle mouse press for camera control"""
         if event.button() == Qt.LeftButton:
             self.last_mouse_pos = event.pos()
+            self._press_pos = event.pos()
             
     def mouseMoveEvent(self, event):
         """Handle mouse drag for camera rotation"""
@@ -264,9 +464,28 @@ class Viewport3D(QOpenGLWidget):
             self.update()
             
     def mouseReleaseEvent(self, event):
-        """Handle mouse release"""
+        """Handle mouse release; a press without a drag picks a tiger"""
         if event.button() == Qt.LeftButton:
             self.last_mouse_pos = None
+            press, self._press_pos = self._press_pos, None
+            if press is not None and (event.pos() - press).manhattanLength() <= CLICK_SLOP:
+                index = self.pick(event.pos().x(), event.pos().y())
+                if index is not None and index != self.selected_index:
+                    self.selected_index = index
+                    self.pet_picked.emit(index)
+                    self.update()
+            
+    def keyPressEvent(self, event):
+        """F3 toggles the frame stats overlay, F4 exports a frame trace"""
+        if event.key() == Qt.Key_F3:
+            self.frame_stats.toggle_overlay()
+            self.update()
+        elif event.key() == Qt.Key_F4:
+            paths = self.frame_stats.export_trace()
+            if paths:
+                print(f"Frame trace written to {paths[0]} and {paths[1]}")
+        else:
+            super().keyPressEvent(event)
             
     def wheelEvent(self, event):
         """Handle mouse wheel for camera zoom"""
@@ -4,11 +4,16 @@
 from datetime import datetime
 import json
 from pathlib import Path
+from services.metrics import REGISTRY
+
+MAX_SESSIONS = 200  # older session records are dropped so the file stays small
+ACTIONS = REGISTRY.counter('macan_actions', 'Pet actions logged by GameAnalytics', ('action',))
 
 class GameAnalytics:
     def __init__(self):
         self.stats_file = Path.home() / '.macan_ternak' / 'analytics.json'
         self.stats = self._load_stats()
+        self.listeners = []  # callables(analytics, field), e.g. leaderboards
     
     def _load_stats(self):
         if self.stats_file.exists():
@@ -32,17 +37,21 @@ class GameAnalytics:
             'date': datetime.now().isoformat(),
             'duration': duration
         })
+        del self.stats['sessions'][:-MAX_SESSIONS]
         self._save_stats()
     
     def log_action(self, action_name):
         if action_name in self.stats['actions_performed']:
             self.stats['actions_performed'][action_name] += 1
+            if REGISTRY.enabled:
+                ACTIONS.labels(action_name).inc()
     
     def update_max_level(self, level):
-        self.stats['max_level_reached'] = max(
-            self.stats['max_level_reached'], 
-            level
-        )
+        if level <= self.stats['max_level_reached']:
+            return
+        self.stats['max_level_reached'] = level
+        for listener in self.listeners:
+            listener(self, 'max_level_reached')
     
     def _save_stats(self):
         with open(self.stats_file, 'w') as f:
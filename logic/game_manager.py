@@ -1,18 +1,55 @@
 """
 Game manager that coordinates all game systems
 """
+from logic.rules import RULES
 from logic.tiger_pet import TigerPet
+from services.metrics import REGISTRY
 import time
 
+TICK_SECONDS = REGISTRY.histogram('macan_tick_seconds', 'GameManager.update duration in seconds')
+PET_COUNT = REGISTRY.gauge('macan_pets', 'Number of pets in the game')
+
 class GameManager:
     """Central game manager coordinating all systems"""
     
-    def __init__(self, save_manager):
+    def __init__(self, save_manager, analytics=None):
         self.save_manager = save_manager
-        self.pet = TigerPet()
+        self.analytics = analytics  # GameAnalytics told about level-ups, if any
+        self.pets = [self._adopt(TigerPet())]
+        self.active_pet_index = 0
         self.last_update_time = time.time()
         self.is_paused = False
         
+    @property
+    def pet(self):
+        """The pet that care actions apply to"""
+        return self.pets[self.active_pet_index]
+        
+    @pet.setter
+    def pet(self, pet):
+        self.pets[self.active_pet_index] = self._adopt(pet)
+        
+    def add_pet(self):
+        """Adopt a new tiger; returns its index in pets"""
+        self.pets.append(self._adopt(TigerPet()))
+        return len(self.pets) - 1
+        
+    def _adopt(self, pet):
+        """Report the pet's level-ups to analytics (max_level_reached)"""
+        if self.analytics is not None:
+            pet.watch('level', self._on_level_up)
+        return pet
+        
+    def _on_level_up(self, pet, field):
+        self.analytics.update_max_level(pet.level)
+        
+    def select_pet(self, index):
+        """Make pets[index] the target of care actions"""
+        if not 0 <= index < len(self.pets):
+            return False
+        self.active_pet_index = index
+        return True
+        
     def update(self):
         """Main game update loop"""
         if self.is_paused:
@@ -22,13 +59,24 @@ class GameManager:
         delta_time = current_time - self.last_update_time
         self.last_update_time = current_time
         
-        # Update pet
-        self.pet.update(delta_time)
+        # Pick up edits to balance_rules.json (throttled stat check)
+        RULES.reload_if_changed()
+        
+        # Update pets
+        self.advance(delta_time)
+        if REGISTRY.enabled:
+            TICK_SECONDS.observe(time.time() - current_time)
+            PET_COUNT.set(len(self.pets))
         
         # Auto-save every 30 seconds
         if int(current_time) % 30 == 0:
             self.save_game()
             
+    def advance(self, delta_time):
+        """Advance every pet by delta_time seconds (no clock, no autosave)"""
+        for pet in self.pets:
+            pet.update(delta_time)
+            
     def feed_pet(self):
         """Feed the pet"""
         return self.pet.feed()
@@ -45,20 +93,33 @@ class GameManager:
         """Play with pet"""
         return self.pet.play()
         
-    def save_game(self):
-        """Save current game state"""
-        game_data = {
+    def save_data(self):
+        """Save payload for the current game state"""
+        # 'pet' (the active one) keeps older builds able to read the save
+        return {
             'pet': self.pet.to_dict(),
+            'pets': [pet.to_dict() for pet in self.pets],
+            'active_pet_index': self.active_pet_index,
             'last_save_time': time.time()
         }
-        self.save_manager.save_game(game_data)
+        
+    def save_game(self):
+        """Save current game state"""
+        self.save_manager.save_game(self.save_data())
         
     def load_game(self):
         """Load saved game state"""
         game_data = self.save_manager.load_game()
         
-        if game_data and 'pet' in game_data:
-            self.pet.from_dict(game_data['pet'])
+        if game_data and ('pets' in game_data or 'pet' in game_data):
+            records = game_data.get('pets') or [game_data['pet']]
+            self.pets = []
+            for record in records:
+                pet = self._adopt(TigerPet())
+                pet.from_dict(record)
+                self.pets.append(pet)
+            index = game_data.get('active_pet_index', 0)
+            self.active_pet_index = index if 0 <= index < len(self.pets) else 0
             
             # Calculate offline progress
             last_save = game_data.get('last_save_time', time.time())
@@ -68,7 +129,8 @@ class GameManager:
             offline_time = min(offline_time, 3600)
             
             if offline_time > 60:  # More than 1 minute offline
-                self.pet.update(offline_time)
+                for pet in self.pets:
+                    pet.update(offline_time)
                 
     def pause(self):
         """Pause the game"""
@@ -81,5 +143,6 @@ class GameManager:
         
     def reset_game(self):
         """Reset to new game"""
-        self.pet = TigerPet()
+        self.pets = [self._adopt(TigerPet())]
+        self.active_pet_index = 0
         self.save_game()
\ No newline at end of file
@@ -0,0 +1,251 @@
+"""
+Incrementally maintained leaderboards
+A Leaderboard keeps (−score, entry id) keys in a RankedList: sorted blocks of
+a few hundred keys plus a Fenwick tree over the block sizes. Moving an entry
+and finding its rank or the k-th entry are O(log n), so top-k, rank-of-pet
+and around-me queries stay fast at a million entries. PetLeaderboards keeps
+boards current from TigerPet change notifications (level-ups, exp, coins).
+"""
+from bisect import bisect_left, insort
+import itertools
+
+BLOCK_SIZE = 512     # blocks split at twice this
+
+
+class FenwickTree:
+    """Prefix sums over a list of counts with O(log n) point updates"""
+
+    def __init__(self, counts=()):
+        self.tree = [0] + list(counts)
+        size = len(self.tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self.tree[parent] += self.tree[i]
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def add(self, index, delta):
+        i = index + 1
+        size = len(self.tree)
+        while i < size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index):
+        """Sum of counts [0, index)"""
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, k):
+        """(index, k - prefix(index)) of the slot holding the k-th unit (0-based)"""
+        position = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            ahead = position + step
+            if ahead < len(self.tree) and self.tree[ahead] <= k:
+                position = ahead
+                k -= self.tree[ahead]
+            step >>= 1
+        return position, k
+
+
+class RankedList:
+    """Sorted list of unique keys with O(log n) add, remove, index and k-th lookup"""
+
+    def __init__(self, keys=(), block_size=BLOCK_SIZE):
+        self.block_size = block_size
+        keys = sorted(keys)
+        self._blocks = [keys[i:i + block_size] for i in range(0, len(keys), block_size)]
+        self._reindex()
+
+    def _reindex(self):
+        self._maxes = [block[-1] for block in self._blocks]
+        self._sizes = FenwickTree(len(block) for block in self._blocks)
+        self._len = sum(len(block) for block in self._blocks)
+
+    def __len__(self):
+        return self._len
+
+    def _locate(self, key):
+        i = bisect_left(self._maxes, key)
+        return min(i, len(self._blocks) - 1)
+
+    def add(self, key):
+        if not self._blocks:
+            self._blocks.append([key])
+            self._reindex()
+            return
+        i = self._locate(key)
+        block = self._blocks[i]
+        insort(block, key)
+        self._maxes[i] = block[-1]
+        self._len += 1
+        if len(block) > 2 * self.block_size:
+            self._blocks.insert(i + 1, block[self.block_size:])
+            del block[self.block_size:]
+            self._reindex()
+        else:
+            self._sizes.add(i, 1)
+
+    def remove(self, key):
+        if not self._blocks:
+            raise KeyError(key)
+        i = self._locate(key)
+        block = self._blocks[i]
+        j = bisect_left(block, key)
+        if j == len(block) or block[j] != key:
+            raise KeyError(key)
+        del block[j]
+        self._len -= 1
+        if not block:
+            del self._blocks[i]
+            self._reindex()
+        else:
+            self._maxes[i] = block[-1]
+            self._sizes.add(i, -1)
+
+    def index(self, key):
+        """Position of key (0 = smallest)"""
+        if self._blocks:
+            i = self._locate(key)
+            j = bisect_left(self._blocks[i], key)
+            if j < len(self._blocks[i]) and self._blocks[i][j] == key:
+                return self._sizes.prefix(i) + j
+        raise KeyError(key)
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self._len
+        if not 0 <= k < self._len:
+            raise IndexError("RankedList index out of range")
+        i, j = self._sizes.find(k)
+        return self._blocks[i][j]
+
+    def islice(self, start, stop):
+        """Keys [start, stop) in order"""
+        start, stop = max(0, start), min(stop, self._len)
+        if start >= stop:
+            return
+        i, j = self._sizes.find(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self._blocks[i][j:j + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            i, j = i + 1, 0
+
+
+class Leaderboard:
+    """Scores by entry id, ranked highest first (ties: lower entry id first)"""
+
+    def __init__(self, scores=None, block_size=BLOCK_SIZE):
+        self.scores = dict(scores or {})
+        self._ranked = RankedList(((-score, entry) for entry, score in self.scores.items()), block_size)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def __contains__(self, entry):
+        return entry in self.scores
+
+    def set(self, entry, score):
+        old = self.scores.get(entry)
+        if old == score:
+            return
+        if old is not None:
+            self._ranked.remove((-old, entry))
+        self.scores[entry] = score
+        self._ranked.add((-score, entry))
+
+    def discard(self, entry):
+        old = self.scores.pop(entry, None)
+        if old is not None:
+            self._ranked.remove((-old, entry))
+
+    def rank(self, entry):
+        """1-based rank (KeyError if the entry isn't on the board)"""
+        return self._ranked.index((-self.scores[entry], entry)) + 1
+
+    def at(self, rank):
+        """(entry, score) at a 1-based rank"""
+        neg_score, entry = self._ranked[rank - 1]
+        return entry, -neg_score
+
+    def top(self, k=10):
+        """[(rank, entry, score)] for the best k"""
+        return self.window(1, k + 1)
+
+    def around(self, entry, radius=5):
+        """[(rank, entry, score)] for up to `radius` places either side of entry"""
+        rank = self.rank(entry)
+        return self.window(max(1, rank - radius), rank + radius + 1)
+
+    def window(self, first, stop):
+        """[(rank, entry, score)] for ranks [first, stop)"""
+        keys = self._ranked.islice(first - 1, stop - 1)
+        return [(rank, entry, -neg_score) for rank, (neg_score, entry) in zip(itertools.count(first), keys)]
+
+
+# board name -> score of a TigerPet; the field names match TigerPet change notifications.
+# Coins rank by the whole coins shown to players, so fractional passive income
+# only moves the board when the displayed amount changes.
+PET_BOARDS = {
+    'level': lambda pet: pet.level,
+    'exp': lambda pet: pet.exp,
+    'coins': lambda pet: int(pet.coins),
+}
+
+
+class PetLeaderboards:
+    """Leaderboards over many pets, updated as the pets change"""
+
+    def __init__(self, boards=tuple(PET_BOARDS)):
+        self.boards = {name: Leaderboard() for name in boards}
+        self.pets = {}              # entry id -> pet
+        self._entries = {}          # id(pet) -> entry id
+        self._next_entry = 0
+
+    def __getitem__(self, name):
+        return self.boards[name]
+
+    def add(self, pet, entry=None):
+        """Track a pet (entry ids default to 0, 1, 2, ...); returns its entry id"""
+        if entry is None:
+            entry = self._next_entry
+            self._next_entry += 1
+        self.pets[entry] = pet
+        self._entries[id(pet)] = entry
+        for name, board in self.boards.items():
+            board.set(entry, PET_BOARDS[name](pet))
+        for name in self.boards:
+            pet.watch(name, self._on_change)
+        return entry
+
+    def remove(self, pet):
+        entry = self._entries.pop(id(pet))
+        del self.pets[entry]
+        for board in self.boards.values():
+            board.discard(entry)
+        for name in self.boards:
+            pet.unwatch(name, self._on_change)
+
+    def entry(self, pet):
+        return self._entries[id(pet)]
+
+    def _on_change(self, pet, field):
+        self.boards[field].set(self._entries[id(pet)], PET_BOARDS[field](pet))
+
+
+def track_max_level(board, analytics, entry):
+    """Keep board[entry] equal to a GameAnalytics' max_level_reached"""
+    def on_change(source, field):
+        if field == 'max_level_reached':
+            board.set(entry, source.stats['max_level_reached'])
+    board.set(entry, analytics.stats['max_level_reached'])
+    analytics.listeners.append(on_change)
+    return on_change
@@ -0,0 +1,98 @@
+"""
+Rate-limited notification queue with coalescing
+Identical consecutive messages are merged into one entry with a counter,
+a new message replaces the shown one at most every `min_interval`
+seconds, and per-message totals are kept for automation bursts.
+"""
+from collections import deque
+import time
+
+
+class Notification:
+    """One message on screen or waiting, with its repeat count"""
+
+    __slots__ = ('message', 'success', 'count')
+
+    def __init__(self, message, success=True):
+        self.message = message
+        self.success = success
+        self.count = 1
+
+    def same_as(self, message, success):
+        return self.message == message and self.success == success
+
+    @property
+    def text(self):
+        return self.message if self.count == 1 else f"{self.message} ×{self.count}"
+
+
+class NotificationQueue:
+    """Decides what the notification bubble shows and when"""
+
+    def __init__(self, min_interval=0.8, display_time=2.5, max_pending=8, clock=time.monotonic):
+        self.min_interval = min_interval
+        self.display_time = display_time
+        self.max_pending = max_pending
+        self.clock = clock
+        self.current = None
+        self.pending = deque()
+        self.dropped = 0
+        self._shown_at = None
+        self._refresh = False
+        self._totals = {}  # (message, success) -> count since reset_aggregate()
+
+    def push(self, message, success=True):
+        """Queue a message; returns the entry it was counted into"""
+        key = (message, success)
+        self._totals[key] = self._totals.get(key, 0) + 1
+
+        if self.pending and self.pending[-1].same_as(message, success):
+            self.pending[-1].count += 1
+            return self.pending[-1]
+        if not self.pending and self._current_visible() and self.current.same_as(message, success):
+            self.current.count += 1
+            self._refresh = True
+            return self.current
+
+        note = Notification(message, success)
+        self.pending.append(note)
+        while len(self.pending) > self.max_pending:
+            self.dropped += self.pending.popleft().count
+        return note
+
+    def _current_visible(self):
+        return (self.current is not None and self._shown_at is not None
+                and self.clock() - self._shown_at < self.display_time)
+
+    def pop_ready(self):
+        """Notification to (re)display now, or None if nothing is due"""
+        if self._refresh:
+            self._refresh = False
+            return self.current
+        if not self.pending:
+            return None
+        now = self.clock()
+        if self._shown_at is not None and now - self._shown_at < self.min_interval:
+            return None
+        self.current = self.pending.popleft()
+        self._shown_at = now
+        return self.current
+
+    def wait_time(self):
+        """Seconds until the next pending message may be shown, or None"""
+        if self._refresh:
+            return 0.0
+        if not self.pending:
+            return None
+        if self._shown_at is None:
+            return 0.0
+        return max(0.0, self.min_interval - (self.clock() - self._shown_at))
+
+    def aggregate(self):
+        """[(message, success, count)] since the last reset, most frequent first"""
+        items = [(message, success, count) for (message, success), count in self._totals.items()]
+        return sorted(items, key=lambda item: -item[2])
+
+    def reset_aggregate(self):
+        self._totals.clear()
+        self.dropped = 0
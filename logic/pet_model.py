@@ -0,0 +1,81 @@
+"""
+Observable pet model for diff-based UI binding
+Raw values pass through a per-field display transform (bars show whole
+numbers), and only fields whose displayed value changed are reported to
+subscribers, batched until the next flush().
+"""
+
+
+def _state_name(state):
+    """PetState or its string value -> string value"""
+    return getattr(state, 'value', state)
+
+
+# field -> display transform
+DISPLAY_FIELDS = {
+    'hunger': int,
+    'energy': int,
+    'mood': int,
+    'cleanliness': int,
+    'level': int,
+    'exp': int,
+    'exp_to_next_level': int,
+    'coins': int,
+    'state': _state_name,
+}
+
+
+class ObservablePetModel:
+    """Displayed pet values plus per-field change subscriptions"""
+
+    def __init__(self, fields=DISPLAY_FIELDS):
+        self.transforms = dict(fields)
+        self.values = {}        # last delivered (on-screen) values
+        self._pending = {}
+        self._subscribers = []  # [(frozenset of fields, callback)]
+        self.notifications = 0  # callbacks delivered, for tests/diagnostics
+
+    def subscribe(self, fields, callback, replay=True):
+        """Call callback({field: value}) when any of `fields` changes on screen"""
+        fields = frozenset(fields)
+        unknown = fields - self.transforms.keys()
+        if unknown:
+            raise ValueError(f"Unknown pet fields: {', '.join(sorted(unknown))}")
+        self._subscribers.append((fields, callback))
+        if replay:
+            current = {f: self.values[f] for f in fields if f in self.values}
+            if current:
+                callback(current)
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(f, cb) for f, cb in self._subscribers if cb != callback]
+
+    def value(self, field):
+        return self._pending.get(field, self.values.get(field))
+
+    def set(self, field, raw):
+        """Stage a new raw value; returns True if it differs from what is shown"""
+        shown = self.transforms[field](raw)
+        if field in self.values and self.values[field] == shown:
+            # Also drops a change that was undone before the flush
+            self._pending.pop(field, None)
+            return False
+        self._pending[field] = shown
+        return True
+
+    def apply(self, source):
+        """Stage every display field from an object with matching attributes"""
+        for field in self.transforms:
+            self.set(field, getattr(source, field))
+
+    def flush(self):
+        """Deliver staged changes, one call per interested subscriber"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self.values.update(pending)
+        for fields, callback in list(self._subscribers):
+            changes = {f: v for f, v in pending.items() if f in fields}
+            if changes:
+                self.notifications += 1
+                callback(changes)
@@ -0,0 +1,15 @@
+"""
+Pet emotional states
+Kept apart from TigerPet so the balance rules can name states without
+importing the pet class.
+"""
+from enum import Enum
+
+class PetState(Enum):
+    """Pet emotional states"""
+    HAPPY = "happy"
+    NEUTRAL = "neutral"
+    HUNGRY = "hungry"
+    TIRED = "tired"
+    DIRTY = "dirty"
+    SAD = "sad"
@@ -0,0 +1,251 @@
+"""
+Declarative balance rules
+Mood modifiers, the state ladder, health thresholds and care-action effects
+come from balance_rules.json. They are compiled once: into generated Python
+functions for a single pet, and into numpy kernels for column arrays of
+pets (logic.sharded.PetArrays). RULES reloads when the file changes.
+"""
+import json
+import os
+from pathlib import Path
+import random
+import time
+
+import numpy as np
+
+from logic.pet_state import PetState
+
+RULES_FILE = Path(__file__).with_name('balance_rules.json')
+RELOAD_CHECK_INTERVAL = 1.0
+FIELDS = ('hunger', 'energy', 'mood', 'cleanliness', 'level', 'exp', 'coins', 'age')
+STATS = ('hunger', 'energy', 'mood', 'cleanliness')
+# name -> (Python operator, numpy ufunc)
+OPERATORS = {
+    'below': ('<', np.less),
+    'above': ('>', np.greater),
+    'at_least': ('>=', np.greater_equal),
+    'at_most': ('<=', np.less_equal),
+}
+STATES = tuple(PetState)
+# TigerPet's care methods look these up by name
+REQUIRED_ACTIONS = ('feed', 'clean', 'sleep', 'play')
+STATE_CODE = {state: code for code, state in enumerate(STATES)}
+
+
+class RulesError(ValueError):
+    """Rules data that does not describe a valid rule set"""
+
+
+def _number(value, where):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RulesError(f"{where}: expected a number, got {value!r}")
+    return value
+
+
+def _entries(value, kind, where):
+    """`value` checked to be a list whose entries are all of type `kind`"""
+    if not isinstance(value, list) or not all(isinstance(entry, kind) for entry in value):
+        raise RulesError(f"{where}: expected a list of {'objects' if kind is dict else 'strings'}")
+    return value
+
+
+def _conditions(specs, where):
+    """[(field, operator name, value)] from [{"stat": ..., "<operator>": value}]"""
+    if not isinstance(specs, list):
+        raise RulesError(f"{where}: expected a list of conditions")
+    conditions = []
+    for spec in specs:
+        if not isinstance(spec, dict) or spec.get('stat') not in FIELDS:
+            raise RulesError(f"{where}: each condition needs a 'stat' from {', '.join(FIELDS)}")
+        ops = [key for key in spec if key != 'stat']
+        if len(ops) != 1 or ops[0] not in OPERATORS:
+            raise RulesError(f"{where}: each condition needs one of {', '.join(OPERATORS)}")
+        conditions.append((spec['stat'], ops[0], _number(spec[ops[0]], where)))
+    return tuple(conditions)
+
+
+def _expression(conditions):
+    return ' and '.join(f"pet.{field} {OPERATORS[op][0]} {value!r}"
+                        for field, op, value in conditions) or 'True'
+
+
+def _define(name, lines, namespace):
+    """Compile `def name(pet):` with the given body lines"""
+    source = f"def {name}(pet):\n" + ''.join(f"    {line}\n" for line in lines)
+    exec(compile(source, f'<rules {name}>', 'exec'), namespace)
+    return namespace[name]
+
+
+def _mask(pets, conditions, rows=None):
+    """Boolean array: which pets (or which of `rows`) meet every condition"""
+    size = len(pets) if rows is None else len(rows)
+    mask = np.ones(size, bool)
+    for field, op, value in conditions:
+        column = getattr(pets, field)
+        mask &= OPERATORS[op][1](column if rows is None else column[rows], value)
+    return mask
+
+
+class ActionRule:
+    """One care action: refusal conditions, clamped stat effects, exp and messages"""
+
+    def __init__(self, name, spec):
+        where = f"actions.{name}"
+        if not isinstance(spec, dict):
+            raise RulesError(f"{where}: expected an object")
+        self.name = name
+        self.refuse_when = _conditions(spec.get('refuse_when', []), where)
+        self.refusal = str(spec.get('refusal', ''))
+        effects = spec.get('effects', {})
+        if not isinstance(effects, dict) or not set(effects) <= set(STATS):
+            raise RulesError(f"{where}.effects: keys must be from {', '.join(STATS)}")
+        self.effects = tuple((field, _number(delta, where)) for field, delta in effects.items())
+        self.exp = _number(spec.get('exp', 0), where)
+        self.messages = list(_entries(spec.get('messages', []), str, f"{where}.messages")) or [name]
+        self.refused = _define('refused', [f"return {_expression(self.refuse_when)}"], {}) \
+            if self.refuse_when else (lambda pet: False)
+
+    def __call__(self, pet):
+        """Apply to one pet -> (success, message)"""
+        if self.refused(pet):
+            return False, self.refusal
+        for field, delta in self.effects:
+            value = getattr(pet, field) + delta
+            setattr(pet, field, min(100, value) if delta >= 0 else max(0, value))
+        pet.add_exp(self.exp)
+        return True, random.choice(self.messages)
+
+    def allowed(self, pets, rows):
+        """The subset of `rows` that would not refuse"""
+        if not self.refuse_when:
+            return rows
+        return rows[~_mask(pets, self.refuse_when, rows)]
+
+    def apply_effects(self, pets, rows):
+        """Stat effects for `rows` of a PetArrays (exp is left to the caller)"""
+        for field, delta in self.effects:
+            column = getattr(pets, field)
+            if delta >= 0:
+                column[rows] = np.minimum(column[rows] + delta, 100)
+            else:
+                column[rows] = np.maximum(column[rows] + delta, 0)
+
+
+class RuleSet:
+    """Compiled balance rules; reload() swaps them in place"""
+
+    def __init__(self, path=RULES_FILE, check_interval=RELOAD_CHECK_INTERVAL):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self.mtime = None
+        self.generation = 0
+        self._next_check = 0.0
+        self.reload()
+
+    def reload(self):
+        """Read and compile the file; on error the current rules stay in effect"""
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise RulesError(f"{self.path}: {e}")
+        self.compile(data)
+        self.mtime = mtime
+
+    def reload_if_changed(self, now=None):
+        """Reload if the file changed (checked at most every check_interval seconds)"""
+        now = time.monotonic() if now is None else now
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.check_interval
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self.mtime:
+            return False
+        try:
+            self.reload()
+        except (OSError, RulesError) as e:
+            print(f"Error loading rules: {e}")
+            self.mtime = mtime      # report a broken edit once, not on every check
+            return False
+        return True
+
+    def compile(self, data):
+        """Build every kernel from parsed rules data, then publish them together"""
+        if not isinstance(data, dict):
+            raise RulesError("rules must be a JSON object")
+
+        modifiers = []
+        for i, spec in enumerate(_entries(data.get('mood_modifiers', []), dict, 'mood_modifiers')):
+            where = f"mood_modifiers[{i}]"
+            modifiers.append((_conditions(spec.get('when', []), where),
+                              _number(spec.get('mood_per_second'), where)))
+        lines = ['modifier = 0']
+        for conditions, value in modifiers:
+            lines.append(f"if {_expression(conditions)}: modifier += {value!r}")
+        lines.append('return modifier')
+        mood_modifier = _define('mood_modifier', lines, {})
+
+        ladder = []
+        for i, spec in enumerate(_entries(data.get('states', []), dict, 'states')):
+            where = f"states[{i}]"
+            try:
+                state = PetState(spec.get('state'))
+            except ValueError:
+                raise RulesError(f"{where}: unknown state {spec.get('state')!r}")
+            ladder.append((state, _conditions(spec.get('when', []), where)))
+        if not ladder or ladder[-1][1]:
+            raise RulesError("states: the last entry must have no conditions (the default)")
+        namespace = {f'S{i}': state for i, (state, _) in enumerate(ladder)}
+        lines = [f"if {_expression(conditions)}: return S{i}" for i, (_, conditions) in enumerate(ladder[:-1])]
+        lines.append(f"return S{len(ladder) - 1}")
+        state_of = _define('state_of', lines, namespace)
+
+        healthy = _conditions(data.get('healthy', []), 'healthy')
+        is_healthy = _define('is_healthy', [f"return {_expression(healthy)}"], {})
+
+        actions = data.get('actions', {})
+        if not isinstance(actions, dict):
+            raise RulesError("actions: expected an object")
+        missing = [name for name in REQUIRED_ACTIONS if name not in actions]
+        if missing:
+            raise RulesError(f"actions: missing {', '.join(missing)}")
+        actions = {name: ActionRule(name, spec) for name, spec in actions.items()}
+        passive_exp = _number(data.get('passive_exp_per_second', 0), 'passive_exp_per_second')
+
+        # One dict update: other threads see the old rules or the new ones, never a mix
+        vars(self).update(
+            modifiers=tuple(modifiers),
+            ladder=tuple(ladder),
+            healthy=healthy,
+            passive_exp=passive_exp,
+            actions=actions,
+            mood_modifier=mood_modifier,
+            state_of=state_of,
+            is_healthy=is_healthy,
+            generation=self.generation + 1,
+        )
+
+    # Array kernels over PetArrays-style column objects
+
+    def mood_modifiers(self, pets):
+        modifier = np.zeros(len(pets))
+        for conditions, value in self.modifiers:
+            modifier[_mask(pets, conditions)] += value
+        return modifier
+
+    def state_codes(self, pets):
+        """int8 STATE_CODE per pet; the first matching ladder entry wins"""
+        codes = np.full(len(pets), STATE_CODE[self.ladder[-1][0]], np.int8)
+        for state, conditions in reversed(self.ladder[:-1]):
+            codes[_mask(pets, conditions)] = STATE_CODE[state]
+        return codes
+
+    def healthy_mask(self, pets):
+        return _mask(pets, self.healthy)
+
+
+RULES = RuleSet()
@@ -0,0 +1,286 @@
+"""
+Sharded multi-process simulation over shared-memory stat arrays
+Every pet stat is a column in one multiprocessing.shared_memory block. Each
+worker process owns a contiguous shard and applies the TigerPet.update rules
+to it with numpy; a coordinator releases and collects workers on a barrier
+every tick. Only queued actions cross process boundaries, never pet state.
+Mood modifiers, states and action effects are the compiled balance rules.
+"""
+import bisect
+import math
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+import threading
+
+import numpy as np
+
+from logic.rules import RULES, STATE_CODE, STATES, RulesError
+from logic.tiger_pet import TigerPet
+
+# float64 columns, in TigerPet attribute names
+FIELDS = (
+    'hunger', 'energy', 'mood', 'cleanliness',
+    'level', 'exp', 'exp_to_next_level', 'coins', 'age',
+    'hunger_decay_rate', 'energy_decay_rate', 'mood_decay_rate', 'cleanliness_decay_rate',
+)
+STATS = ('hunger', 'energy', 'mood', 'cleanliness')
+DECAY = tuple((stat, f'{stat}_decay_rate') for stat in STATS)
+ACTIONS = ('feed', 'clean', 'sleep', 'play')
+
+BARRIER_TIMEOUT = 30.0
+_DT, _STOP, _RULES, _COUNTS = 0, 1, 2, 3   # control slots; one action count per shard from _COUNTS
+
+
+def nbytes(capacity):
+    """Shared block size for `capacity` pets"""
+    return capacity * (len(FIELDS) * 8 + 1)
+
+
+class PetArrays:
+    """Column views (one numpy array per field, plus `state` codes) over a buffer"""
+
+    def __init__(self, buffer, capacity, lo=0, hi=None):
+        hi = capacity if hi is None else hi
+        self.buffer = buffer
+        self.capacity = capacity
+        self.lo = lo
+        self.hi = hi
+        for i, field in enumerate(FIELDS):
+            column = np.frombuffer(buffer, np.float64, capacity, i * capacity * 8)
+            setattr(self, field, column[lo:hi])
+        self.state = np.frombuffer(buffer, np.int8, capacity, len(FIELDS) * capacity * 8)[lo:hi]
+
+    def __len__(self):
+        return self.hi - self.lo
+
+    def load(self, index):
+        """TigerPet copy of one row"""
+        pet = TigerPet()
+        for field in FIELDS:
+            setattr(pet, field, float(getattr(self, field)[index]))
+        pet.level = int(pet.level)
+        pet.state = STATES[self.state[index]]
+        return pet
+
+    def store(self, index, pet):
+        for field in FIELDS:
+            getattr(self, field)[index] = getattr(pet, field)
+        self.state[index] = STATE_CODE[pet.state]
+
+
+def _exp_to_next_level(level):
+    # Same expression as TigerPet.level_up, so rounding matches exactly
+    return math.floor(100 * (1.2 ** (level - 1)))
+
+
+def level_up(pets, rows):
+    """TigerPet.level_up for the given row indices"""
+    pets.exp[rows] -= pets.exp_to_next_level[rows]
+    pets.level[rows] += 1
+    pets.coins[rows] += 50
+    pets.exp_to_next_level[rows] = [_exp_to_next_level(int(level)) for level in pets.level[rows]]
+    for stat, rate in DECAY:
+        column = getattr(pets, stat)
+        column[rows] = np.minimum(column[rows] + 20, 100)
+        getattr(pets, rate)[rows] *= 0.98
+
+
+def add_exp(pets, rows, amount):
+    """TigerPet.add_exp(amount) for the given row indices"""
+    pets.exp[rows] += amount
+    coin_gain = amount * 0.5
+    if coin_gain >= 1:
+        pets.coins[rows] += coin_gain
+    else:
+        pets.coins[rows[np.mod(pets.age[rows], 10) < 0.1]] += coin_gain
+    rows = rows[pets.exp[rows] >= pets.exp_to_next_level[rows]]
+    while rows.size:
+        level_up(pets, rows)
+        rows = rows[pets.exp[rows] >= pets.exp_to_next_level[rows]]
+
+
+def step(pets, delta_time=1.0):
+    """TigerPet.update(delta_time) applied to every row of a PetArrays"""
+    pets.age += delta_time
+    for stat, rate in DECAY:
+        column = getattr(pets, stat)
+        column -= getattr(pets, rate) * delta_time
+        np.maximum(column, 0, out=column)
+
+    pets.mood += RULES.mood_modifiers(pets) * delta_time
+    np.maximum(pets.mood, 0, out=pets.mood)
+    pets.state[:] = RULES.state_codes(pets)
+
+    healthy = np.flatnonzero(RULES.healthy_mask(pets))
+    if healthy.size:
+        add_exp(pets, healthy, RULES.passive_exp * delta_time)
+
+
+def apply_action(pets, index, action):
+    """Run a TigerPet care action on one row -> (success, message)"""
+    if action not in ACTIONS:
+        return False, f"Unknown action {action!r}"
+    pet = pets.load(index)
+    result = getattr(pet, action)()
+    pets.store(index, pet)
+    return result
+
+
+def act_many(pets, rows, action):
+    """One care action on many rows at once (no messages); returns the rows that accepted it"""
+    rule = RULES.actions[action]
+    rows = rule.allowed(pets, np.asarray(rows, np.intp))
+    if rows.size:
+        rule.apply_effects(pets, rows)
+        add_exp(pets, rows, rule.exp)
+    return rows
+
+
+def _reload_rules():
+    try:
+        RULES.reload()
+    except (OSError, RulesError) as e:
+        print(f"Error loading rules: {e}")
+
+
+def shard_bounds(count, shards):
+    """Contiguous [lo, hi) ranges splitting `count` pets as evenly as possible"""
+    shards = max(1, min(shards, count)) if count else 1
+    size, extra = divmod(count, shards)
+    bounds, lo = [], 0
+    for i in range(shards):
+        hi = lo + size + (1 if i < extra else 0)
+        bounds.append((lo, hi))
+        lo = hi
+    return bounds
+
+
+def _shard_worker(name, capacity, shard_id, lo, hi, control, barrier, commands, replies, timeout):
+    block = shared_memory.SharedMemory(name=name)
+    pets = PetArrays(block.buf, capacity, lo, hi)
+    rules_generation = control[_RULES]
+    try:
+        while True:
+            barrier.wait(timeout)
+            if control[_STOP]:
+                break
+            if control[_RULES] != rules_generation:
+                rules_generation = control[_RULES]
+                _reload_rules()
+            for _ in range(int(control[_COUNTS + shard_id])):
+                ticket, index, action = commands.get(timeout=timeout)
+                replies.put((ticket,) + tuple(apply_action(pets, index - lo, action)))
+            step(pets, control[_DT])
+            barrier.wait(timeout)
+    finally:
+        del pets  # numpy views must go before the mapping is closed
+        block.close()
+
+
+class ShardedSimulation:
+    """Coordinator for pets spread over worker processes (workers=0 runs in-process)"""
+
+    def __init__(self, pets, workers=None, timeout=BARRIER_TIMEOUT, context=None):
+        pets = [TigerPet() for _ in range(pets)] if isinstance(pets, int) else list(pets)
+        self.count = len(pets)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.timeout = timeout
+        self.context = context or multiprocessing.get_context()
+        self.block = shared_memory.SharedMemory(create=True, size=max(1, nbytes(self.count)))
+        self.pets = PetArrays(self.block.buf, self.count)
+        for i, pet in enumerate(pets):
+            self.pets.store(i, pet)
+        self.bounds = shard_bounds(self.count, max(1, self.workers))
+        self._starts = [lo for lo, _ in self.bounds]
+        self._pending = [[] for _ in self.bounds]
+        self._next_ticket = 0
+        self.tick_count = 0
+        self._processes = []
+        self._closed = False
+        if self.workers:
+            self._spawn()
+
+    def _spawn(self):
+        ctx = self.context
+        self._control = ctx.RawArray('d', _COUNTS + len(self.bounds))
+        self._barrier = ctx.Barrier(len(self.bounds) + 1)
+        self._commands = [ctx.Queue() for _ in self.bounds]
+        self._replies = ctx.Queue()
+        for shard_id, (lo, hi) in enumerate(self.bounds):
+            process = ctx.Process(
+                target=_shard_worker, name=f'pet-shard-{shard_id}', daemon=True,
+                args=(self.block.name, self.count, shard_id, lo, hi, self._control,
+                      self._barrier, self._commands[shard_id], self._replies, self.timeout))
+            process.start()
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def owner(self, index):
+        """Shard id holding pet `index`"""
+        if not 0 <= index < self.count:
+            raise IndexError(f"pet index {index} out of range")
+        return bisect.bisect_right(self._starts, index) - 1
+
+    def act(self, index, action):
+        """Queue a care action for the owning shard; returns a ticket answered by tick()"""
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action {action!r}")
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        self._pending[self.owner(index)].append((ticket, index, action))
+        return ticket
+
+    def tick(self, delta_time=1.0):
+        """Apply queued actions, advance every pet; returns {ticket: (success, message)}"""
+        pending, self._pending = self._pending, [[] for _ in self.bounds]
+        results = {}
+        if RULES.reload_if_changed() and self.workers:
+            self._control[_RULES] += 1       # shards reload before their next step
+        if not self.workers:
+            for commands in pending:
+                for ticket, index, action in commands:
+                    results[ticket] = apply_action(self.pets, index, action)
+            step(self.pets, delta_time)
+        else:
+            self._control[_DT] = delta_time
+            for shard_id, commands in enumerate(pending):
+                self._control[_COUNTS + shard_id] = len(commands)
+                for command in commands:
+                    self._commands[shard_id].put(command)
+            self._barrier.wait(self.timeout)     # release the shards
+            self._barrier.wait(self.timeout)     # every shard has stepped
+            for _ in range(sum(len(commands) for commands in pending)):
+                ticket, success, message = self._replies.get(timeout=self.timeout)
+                results[ticket] = (success, message)
+        self.tick_count += 1
+        return results
+
+    def pet(self, index):
+        """TigerPet copy of one pet (read between ticks)"""
+        return self.pets.load(index)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._processes:
+            self._control[_STOP] = 1
+            try:
+                self._barrier.wait(self.timeout)
+            except threading.BrokenBarrierError:
+                self._barrier.abort()
+            for process in self._processes:
+                process.join(self.timeout)
+                if process.is_alive():
+                    process.terminate()
+            for queue in self._commands + [self._replies]:
+                queue.close()
+        self.pets = None
+        self.block.close()
+        self.block.unlink()
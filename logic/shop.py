@@ -33,7 +33,7 @@ class Shop:
             setattr(pet, item.effect_type, min(100, current + item.effect_value))
             
             # Deduct cost
-            pet.coins -= item.price
+            pet.set_coins(pet.coins - item.price)
             
             # Bonus XP for buying things
             pet.add_exp(5)
@@ -0,0 +1,73 @@
+"""
+Search-as-you-type index over ShopItem names
+Names are indexed by trigram posting lists. A query that extends the
+previous one only filters the previous result, so each keystroke costs
+about as much as the result set it narrows.
+"""
+from bisect import bisect_right
+
+GRAM = 3
+
+
+def _grams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class ShopSearchIndex:
+    """Substring search over item names; prefix matches rank first"""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.names = [item.name.lower() for item in self.items]
+        self.postings = {}
+        for i, name in enumerate(self.names):
+            for gram in _grams(name):
+                self.postings.setdefault(gram, []).append(i)
+        # Items sorted by price, for "which rows changed affordability"
+        self.by_price = sorted(range(len(self.items)), key=lambda i: self.items[i].price)
+        self.prices = [self.items[i].price for i in self.by_price]
+        self._last_query = None
+        self._last_matches = None
+
+    def __len__(self):
+        return len(self.items)
+
+    def _scan(self, query, candidates):
+        names = self.names
+        return [i for i in candidates if query in names[i]]
+
+    def _matches(self, query):
+        if self._last_query is not None and query.startswith(self._last_query):
+            # Typing more characters can only narrow the previous result
+            return self._scan(query, self._last_matches)
+        if len(query) < GRAM:
+            return self._scan(query, range(len(self.names)))
+
+        lists = [self.postings.get(gram) for gram in _grams(query)]
+        if not all(lists):
+            return []
+        lists.sort(key=len)
+        candidates = lists[0]
+        for other in lists[1:4]:
+            keep = set(other)
+            candidates = [i for i in candidates if i in keep]
+        return self._scan(query, candidates)
+
+    def search(self, query):
+        """Item indices whose name contains query (case-insensitive)"""
+        query = query.strip().lower()
+        if not query:
+            self._last_query = self._last_matches = None
+            return list(range(len(self.items)))
+        matches = self._matches(query)
+        self._last_query, self._last_matches = query, matches
+        names = self.names
+        prefix = [i for i in matches if names[i].startswith(query)]
+        if len(prefix) in (0, len(matches)):
+            return matches
+        prefix_set = set(prefix)
+        return prefix + [i for i in matches if i not in prefix_set]
+
+    def price_band(self, low, high):
+        """Indices of items with low < price <= high"""
+        return self.by_price[bisect_right(self.prices, low):bisect_right(self.prices, high)]
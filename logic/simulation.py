@@ -0,0 +1,160 @@
+"""
+Simulation worker that runs the GameManager off the GUI thread
+Every tick publishes an immutable snapshot into a double buffer. The GUI
+reads the latest snapshot and sends actions to the worker as commands.
+"""
+from collections import namedtuple
+import queue
+import threading
+import time
+
+PetSnapshot = namedtuple('PetSnapshot', [
+    'hunger', 'energy', 'mood', 'cleanliness',
+    'level', 'exp', 'exp_to_next_level', 'coins', 'state',
+])
+
+
+class WorldSnapshot(namedtuple('WorldSnapshot', ['tick', 'time', 'pets', 'active_pet_index'])):
+    """Read-only view of the game after one simulation step"""
+    __slots__ = ()
+
+    @property
+    def pet(self):
+        return self.pets[self.active_pet_index]
+
+
+def snapshot_pet(pet):
+    """Copy the displayed fields of a TigerPet (state as its string value)"""
+    return PetSnapshot(
+        hunger=pet.hunger,
+        energy=pet.energy,
+        mood=pet.mood,
+        cleanliness=pet.cleanliness,
+        level=pet.level,
+        exp=pet.exp,
+        exp_to_next_level=pet.exp_to_next_level,
+        coins=pet.coins,
+        state=pet.state.value,
+    )
+
+
+def world_snapshot(game_manager, tick=0):
+    """WorldSnapshot of a GameManager (call from the thread that owns it)"""
+    return WorldSnapshot(
+        tick=tick,
+        time=time.time(),
+        pets=tuple(snapshot_pet(pet) for pet in game_manager.pets),
+        active_pet_index=game_manager.active_pet_index,
+    )
+
+
+class SnapshotBuffer:
+    """Two snapshot slots: the worker fills the back one, then flips"""
+
+    def __init__(self, initial):
+        self._slots = [initial, initial]
+        self._front = 0
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot):
+        with self._lock:
+            back = 1 - self._front
+            self._slots[back] = snapshot
+            self._front = back
+
+    def latest(self):
+        # A single index read; the slot it points at is never written
+        # until the next flip, and snapshots themselves are immutable
+        return self._slots[self._front]
+
+
+class SimulationWorker:
+    """Owns a GameManager on a background thread once started"""
+
+    _STOP = object()
+
+    def __init__(self, game_manager, interval=1.0):
+        self.game_manager = game_manager
+        self.interval = interval
+        self.tick = 0
+        self.last_tick_seconds = 0.0
+        self.buffer = SnapshotBuffer(self._snapshot())
+        self._commands = queue.Queue()
+        self._results = queue.Queue()
+        self._thread = None
+
+    @property
+    def latest(self):
+        """Most recently published WorldSnapshot (safe from any thread)"""
+        return self.buffer.latest()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='simulation', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """Finish queued commands, then end the thread"""
+        if self._thread is not None:
+            self._commands.put(self._STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, tag, func, *args):
+        """Run func(*args) on the worker; its result comes back via poll_results()"""
+        self._commands.put((tag, func, args))
+
+    def poll_results(self):
+        """(tag, result, error) for every command finished since the last poll"""
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def _snapshot(self):
+        return world_snapshot(self.game_manager, self.tick)
+
+    def _execute(self, command):
+        """Run one command; True if it completed"""
+        tag, func, args = command
+        try:
+            self._results.put((tag, func(*args), None))
+            return True
+        except Exception as e:
+            print(f"Simulation command '{tag}' failed: {e}")
+            self._results.put((tag, None, e))
+            return False
+
+    def _step(self):
+        start = time.perf_counter()
+        try:
+            self.game_manager.update()
+        except Exception as e:
+            # Keep ticking; one bad tick must not freeze the GUI on an old snapshot
+            print(f"Simulation tick {self.tick + 1} failed: {e}")
+        self.tick += 1
+        self.last_tick_seconds = time.perf_counter() - start
+
+    def _run(self):
+        next_tick = time.monotonic() + self.interval
+        while True:
+            try:
+                command = self._commands.get(timeout=max(0.0, next_tick - time.monotonic()))
+            except queue.Empty:
+                command = None
+
+            if command is self._STOP:
+                return
+            changed = command is not None and self._execute(command)
+
+            if time.monotonic() >= next_tick:
+                self._step()
+                changed = True
+                next_tick += self.interval
+                # Don't try to catch up after a stall, just resume the cadence
+                if next_tick < time.monotonic():
+                    next_tick = time.monotonic() + self.interval
+            if changed:
+                self.buffer.publish(self._snapshot())
@@ -0,0 +1,135 @@
+"""
+Per-session stat history with plot decimation
+Samples go into growable numpy arrays. For plotting, a min/max envelope
+sized to the chart width is kept up to date incrementally, and LTTB picks
+the final one-point-per-pixel series from the envelope (MinMaxLTTB).
+"""
+import numpy as np
+
+STAT_FIELDS = ('hunger', 'energy', 'mood', 'cleanliness')
+
+
+def lttb(xs, ys, threshold):
+    """Largest-Triangle-Three-Buckets: indices of `threshold` points to keep"""
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    keep = [0]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        # Average of the next bucket is the third triangle vertex
+        next_start, next_end = end, min(int((i + 2) * every) + 1, n)
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+        ax, ay = xs[a], ys[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        keep.append(best)
+        a = best
+    keep.append(n - 1)
+    return keep
+
+
+class MinMaxEnvelope:
+    """Min and max sample of each fixed-size bucket, for every field"""
+
+    def __init__(self, max_buckets):
+        self.max_buckets = max(1, max_buckets)
+        self.bucket_size = 1
+        self.consumed = 0   # raw samples folded in so far
+        self.min_index = np.empty((0, 0), dtype=np.int64)
+        self.max_index = np.empty((0, 0), dtype=np.int64)
+
+    def update(self, values, count):
+        """Fold raw rows [consumed, count) in; only the tail is recomputed"""
+        if count == self.consumed:
+            return
+        while count > self.bucket_size * self.max_buckets:
+            self.bucket_size *= 2
+            self.consumed = 0
+        # Redo the last partial bucket plus everything new
+        first = self.consumed // self.bucket_size
+        start = first * self.bucket_size
+        mins, maxs = self._reduce(values, start, count)
+        self.min_index = np.concatenate([self.min_index[:first].reshape(-1, values.shape[1]), mins])
+        self.max_index = np.concatenate([self.max_index[:first].reshape(-1, values.shape[1]), maxs])
+        self.consumed = count
+
+    def _reduce(self, values, start, end):
+        size = self.bucket_size
+        full = (end - start) // size
+        parts_min, parts_max = [], []
+        if full:
+            block = values[start:start + full * size].reshape(full, size, -1)
+            offsets = start + np.arange(full)[:, None] * size
+            parts_min.append(block.argmin(axis=1) + offsets)
+            parts_max.append(block.argmax(axis=1) + offsets)
+        tail = start + full * size
+        if tail < end:
+            block = values[tail:end]
+            parts_min.append(block.argmin(axis=0)[None, :] + tail)
+            parts_max.append(block.argmax(axis=0)[None, :] + tail)
+        return np.concatenate(parts_min), np.concatenate(parts_max)
+
+
+class StatHistory:
+    """Time series of pet stats for one session"""
+
+    def __init__(self, fields=STAT_FIELDS, capacity=4096):
+        self.fields = tuple(fields)
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.values = np.empty((capacity, len(self.fields)), dtype=np.float32)
+        self.count = 0
+        self._envelopes = {}  # width -> MinMaxEnvelope
+
+    def __len__(self):
+        return self.count
+
+    def append(self, t, values):
+        """Add one sample; values is a sequence in `fields` order"""
+        if self.count == len(self.times):
+            size = len(self.times) * 2
+            self.times = np.resize(self.times, size)
+            self.values = np.resize(self.values, (size, len(self.fields)))
+        self.times[self.count] = t
+        self.values[self.count] = values
+        self.count += 1
+
+    def record(self, t, pet):
+        """Add a sample from any object with the stat attributes"""
+        self.append(t, [getattr(pet, field) for field in self.fields])
+
+    def clear(self):
+        self.count = 0
+        self._envelopes.clear()
+
+    def decimated(self, field, width):
+        """(times, values) lists with at most `width` points for plotting"""
+        n = self.count
+        column = self.fields.index(field)
+        if n <= width:
+            return self.times[:n].tolist(), self.values[:n, column].tolist()
+
+        envelope = self._envelopes.get(width)
+        if envelope is None:
+            if len(self._envelopes) >= 4:
+                self._envelopes.clear()  # stale widths from resizing
+            envelope = self._envelopes[width] = MinMaxEnvelope(width)
+        envelope.update(self.values[:n], n)
+
+        # Each bucket contributes its min and max, in time order
+        lo = envelope.min_index[:, column]
+        hi = envelope.max_index[:, column]
+        picks = np.stack([np.minimum(lo, hi), np.maximum(lo, hi)], axis=1).ravel()
+        picks = picks[np.concatenate([[True], picks[1:] != picks[:-1]])]
+        xs = self.times[picks].tolist()
+        ys = self.values[picks, column].tolist()
+        keep = lttb(xs, ys, width)
+        return [xs[i] for i in keep], [ys[i] for i in keep]
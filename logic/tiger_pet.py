@@ -2,23 +2,18 @@
 Tiger pet class with state machine and attributes
 Updated with Coins system and Random Messages
 """
-from enum import Enum
 import math
-import random
 
-class PetState(Enum):
-    """Pet emotional states"""
-    HAPPY = "happy"
-    NEUTRAL = "neutral"
-    HUNGRY = "hungry"
-    TIRED = "tired"
-    DIRTY = "dirty"
-    SAD = "sad"
+from logic.pet_state import PetState
+from logic.rules import RULES
 
 class TigerPet:
     """Main pet class with all attributes and behaviors"""
     
     def __init__(self):
+        # 'level'/'exp'/'coins' -> callables(pet, field) told when it changes (leaderboards)
+        self.listeners = {}
+        
         # Core stats (0-100)
         self.hunger = 100.0
         self.energy = 100.0
@@ -41,6 +36,26 @@ class TigerPet:
         self.mood_decay_rate = 0.06
         self.cleanliness_decay_rate = 0.04
         
+    def watch(self, field, listener):
+        """Call listener(pet, field) whenever 'level', 'exp' or 'coins' changes (leaderboards)"""
+        self.listeners.setdefault(field, []).append(listener)
+            
+    def unwatch(self, field, listener):
+        listeners = self.listeners[field]
+        listeners.remove(listener)
+        if not listeners:
+            del self.listeners[field]
+            
+    def set_coins(self, coins):
+        """Assign coins and tell 'coins' listeners (shop purchases, admin edits)"""
+        self.coins = coins
+        if self.listeners:
+            self._changed('coins')
+            
+    def _changed(self, field):
+        for listener in self.listeners.get(field, ()):
+            listener(self, field)
+        
     def update(self, delta_time=1.0):
         """Update pet state (called every game tick)"""
         self.age += delta_time
@@ -51,110 +66,58 @@ class TigerPet:
         self.mood = max(0, self.mood - self.mood_decay_rate * delta_time)
         self.cleanliness = max(0, self.cleanliness - self.cleanliness_decay_rate * delta_time)
         
-        # Mood modifiers
-        mood_modifier = 0
-        if self.hunger < 30: mood_modifier -= 0.2
-        if self.energy < 30: mood_modifier -= 0.15
-        if self.cleanliness < 30: mood_modifier -= 0.1
+        # Mood modifiers, state and health come from the compiled balance rules
+        mood_modifier = RULES.mood_modifier(self)
             
         self.mood = max(0, self.mood + mood_modifier * delta_time)
-        self._update_state()
+        self.state = RULES.state_of(self)
         
         # Passive exp gain
-        if self._is_healthy():
-            self.add_exp(0.1 * delta_time)
+        if RULES.is_healthy(self):
+            self.add_exp(RULES.passive_exp * delta_time)
             
     def _update_state(self):
-        if self.hunger < 20: self.state = PetState.HUNGRY
-        elif self.energy < 20: self.state = PetState.TIRED
-        elif self.cleanliness < 20: self.state = PetState.DIRTY
-        elif self.mood < 30: self.state = PetState.SAD
-        elif self.mood > 70 and self.hunger > 50 and self.energy > 50:
-            self.state = PetState.HAPPY
-        else:
-            self.state = PetState.NEUTRAL
+        self.state = RULES.state_of(self)
             
     def _is_healthy(self):
-        return (self.hunger > 40 and self.energy > 40 and 
-                self.mood > 40 and self.cleanliness > 30)
+        return RULES.is_healthy(self)
                 
+    # Care actions; refusals, effects, exp and messages live in balance_rules.json
     def feed(self):
-        if self.hunger >= 90:
-            return False, "Tiger says: No thanks, I'm full! 🍖"
-            
-        self.hunger = min(100, self.hunger + 40)
-        self.add_exp(5)
-        
-        # Random messages
-        messages = [
-            "Delicious! Tiger is happy! 🍖",
-            "Nom nom nom! So tasty! 😋",
-            "Tiger devoured the meat! 🐯",
-            "Best meal ever! ⭐"
-        ]
-        return True, random.choice(messages)
+        return RULES.actions['feed'](self)
         
     def clean(self):
-        if self.cleanliness >= 90:
-            return False, "Tiger is already sparkling clean! ✨"
-            
-        self.cleanliness = min(100, self.cleanliness + 50)
-        self.mood = min(100, self.mood + 10)
-        self.add_exp(3)
-        
-        messages = [
-            "Sparkly clean! Tiger feels fresh! ✨",
-            "Scrub scrub! All dirt gone! 🛁",
-            "Tiger loves bubbles! 🧼"
-        ]
-        return True, random.choice(messages)
+        return RULES.actions['clean'](self)
         
     def sleep(self):
-        if self.energy >= 90:
-            return False, "Tiger is not tired at all! ⚡"
-            
-        self.energy = min(100, self.energy + 60)
-        self.mood = min(100, self.mood + 15)
-        self.add_exp(4)
-        
-        messages = [
-            "Zzz... Tiger had a good nap! 😴",
-            "Tiger is dreaming of chasing butterflies... 🦋",
-            "Fully recharged! 🔋"
-        ]
-        return True, random.choice(messages)
+        return RULES.actions['sleep'](self)
         
     def play(self):
-        if self.energy < 20:
-            return False, "Tiger is too tired to play! 😫"
-            
-        self.mood = min(100, self.mood + 30)
-        self.energy = max(0, self.energy - 15)
-        self.hunger = max(0, self.hunger - 10)
-        self.add_exp(8)
-        
-        messages = [
-            "So much fun! Tiger is happy! 🎾",
-            "Rawr! Tiger caught the toy! 🧸",
-            "Zoomies! Tiger is running around! 🏃"
-        ]
-        return True, random.choice(messages)
+        return RULES.actions['play'](self)
         
     def add_exp(self, amount):
         self.exp += amount
         # Earn coins based on XP
         coin_gain = amount * 0.5
-        if coin_gain >= 1 or (self.age % 10 < 0.1): # Only add integer amounts or accumulate
+        paid = coin_gain >= 1 or (self.age % 10 < 0.1)
+        if paid: # Only add integer amounts or accumulate
              self.coins += coin_gain
         
         while self.exp >= self.exp_to_next_level:
             self.level_up()
+        if self.listeners:
+            if paid:
+                self._changed('coins')
+            self._changed('exp')
             
     def level_up(self):
         self.exp -= self.exp_to_next_level
         self.level += 1
         self.coins += 50 # Bonus coins on level up
         self.exp_to_next_level = math.floor(100 * (1.2 ** (self.level - 1)))
+        if self.listeners:
+            self._changed('level')
+            self._changed('coins')
         
         self.hunger = min(100, self.hunger + 20)
         self.energy = min(100, self.energy + 20)
@@ -200,4 +163,8 @@ class TigerPet:
         self.energy_decay_rate = data.get('energy_decay_rate', 0.1)
         self.mood_decay_rate = data.get('mood_decay_rate', 0.08)
         self.cleanliness_decay_rate = data.get('cleanliness_decay_rate', 0.05)
-        self._update_state()
\ No newline at end of file
+        self._update_state()
+        if self.listeners:
+            self._changed('level')
+            self._changed('exp')
+            self._changed('coins')
@@ -1,13 +1,75 @@
 """
 Macan Ternak - 3D Pet Simulator
 Entry point for the application
+
+    python main.py [--profile-startup] [--profile] [--metrics-port PORT] [--metrics-file PATH]
+                   [--memory-diagnostics] [--memory-budget MB]
+
+Heavy modules (OpenGL, the 3D viewport) are imported after the window
+shell is on screen; --profile-startup prints per-module import times and
+startup stage timings once the first 3D frame is shown. The --metrics
+options enable the metrics registry and expose it over local HTTP
+(Prometheus text format) and/or as a file rewritten every 15 seconds.
+--profile (or MACAN_PROFILE=1) runs the sampling profiler from launch;
+Ctrl+Shift+P toggles it at any time. --memory-diagnostics traces Python
+allocations per package and writes a report every minute (--memory-budget
+sets the warning threshold, 100 MB by default).
 """
 import sys
-from PySide6.QtWidgets import QApplication
-from app.game_window import GameWindow
+
+def _pop_option(name):
+    """Remove `name VALUE` from sys.argv and return VALUE (None if absent)"""
+    if name not in sys.argv:
+        return None
+    i = sys.argv.index(name)
+    value = sys.argv[i + 1] if i + 1 < len(sys.argv) else None
+    del sys.argv[i:i + 2]
+    return value
+
+def _start_metrics(port, path):
+    from services.metrics import REGISTRY, MetricsServer, MetricsDumper
+    exporters = []
+    if port is None and path is None:
+        return exporters
+    REGISTRY.enabled = True
+    if port is not None:
+        server = MetricsServer(REGISTRY, int(port)).start()
+        print(f"Metrics at http://127.0.0.1:{server.port}/metrics")
+        exporters.append(server)
+    if path is not None:
+        exporters.append(MetricsDumper(path, REGISTRY).start())
+    return exporters
 
 def main():
     """Initialize and run the application"""
+    # Tracing starts first so import-time allocations are attributed too
+    memory = None
+    budget = _pop_option('--memory-budget')
+    if '--memory-diagnostics' in sys.argv or budget is not None:
+        if '--memory-diagnostics' in sys.argv:
+            sys.argv.remove('--memory-diagnostics')
+        from services.memory import MemoryMonitor, MEMORY_BUDGET_MB
+        memory = MemoryMonitor(budget_mb=float(budget or MEMORY_BUDGET_MB))
+        memory.start()
+    
+    from services.startup_profiler import StartupProfiler
+    profiler = StartupProfiler(enabled='--profile-startup' in sys.argv)
+    if profiler.enabled:
+        sys.argv.remove('--profile-startup')
+    profiler.install()
+    exporters = _start_metrics(_pop_option('--metrics-port'), _pop_option('--metrics-file'))
+    
+    from services.profiler import SamplingProfiler, enabled_by_env
+    sampler = SamplingProfiler()
+    if '--profile' in sys.argv or enabled_by_env():
+        if '--profile' in sys.argv:
+            sys.argv.remove('--profile')
+        sampler.start()
+    
+    with profiler.stage('import Qt + app shell'):
+        from PySide6.QtWidgets import QApplication
+        from app.game_window import GameWindow
+    
     app = QApplication(sys.argv)
     app.setApplicationName("Macan Ternak")
     app.setOrganizationName("MacanAngkasa")
@@ -16,10 +78,17 @@ def main():
     app.setStyle("Fusion")
     
     # Create and show main window
-    window = GameWindow()
+    window = GameWindow(profiler=profiler, sampler=sampler)
     window.show()
     
-    sys.exit(app.exec())
+    status = app.exec()
+    for exporter in exporters:
+        exporter.stop()
+    if memory is not None:
+        report = memory.stop()
+        if report is not None:
+            print(f"Memory report: {report['path']}")
+    sys.exit(status)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
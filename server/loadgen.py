@@ -0,0 +1,169 @@
+"""
+Load generator for the pet server
+Opens keep-alive connections that issue a mix of state reads, care actions
+and purchases for a pool of players, then reports requests per second,
+request latency percentiles and the server's own tick latency.
+
+Usage:
+    python -m server.loadgen --port 8765 --players 10000 --connections 64 --duration 10
+    python -m server.loadgen --spawn --players 50000 --json load.json
+"""
+import argparse
+import asyncio
+from collections import Counter
+import json
+import random
+import sys
+import tempfile
+import time
+
+from engine3d.frame_stats import percentile
+from server.protocol import encode_request, read_response
+
+# (weight, method, path suffix, body)
+REQUEST_MIX = (
+    (60, 'GET', '', None),
+    (8, 'POST', '/feed', None),
+    (8, 'POST', '/clean', None),
+    (8, 'POST', '/sleep', None),
+    (8, 'POST', '/play', None),
+    (8, 'POST', '/buy', {'item': 4}),
+)
+
+
+class Connection:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(encode_request(method, path, payload, self.host))
+        await self.writer.drain()
+        status, headers, body = await read_response(self.reader)
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, body
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+async def create_players(host, port, players, connections):
+    """PUT every player so the run measures steady-state traffic"""
+    queue = list(range(players))
+
+    async def worker():
+        connection = Connection(host, port)
+        while queue:
+            player = queue.pop()
+            while (await connection.request('PUT', f'/pets/player{player}'))[0] == 503:
+                await asyncio.sleep(0.05)  # too many saves loading; retry
+        connection.close()
+    await asyncio.gather(*(worker() for _ in range(min(connections, players))))
+
+
+async def run_load(host, port, players, connections, duration, seed=1):
+    weights = [entry[0] for entry in REQUEST_MIX]
+    latencies = []
+    statuses = Counter()
+    deadline = time.perf_counter() + duration
+
+    async def worker(index):
+        rng = random.Random(seed + index)
+        connection = Connection(host, port)
+        while time.perf_counter() < deadline:
+            _, method, suffix, payload = rng.choices(REQUEST_MIX, weights)[0]
+            path = f'/pets/player{rng.randrange(players)}{suffix}'
+            start = time.perf_counter()
+            try:
+                status, _ = await connection.request(method, path, payload)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                connection.close()
+                statuses['error'] += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            if status == 503:
+                await asyncio.sleep(0.05)  # honour backpressure
+        connection.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    stats_connection = Connection(host, port)
+    _, body = await stats_connection.request('GET', '/stats')
+    stats_connection.close()
+    server_stats = json.loads(body)
+
+    latencies.sort()
+    return {
+        'players': players,
+        'connections': connections,
+        'duration_s': elapsed,
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'latency_p50_ms': percentile(latencies, 50) * 1000,
+        'latency_p95_ms': percentile(latencies, 95) * 1000,
+        'latency_p99_ms': percentile(latencies, 99) * 1000,
+        'statuses': {str(k): v for k, v in sorted(statuses.items(), key=str)},
+        'server': server_stats,
+    }
+
+
+async def _spawned(args):
+    """Run an in-process server in a temp directory for self-contained measurements"""
+    from server.pet_server import PetServer, PetService
+    with tempfile.TemporaryDirectory() as save_dir:
+        server = PetServer(PetService(save_dir, tick_interval=args.tick))
+        port = await server.start('127.0.0.1', 0)
+        try:
+            return await _measure('127.0.0.1', port, args)
+        finally:
+            await server.close()
+
+
+async def _measure(host, port, args):
+    print(f"Creating {args.players} players...")
+    await create_players(host, port, args.players, args.connections)
+    print(f"Running {args.connections} connections for {args.duration:.0f} s...")
+    return await run_load(host, port, args.players, args.connections, args.duration)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pet server load generator")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--players', type=int, default=1000)
+    parser.add_argument('--connections', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--spawn', action='store_true', help="start a server in this process")
+    parser.add_argument('--tick', type=float, default=1.0, help="tick interval of a spawned server")
+    parser.add_argument('--json', help="write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    if args.spawn:
+        result = asyncio.run(_spawned(args))
+    else:
+        result = asyncio.run(_measure(args.host, args.port, args))
+
+    server = result['server']
+    print(f"{result['requests']} requests in {result['duration_s']:.1f} s: {result['rps']:.0f} req/s")
+    print(f"latency p50 {result['latency_p50_ms']:.2f} ms  p95 {result['latency_p95_ms']:.2f} ms  "
+          f"p99 {result['latency_p99_ms']:.2f} ms  statuses {result['statuses']}")
+    print(f"server: {server['tenants']} players, tick p50 {server['tick_p50_ms']:.1f} ms  "
+          f"p95 {server['tick_p95_ms']:.1f} ms  max {server['tick_max_ms']:.1f} ms  "
+          f"rejected {server['rejected']}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,491 @@
+"""
+Headless multi-tenant pet server
+Hosts one GameManager per player in a single asyncio process. A shared
+scheduler advances every pet once per tick in slices, so requests are
+served between slices. Saves are written in batches on a worker thread,
+and players whose saves would queue too deep on that thread are turned
+away with 503 instead of queueing without bound.
+
+Usage:
+    python -m server.pet_server --port 8765 --save-dir /var/lib/macan
+"""
+import argparse
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import re
+import sys
+import time
+
+from engine3d.frame_stats import percentile
+from logic.game_manager import GameManager
+from logic.leaderboard import PetLeaderboards
+from logic.rules import RULES
+from logic.shop import Shop
+from server.protocol import (OP_BINARY, OP_CLOSE, OP_PING, OP_PONG, OP_TEXT, ProtocolError,
+                             encode_frame, encode_response, json_response, read_frame, read_request,
+                             websocket_handshake)
+from server.sync import SyncError, SyncPeer, SyncSource, decode_ack
+from services.metrics import REGISTRY
+from services.save_manager import SaveManager
+
+TICK_INTERVAL = 1.0
+SAVE_INTERVAL = 30.0
+TICK_SLICE = 2000       # managers advanced between yields to the event loop
+SAVE_BATCH = 500        # saves handed to the writer thread at once
+MAX_PENDING_LOADS = 256  # saves waiting on the writer thread before new players get 503
+MAX_CONNECTIONS = 4096
+LEADERBOARDS = ('level', 'coins')  # an exp board would re-rank every healthy pet every tick
+MAX_LEADERBOARD_ROWS = 100
+TENANT_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+ACTIONS = {
+    'feed': GameManager.feed_pet,
+    'clean': GameManager.clean_pet,
+    'sleep': GameManager.sleep_pet,
+    'play': GameManager.play_with_pet,
+}
+
+SERVER_TICK_SECONDS = REGISTRY.histogram('macan_server_tick_seconds', 'Time to advance every hosted pet')
+SAVE_BATCH_SECONDS = REGISTRY.histogram('macan_server_save_batch_seconds', 'Time to write one save batch')
+REQUESTS = REGISTRY.counter('macan_server_requests', 'HTTP requests by status', ('status',))
+TENANTS = REGISTRY.gauge('macan_server_tenants', 'Players hosted by this server')
+
+
+class Overloaded(Exception):
+    """Too much work queued; the client should retry later (503)"""
+
+
+def _offer(queue, item):
+    """Put into a 1-slot queue, replacing anything the consumer hasn't taken yet"""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+class PetService:
+    """Tenants, the tick scheduler and batched persistence (no networking)"""
+
+    def __init__(self, save_dir, tick_interval=TICK_INTERVAL, save_interval=SAVE_INTERVAL,
+                 tick_slice=TICK_SLICE, save_batch=SAVE_BATCH, max_pending_loads=MAX_PENDING_LOADS):
+        self.save_dir = Path(save_dir)
+        self.tick_interval = tick_interval
+        self.save_interval = save_interval
+        self.tick_slice = tick_slice
+        self.save_batch = save_batch
+        self.max_pending_loads = max_pending_loads
+        self.shop = Shop()
+        self.tenants = {}               # name -> GameManager
+        self.leaderboards = PetLeaderboards(LEADERBOARDS)  # entries are (name, pet index)
+        self.subscribers = {}           # name -> set of 1-slot asyncio.Queue
+        self.sync_subscribers = {}      # name -> set of 1-slot asyncio.Queue
+        self.sync_sources = {}          # name -> SyncSource while anyone syncs it
+        self.tick = 0
+        self.tick_seconds = deque(maxlen=600)
+        self.saves_written = 0
+        self._opening = {}              # name -> Future while its save is read
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='save-batch')
+        self._tasks = []
+
+    # Tenants
+
+    async def open(self, name):
+        """GameManager for a player, loading their save on first use"""
+        if not TENANT_PATTERN.match(name):
+            raise ValueError(f"invalid player id {name!r}")
+        manager = self.tenants.get(name)
+        if manager is not None:
+            return manager
+        pending = self._opening.get(name)
+        if pending is None:
+            # Loads share the single writer thread with save batches
+            if len(self._opening) >= self.max_pending_loads:
+                raise Overloaded(f"{len(self._opening)} saves already loading")
+            pending = self._opening[name] = asyncio.ensure_future(self._load(name))
+        try:
+            return await asyncio.shield(pending)
+        finally:
+            self._opening.pop(name, None)
+
+    async def _load(self, name):
+        manager = GameManager(SaveManager(self.save_dir / f'{name}.json'))
+        await asyncio.get_running_loop().run_in_executor(self._writer, manager.load_game)
+        manager.last_update_time = time.time()
+        if self.tenants.setdefault(name, manager) is manager:
+            for index, pet in enumerate(manager.pets):
+                self.leaderboards.add(pet, (name, index))
+        TENANTS.set(len(self.tenants))
+        return self.tenants[name]
+
+    def state(self, name):
+        manager = self.tenants[name]
+        return {
+            'player': name,
+            'tick': self.tick,
+            'active_pet_index': manager.active_pet_index,
+            'pets': [dict(pet.to_dict(), state=pet.state.value) for pet in manager.pets],
+        }
+
+    def leaderboard(self, board, first, stop):
+        rows = self.leaderboards[board].window(first, stop)
+        return [{'rank': rank, 'player': entry[0], 'pet': entry[1], 'score': score}
+                for rank, entry, score in rows]
+
+    def act(self, name, action):
+        """Run a care action on the player's active pet -> (success, message)"""
+        return ACTIONS[action](self.tenants[name])
+
+    def buy(self, name, item):
+        """Buy a shop item by index or name -> (success, message, coins)"""
+        items = self.shop.items
+        if isinstance(item, int) and not isinstance(item, bool) and 0 <= item < len(items):
+            chosen = items[item]
+        else:
+            chosen = next((i for i in items if i.name == item), None)
+        if chosen is None:
+            return False, "Unknown item", self.tenants[name].pet.coins
+        return self.shop.buy_item(chosen, self.tenants[name].pet)
+
+    # Scheduler
+
+    def start(self):
+        self._tasks = [asyncio.ensure_future(self._tick_loop()),
+                       asyncio.ensure_future(self._save_loop())]
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.save_all()
+        self._writer.shutdown(wait=True)
+
+    async def _tick_loop(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + self.tick_interval
+        while True:
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            try:
+                RULES.reload_if_changed()
+                await self.advance(self.tick_interval)
+            except Exception as e:
+                # One bad tick must not end ticking for every tenant
+                print(f"Tick {self.tick + 1} failed: {e}")
+            next_tick += self.tick_interval
+            if next_tick < loop.time():
+                next_tick = loop.time() + self.tick_interval  # overloaded: drop ticks, don't burst
+
+    async def advance(self, delta_time):
+        """One shared tick over every tenant, yielding between slices"""
+        start = time.perf_counter()
+        managers = list(self.tenants.values())
+        for i in range(0, len(managers), self.tick_slice):
+            for manager in managers[i:i + self.tick_slice]:
+                manager.advance(delta_time)
+            await asyncio.sleep(0)
+        self.tick += 1
+        elapsed = time.perf_counter() - start
+        self.tick_seconds.append(elapsed)
+        SERVER_TICK_SECONDS.observe(elapsed)
+        self._publish()
+
+    def _publish(self):
+        """Latest state to each WebSocket subscriber; slow ones skip stale ticks"""
+        for name, queues in self.subscribers.items():
+            payload = json.dumps(self.state(name), separators=(',', ':'))
+            for queue in queues:
+                _offer(queue, payload)
+        for name, queues in self.sync_subscribers.items():
+            manager = self.tenants[name]
+            version = self.sync_sources[name].commit(manager.pets, manager.active_pet_index)
+            for queue in queues:
+                _offer(queue, version)
+
+    async def _save_loop(self):
+        while True:
+            await asyncio.sleep(self.save_interval)
+            await self.save_all()
+
+    async def save_all(self):
+        """Serialize on the loop (consistent state), write on the worker thread"""
+        loop = asyncio.get_running_loop()
+        names = list(self.tenants)
+        for i in range(0, len(names), self.save_batch):
+            batch = []
+            for name in names[i:i + self.save_batch]:
+                manager = self.tenants[name]
+                batch.append((manager.save_manager, manager.save_data()))
+            await loop.run_in_executor(self._writer, self._write_batch, batch)
+
+    def _write_batch(self, batch):
+        start = time.perf_counter()
+        for save_manager, data in batch:
+            save_manager.save_game(data)
+        self.saves_written += len(batch)
+        SAVE_BATCH_SECONDS.observe(time.perf_counter() - start)
+
+    def stats(self):
+        recent = sorted(self.tick_seconds)
+        return {
+            'tenants': len(self.tenants),
+            'pets': sum(len(manager.pets) for manager in self.tenants.values()),
+            'tick': self.tick,
+            'tick_p50_ms': percentile(recent, 50) * 1000,
+            'tick_p95_ms': percentile(recent, 95) * 1000,
+            'tick_max_ms': (recent[-1] if recent else 0.0) * 1000,
+            'saves_written': self.saves_written,
+            'pending_loads': len(self._opening),
+        }
+
+
+class PetServer:
+    """HTTP + WebSocket front end for a PetService"""
+
+    def __init__(self, service, max_connections=MAX_CONNECTIONS):
+        self.service = service
+        self.max_connections = max_connections
+        self.connections = 0
+        self.rejected = 0
+        self.server = None
+
+    async def start(self, host='127.0.0.1', port=8765):
+        self.service.start()
+        self.server = await asyncio.start_server(self._connection, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.service.close()
+
+    async def _connection(self, reader, writer):
+        self.connections += 1
+        try:
+            if self.connections > self.max_connections:
+                self.rejected += 1
+                writer.write(json_response(503, {'error': 'too many connections'}, keep_alive=False,
+                                           headers={'Retry-After': '1'}))
+                return
+            while True:
+                try:
+                    request = await read_request(reader)
+                except ProtocolError as e:
+                    writer.write(json_response(400, {'error': str(e)}, keep_alive=False))
+                    return
+                if request is None:
+                    return
+                if request.headers.get('upgrade', '').lower() == 'websocket':
+                    await self._websocket(request, reader, writer)
+                    return
+                writer.write(await self._respond(request))
+                await writer.drain()  # a client that stops reading stops getting served
+                if not request.keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _respond(self, request):
+        headers = {}
+        try:
+            status, payload = await self._route(request)
+        except ProtocolError as e:
+            status, payload = 400, {'error': str(e)}
+        except ValueError as e:
+            status, payload = 400, {'error': str(e)}
+        except Overloaded as e:
+            self.rejected += 1
+            status, payload, headers = 503, {'error': f'overloaded: {e}'}, {'Retry-After': '1'}
+        if REGISTRY.enabled:
+            REQUESTS.labels(str(status)).inc()
+        if isinstance(payload, bytes):
+            return encode_response(status, payload, content_type='text/plain; version=0.0.4',
+                                   keep_alive=request.keep_alive)
+        return json_response(status, payload, headers=headers, keep_alive=request.keep_alive)
+
+    async def _route(self, request):
+        """(status, JSON-able payload or bytes) for one request"""
+        parts = [p for p in request.path.split('/') if p]
+        method = request.method
+        service = self.service
+        if parts == ['health']:
+            return 200, {'ok': True}
+        if parts == ['stats']:
+            return 200, dict(service.stats(), rejected=self.rejected, connections=self.connections)
+        if parts == ['metrics']:
+            return 200, REGISTRY.render().encode('utf-8')
+        if len(parts) == 2 and parts[0] == 'leaderboard' and method == 'GET':
+            if parts[1] not in LEADERBOARDS:
+                return 404, {'error': f"boards: {', '.join(LEADERBOARDS)}"}
+            top = min(int(request.query.get('top', 10)), MAX_LEADERBOARD_ROWS)
+            return 200, {'board': parts[1], 'entries': service.leaderboard(parts[1], 1, top + 1)}
+        if len(parts) < 2 or parts[0] != 'pets':
+            return 404, {'error': 'not found'}
+
+        name = parts[1]
+        if len(parts) == 2 and method == 'PUT':
+            created = name not in service.tenants
+            await service.open(name)
+            return (201 if created else 200), service.state(name)
+        if name not in service.tenants:
+            return 404, {'error': f'no player {name}; PUT /pets/{name} first'}
+        if len(parts) == 2 and method == 'GET':
+            return 200, service.state(name)
+        if parts[2:] == ['rank'] and method == 'GET':
+            board = request.query.get('board', 'level')
+            if board not in LEADERBOARDS:
+                return 404, {'error': f"boards: {', '.join(LEADERBOARDS)}"}
+            radius = min(int(request.query.get('radius', 5)), MAX_LEADERBOARD_ROWS // 2)
+            rank = service.leaderboards[board].rank((name, service.tenants[name].active_pet_index))
+            return 200, {'board': board, 'rank': rank,
+                         'around': service.leaderboard(board, max(1, rank - radius), rank + radius + 1)}
+        if len(parts) == 3 and method == 'POST':
+            action = parts[2]
+            if action in ACTIONS:
+                success, message = service.act(name, action)
+                state = service.state(name)
+                return 200, {'success': success, 'message': message,
+                             'pet': state['pets'][state['active_pet_index']]}
+            if action == 'buy':
+                body = request.json()
+                if not isinstance(body, dict):
+                    return 400, {'error': 'expected a JSON object like {"item": 0}'}
+                success, message, coins = service.buy(name, body.get('item'))
+                return 200, {'success': success, 'message': message, 'coins': coins}
+        return 405 if len(parts) <= 3 else 404, {'error': 'unsupported'}
+
+    async def _websocket(self, request, reader, writer):
+        """Push state every tick; accept {"action": ...} messages
+
+        /pets/{player}/ws pushes the full state as JSON. /pets/{player}/sync
+        pushes binary server.sync keyframes and deltas, and expects binary
+        acknowledgements of the versions the client has applied.
+        """
+        parts = [p for p in request.path.split('/') if p]
+        if len(parts) != 3 or parts[0] != 'pets' or parts[2] not in ('ws', 'sync'):
+            writer.write(json_response(404, {'error': 'not found'}, keep_alive=False))
+            return
+        name = parts[1]
+        service = self.service
+        try:
+            await service.open(name)
+        except ValueError as e:
+            writer.write(json_response(400, {'error': str(e)}, keep_alive=False))
+            return
+        except Overloaded as e:
+            self.rejected += 1
+            writer.write(json_response(503, {'error': f'overloaded: {e}'}, keep_alive=False,
+                                       headers={'Retry-After': '1'}))
+            return
+        writer.write(websocket_handshake(request))
+        queue = asyncio.Queue(maxsize=1)
+        if parts[2] == 'sync':
+            source = service.sync_sources.get(name)
+            if source is None:
+                source = service.sync_sources[name] = SyncSource()
+            manager = service.tenants[name]
+            queue.put_nowait(source.commit(manager.pets, manager.active_pet_index))
+            peer = SyncPeer()
+            subscribers = service.sync_subscribers
+            sender = asyncio.ensure_future(self._sync_send(queue, writer, source, peer))
+        else:
+            peer = None
+            subscribers = service.subscribers
+            sender = asyncio.ensure_future(self._ws_send(queue, writer))
+        subscribers.setdefault(name, set()).add(queue)
+        try:
+            while True:
+                opcode, payload = await read_frame(reader)
+                if opcode == OP_CLOSE:
+                    writer.write(encode_frame(OP_CLOSE))
+                    return
+                if opcode == OP_PING:
+                    writer.write(encode_frame(OP_PONG, payload))
+                elif opcode == OP_BINARY and peer is not None:
+                    source.ack(peer, decode_ack(payload))
+                elif opcode == OP_TEXT:
+                    writer.write(encode_frame(OP_TEXT, json.dumps(self._ws_message(name, payload))))
+                await writer.drain()
+        except (ProtocolError, SyncError, asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            sender.cancel()
+            queues = subscribers[name]
+            queues.discard(queue)
+            if not queues:
+                del subscribers[name]
+                if peer is not None:
+                    del service.sync_sources[name]
+
+    def _ws_message(self, name, payload):
+        try:
+            message = json.loads(payload)
+            action = message.get('action')
+            if isinstance(action, str) and action in ACTIONS:
+                success, text = self.service.act(name, action)
+                return {'action': action, 'success': success, 'message': text}
+            if action == 'buy':
+                success, text, coins = self.service.buy(name, message.get('item'))
+                return {'action': action, 'success': success, 'message': text, 'coins': coins}
+        except (ValueError, AttributeError):
+            pass
+        return {'error': 'expected {"action": "feed|clean|sleep|play|buy"}'}
+
+    @staticmethod
+    async def _ws_send(queue, writer):
+        while True:
+            payload = await queue.get()
+            writer.write(encode_frame(OP_TEXT, payload))
+            await writer.drain()
+
+    @staticmethod
+    async def _sync_send(queue, writer, source, peer):
+        while True:
+            await queue.get()
+            message = source.encode(peer)
+            if message is not None:
+                writer.write(encode_frame(OP_BINARY, message))
+                await writer.drain()
+
+
+async def serve(args):
+    service = PetService(args.save_dir, tick_interval=args.tick, save_interval=args.save_interval,
+                         max_pending_loads=args.max_pending_loads)
+    server = PetServer(service, max_connections=args.max_connections)
+    port = await server.start(args.host, args.port)
+    for i in range(args.preload):
+        await service.open(f'player{i}')
+    print(f"Pet server on http://{args.host}:{port} ({len(service.tenants)} players)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless multi-tenant pet server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--save-dir', default=os.path.join(Path.home(), '.macan_ternak', 'server'))
+    parser.add_argument('--tick', type=float, default=TICK_INTERVAL, help="seconds per shared tick")
+    parser.add_argument('--save-interval', type=float, default=SAVE_INTERVAL)
+    parser.add_argument('--max-pending-loads', type=int, default=MAX_PENDING_LOADS,
+                        help="players waiting for their save to load before new ones get 503")
+    parser.add_argument('--max-connections', type=int, default=MAX_CONNECTIONS)
+    parser.add_argument('--preload', type=int, default=0, help="open player0..N-1 at startup")
+    parser.add_argument('--metrics', action='store_true', help="record metrics for GET /metrics")
+    args = parser.parse_args(argv)
+    REGISTRY.enabled = args.metrics
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
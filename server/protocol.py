@@ -0,0 +1,203 @@
+"""
+Minimal HTTP/1.1 and WebSocket framing over asyncio streams
+Just enough for the pet server and its load generator: keep-alive JSON
+requests with Content-Length bodies, and RFC 6455 text/binary/close/ping
+frames.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import struct
+from urllib.parse import parse_qs, urlsplit
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024
+WS_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+REASONS = {
+    200: 'OK', 201: 'Created', 101: 'Switching Protocols', 400: 'Bad Request',
+    404: 'Not Found', 405: 'Method Not Allowed', 409: 'Conflict', 413: 'Payload Too Large',
+    429: 'Too Many Requests', 503: 'Service Unavailable',
+}
+
+
+class ProtocolError(Exception):
+    """Malformed or oversized request; the connection is closed"""
+
+
+class Request:
+    def __init__(self, method, target, headers, body):
+        self.method = method
+        parts = urlsplit(target)
+        self.path = parts.path
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self):
+        return self.headers.get('connection', '').lower() != 'close'
+
+    def json(self):
+        if not self.body:
+            return {}
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            raise ProtocolError("body is not valid JSON")
+
+
+def _parse_head(head):
+    """(start line, {lowercase name: value}) of a request or response head"""
+    lines = head.decode('latin-1').split('\r\n')
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+async def _read_head(reader):
+    """Header block, or None when the peer closed between messages"""
+    try:
+        return await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise ProtocolError("headers too large")
+
+
+async def _read_body(reader, headers):
+    length = int(headers.get('content-length', 0) or 0)
+    if length > MAX_BODY_BYTES:
+        raise ProtocolError("body too large")
+    return await reader.readexactly(length) if length else b''
+
+
+async def read_request(reader):
+    """Next Request on a keep-alive connection, or None at EOF"""
+    head = await _read_head(reader)
+    if head is None:
+        return None
+    if len(head) > MAX_HEADER_BYTES:
+        raise ProtocolError("headers too large")
+    start, headers = _parse_head(head)
+    try:
+        method, target, _version = start.split(' ')
+    except ValueError:
+        raise ProtocolError("bad request line")
+    return Request(method, target, headers, await _read_body(reader, headers))
+
+
+def encode_response(status, body=b'', content_type='application/json', headers=None, keep_alive=True):
+    lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+             f"Content-Type: {content_type}",
+             f"Content-Length: {len(body)}",
+             f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def json_response(status, payload, **kwargs):
+    return encode_response(status, json.dumps(payload, separators=(',', ':')).encode('utf-8'), **kwargs)
+
+
+def encode_request(method, path, payload=None, host='localhost'):
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    head = (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+async def read_response(reader):
+    """(status, headers, body) for one response on a client connection"""
+    head = await _read_head(reader)
+    if head is None:
+        raise ConnectionError("server closed the connection")
+    start, headers = _parse_head(head)
+    status = int(start.split(' ')[1])
+    return status, headers, await _read_body(reader, headers)
+
+
+# WebSocket
+
+def websocket_accept(key):
+    return base64.b64encode(hashlib.sha1(key.encode('latin-1') + WS_GUID).digest()).decode('ascii')
+
+
+def websocket_handshake(request):
+    """101 response bytes for an upgrade request (ProtocolError if it isn't one)"""
+    key = request.headers.get('sec-websocket-key')
+    if request.headers.get('upgrade', '').lower() != 'websocket' or not key:
+        raise ProtocolError("not a WebSocket upgrade")
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {websocket_accept(key)}\r\n\r\n"
+    ).encode('latin-1')
+
+
+async def websocket_connect(host, port, path):
+    """(reader, writer) of a client connection after a successful upgrade"""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode('ascii')
+    writer.write((f"GET {path} HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\n"
+                  f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+                  "Sec-WebSocket-Version: 13\r\n\r\n").encode('latin-1'))
+    start, headers = _parse_head(await reader.readuntil(b'\r\n\r\n'))
+    if start.split(' ')[1] != '101' or headers.get('sec-websocket-accept') != websocket_accept(key):
+        writer.close()
+        raise ProtocolError(f"upgrade refused: {start}")
+    return reader, writer
+
+
+def frame_size(length, masked=False):
+    """Bytes on the wire for a frame carrying `length` payload bytes"""
+    header = 2 if length < 126 else 4 if length < 1 << 16 else 10
+    return header + (4 if masked else 0) + length
+
+
+def encode_frame(opcode, payload=b'', mask=None):
+    """One FIN frame; clients must pass a 4-byte mask, servers must not"""
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, mask_bit | length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | opcode, mask_bit | 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, mask_bit | 127, length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return header + mask + payload
+    return header + payload
+
+
+async def read_frame(reader, max_size=MAX_BODY_BYTES):
+    """(opcode, payload bytes) of the next frame; fragments are not supported"""
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack('!H', await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', await reader.readexactly(8))[0]
+    if length > max_size:
+        raise ProtocolError("frame too large")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
@@ -0,0 +1,254 @@
+"""
+Delta-compressed pet state sync
+Pet fields are quantized to fixed steps (0.01 for stats and exp) and each
+distinct state gets a version. A client is sent either a keyframe or the
+changes since the last version it acknowledged: a per-pet change mask and
+zigzag varint deltas, so a normal tick costs about a byte per changed stat.
+Keyframes are forced every KEYFRAME_INTERVAL versions and whenever the
+client's baseline has left the history.
+"""
+from logic.tiger_pet import PetState
+
+KEYFRAME = 1
+DELTA = 2
+KEYFRAME_INTERVAL = 60
+HISTORY = 64
+
+# (field, quantization step); None quantizes a PetState to its index
+FIELDS = (
+    ('hunger', 0.01),
+    ('energy', 0.01),
+    ('mood', 0.01),
+    ('cleanliness', 0.01),
+    ('level', 1),
+    ('exp', 0.01),
+    ('exp_to_next_level', 1),
+    ('coins', 1),
+    ('state', None),
+)
+STATES = tuple(PetState)
+STATE_CODE = {state.value: code for code, state in enumerate(STATES)}
+
+
+class SyncError(Exception):
+    """Message that cannot be applied (corrupt, or its baseline is unknown)"""
+
+
+def quantize_pet(pet):
+    """Tuple of ints for a TigerPet or PetSnapshot"""
+    values = []
+    for field, step in FIELDS:
+        value = getattr(pet, field)
+        if step is None:
+            values.append(STATE_CODE[getattr(value, 'value', value)])
+        else:
+            values.append(int(round(value / step)))
+    return tuple(values)
+
+
+def dequantize_pet(values):
+    """{field: value} with stats as floats, counters as ints and state as its string"""
+    pet = {}
+    for (field, step), value in zip(FIELDS, values):
+        if step is None:
+            pet[field] = STATES[value].value
+        elif step == 1:
+            pet[field] = value
+        else:
+            pet[field] = value * step
+    return pet
+
+
+# Varints
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_signed(out, value):
+    _write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def varint(self):
+        value = shift = 0
+        while True:
+            try:
+                byte = self.data[self.pos]
+            except IndexError:
+                raise SyncError("truncated message")
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def signed(self):
+        value = self.varint()
+        return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def encode_ack(version):
+    out = bytearray()
+    _write_varint(out, version)
+    return bytes(out)
+
+
+def decode_ack(data):
+    return _Reader(data).varint()
+
+
+# Messages
+
+def encode_keyframe(version, state):
+    active, pets = state
+    out = bytearray([KEYFRAME])
+    for value in (version, active, len(pets)):
+        _write_varint(out, value)
+    for pet in pets:
+        for value in pet:
+            _write_signed(out, value)
+    return bytes(out)
+
+
+def encode_delta(version, base_version, base, state):
+    """Changes from `base` to `state`; both must hold the same number of pets"""
+    active, pets = state
+    out = bytearray([DELTA])
+    for value in (version, base_version, active, len(pets)):
+        _write_varint(out, value)
+    for old, new in zip(base[1], pets):
+        mask, changes = 0, []
+        for bit, (before, after) in enumerate(zip(old, new)):
+            if before != after:
+                mask |= 1 << bit
+                changes.append(after - before)
+        _write_varint(out, mask)
+        for change in changes:
+            _write_signed(out, change)
+    return bytes(out)
+
+
+class SyncPeer:
+    """Server-side view of one client: what it has acknowledged and been sent"""
+    __slots__ = ('acked', 'sent', 'keyframe_version', 'bytes_sent', 'keyframes', 'deltas')
+
+    def __init__(self):
+        self.acked = None
+        self.sent = None
+        self.keyframe_version = None
+        self.bytes_sent = 0
+        self.keyframes = 0
+        self.deltas = 0
+
+
+class SyncSource:
+    """Versioned quantized states of one player, encoded per client baseline"""
+
+    def __init__(self, history=HISTORY, keyframe_interval=KEYFRAME_INTERVAL):
+        self.history = history
+        self.keyframe_interval = keyframe_interval
+        self.version = 0
+        self.states = {}            # version -> (active index, (pet tuple, ...))
+        self._messages = {}         # baseline version (None = keyframe) -> bytes for self.version
+
+    def commit(self, pets, active_index=0):
+        """Record the current state; the version only moves when something changed"""
+        state = (active_index, tuple(quantize_pet(pet) for pet in pets))
+        if self.states and self.states[self.version] == state:
+            return self.version
+        self.version += 1
+        self.states[self.version] = state
+        self.states.pop(self.version - self.history, None)
+        self._messages.clear()
+        return self.version
+
+    def encode(self, peer):
+        """Next message for a client, or None if it already has the latest version"""
+        if not self.states or peer.sent == self.version:
+            return None
+        base = peer.acked
+        state = self.states[self.version]
+        if (base is None or base not in self.states or peer.keyframe_version is None
+                or self.version - peer.keyframe_version >= self.keyframe_interval
+                or len(self.states[base][1]) != len(state[1])):
+            base = None
+        message = self._messages.get(base)
+        if message is None:
+            if base is None:
+                message = encode_keyframe(self.version, state)
+            else:
+                message = encode_delta(self.version, base, self.states[base], state)
+            self._messages[base] = message  # clients on the same baseline share it
+        if base is None:
+            peer.keyframe_version = self.version
+            peer.keyframes += 1
+        else:
+            peer.deltas += 1
+        peer.sent = self.version
+        peer.bytes_sent += len(message)
+        return message
+
+    def ack(self, peer, version):
+        if version <= self.version and (peer.acked is None or version > peer.acked):
+            peer.acked = version
+
+
+class SyncClient:
+    """Client-side decoder that rebuilds the state and produces acknowledgements"""
+
+    def __init__(self, history=HISTORY):
+        self.history = history
+        self.version = None
+        self.states = {}            # versions that can still be a delta baseline
+
+    def apply(self, message):
+        """Decode one message; returns its version"""
+        reader = _Reader(message)
+        if not message:
+            raise SyncError("empty message")
+        kind = message[0]
+        reader.pos = 1
+        version = reader.varint()
+        if kind == KEYFRAME:
+            active, count = reader.varint(), reader.varint()
+            pets = tuple(tuple(reader.signed() for _ in FIELDS) for _ in range(count))
+        elif kind == DELTA:
+            base_version = reader.varint()
+            base = self.states.get(base_version)
+            if base is None:
+                raise SyncError(f"unknown baseline version {base_version}")
+            active, count = reader.varint(), reader.varint()
+            pets = []
+            for old in base[1][:count]:
+                mask = reader.varint()
+                pets.append(tuple(value + reader.signed() if mask >> bit & 1 else value
+                                  for bit, value in enumerate(old)))
+            pets = tuple(pets)
+        else:
+            raise SyncError(f"unknown message type {kind}")
+        self.states[version] = (active, pets)
+        # The server may still hold an older ack as baseline, but never one
+        # that has left its history
+        for old in [v for v in self.states if v <= version - self.history]:
+            del self.states[old]
+        self.version = version
+        return version
+
+    def ack(self):
+        return encode_ack(self.version)
+
+    @property
+    def active_pet_index(self):
+        return self.states[self.version][0]
+
+    @property
+    def pets(self):
+        return [dequantize_pet(values) for values in self.states[self.version][1]]
@@ -0,0 +1,146 @@
+"""
+Bandwidth report for state sync over a loopback pet server
+Connects the same number of JSON (/ws) and delta (/sync) WebSocket clients
+to an in-process server, steps the shared tick by hand and counts the wire
+bytes each client receives, including frame headers and acknowledgements.
+
+Usage:
+    python -m server.sync_report --clients 200 --ticks 300 --pets 3
+"""
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+
+from server.pet_server import PetServer, PetService
+from server.protocol import OP_BINARY, encode_frame, frame_size, read_frame, websocket_connect
+from server.sync import KEYFRAME, SyncClient
+
+ACK_MASK = b'\x00\x00\x00\x00'
+
+
+class _Client:
+    def __init__(self, player, sync):
+        self.player = player
+        self.sync = sync
+        self.decoder = SyncClient() if sync else None
+        self.tick = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.keyframe_bytes = []
+        self.delta_bytes = []
+        self.state = None
+
+    async def run(self, host, port):
+        path = f"/pets/{self.player}/{'sync' if self.sync else 'ws'}"
+        self.reader, self.writer = await websocket_connect(host, port, path)
+        while True:
+            _, payload = await read_frame(self.reader)
+            self.bytes_in += frame_size(len(payload))
+            if self.sync:
+                self.decoder.apply(payload)
+                (self.keyframe_bytes if payload[0] == KEYFRAME else self.delta_bytes).append(len(payload))
+                ack = self.decoder.ack()
+                self.writer.write(encode_frame(OP_BINARY, ack, mask=ACK_MASK))
+                self.bytes_out += frame_size(len(ack), masked=True)
+                self.state = self.decoder.pets
+            else:
+                message = json.loads(payload)
+                self.tick = message['tick']
+                self.state = message['pets']
+
+    def current(self, service):
+        """Has this client received everything the last tick published?"""
+        if self.sync:
+            source = service.sync_sources.get(self.player)
+            return source is not None and self.decoder.version == source.version
+        return self.tick == service.tick
+
+
+async def _settle(service, clients, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not all(client.current(service) for client in clients):
+        if time.monotonic() > deadline:
+            raise TimeoutError("clients did not receive every tick")
+        await asyncio.sleep(0.001)
+
+
+def _summary(clients, ticks):
+    total_in = sum(client.bytes_in for client in clients)
+    total_out = sum(client.bytes_out for client in clients)
+    keyframes = [size for client in clients for size in client.keyframe_bytes]
+    deltas = [size for client in clients for size in client.delta_bytes]
+    return {
+        'clients': len(clients),
+        'bytes_per_client_tick': total_in / (len(clients) * ticks),
+        'ack_bytes_per_client_tick': total_out / (len(clients) * ticks),
+        'keyframes': len(keyframes),
+        'keyframe_bytes': sum(keyframes) / len(keyframes) if keyframes else 0.0,
+        'delta_bytes': sum(deltas) / len(deltas) if deltas else 0.0,
+    }
+
+
+async def measure(clients=100, ticks=200, pets=1, delta_time=1.0):
+    """{'json': summary, 'sync': summary, 'max_error': largest stat difference seen}"""
+    with tempfile.TemporaryDirectory() as save_dir:
+        service = PetService(save_dir, tick_interval=3600, save_interval=3600)
+        server = PetServer(service, max_connections=4 * clients + 16)
+        port = await server.start('127.0.0.1', 0)
+        json_clients = [_Client(f'player{i}', sync=False) for i in range(clients)]
+        sync_clients = [_Client(f'player{i}', sync=True) for i in range(clients)]
+        for i in range(clients):
+            manager = await service.open(f'player{i}')
+            for _ in range(pets - 1):
+                manager.add_pet()
+        tasks = [asyncio.ensure_future(client.run('127.0.0.1', port))
+                 for client in json_clients + sync_clients]
+        try:
+            await _settle(service, sync_clients)             # initial keyframes
+            while sum(len(s) for s in service.subscribers.values()) < clients:
+                await asyncio.sleep(0.001)
+            max_error = 0.0
+            for _ in range(ticks):
+                await service.advance(delta_time)
+                await _settle(service, json_clients + sync_clients)
+            for json_client, sync_client in zip(json_clients, sync_clients):
+                for full, synced in zip(json_client.state, sync_client.state):
+                    for field in ('hunger', 'energy', 'mood', 'cleanliness'):
+                        max_error = max(max_error, abs(full[field] - synced[field]))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for client in json_clients + sync_clients:
+                client.writer.close()
+            await server.close()
+    return {'json': _summary(json_clients, ticks), 'sync': _summary(sync_clients, ticks),
+            'max_error': max_error}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bytes per client per tick: JSON vs delta sync")
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--ticks', type=int, default=200)
+    parser.add_argument('--pets', type=int, default=1, help="pets per player")
+    parser.add_argument('--json', help="write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(measure(args.clients, args.ticks, args.pets))
+    full, sync = result['json'], result['sync']
+    print(f"json: {full['bytes_per_client_tick']:8.1f} B/client/tick")
+    print(f"sync: {sync['bytes_per_client_tick']:8.1f} B/client/tick down, "
+          f"{sync['ack_bytes_per_client_tick']:.1f} B up "
+          f"(keyframes {sync['keyframe_bytes']:.0f} B x{sync['keyframes']}, "
+          f"deltas {sync['delta_bytes']:.1f} B)")
+    ratio = full['bytes_per_client_tick'] / sync['bytes_per_client_tick']
+    print(f"sync is {ratio:.1f}x smaller; largest stat error {result['max_error']:.4f}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
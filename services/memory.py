@@ -0,0 +1,183 @@
+"""
+Memory diagnostics with tracemalloc
+Periodic snapshots attribute live Python allocations to the game's packages
+(logic, services, ui, engine3d), warn when the total passes a budget, and
+write the growth since the previous snapshot so slow leaks show up in long
+sessions. Native Qt/OpenGL memory is not traced; peak RSS is reported
+alongside for that.
+"""
+from datetime import datetime
+from pathlib import Path
+import sys
+import threading
+import tracemalloc
+
+from services.metrics import REGISTRY
+
+PACKAGES = ('logic', 'services', 'ui', 'engine3d')
+MEMORY_BUDGET_MB = 100.0
+SNAPSHOT_INTERVAL = 60.0
+TRACE_FRAMES = 16
+REPORT_DIR = Path.home() / '.macan_ternak' / 'memory'
+MAX_REPORTS = 50
+ROOT = Path(__file__).resolve().parent.parent
+
+PACKAGE_BYTES = REGISTRY.gauge('macan_memory_traced_bytes', 'Live traced allocations by package', ('package',))
+
+# Allocations made by the diagnostics themselves
+_IGNORE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+def package_of(filename, root=ROOT):
+    """Game package a source file belongs to, or None for stdlib/third party"""
+    try:
+        relative = Path(filename).resolve().relative_to(root)
+    except ValueError:
+        return None
+    top = relative.parts[0] if len(relative.parts) > 1 else None
+    return top if top in PACKAGES else None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process, where the OS reports it"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class MemoryMonitor:
+    """tracemalloc snapshots with per-package attribution and a budget check"""
+
+    def __init__(self, budget_mb=MEMORY_BUDGET_MB, interval=SNAPSHOT_INTERVAL,
+                 out_dir=REPORT_DIR, frames=TRACE_FRAMES, root=ROOT, top=15):
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.interval = interval
+        self.out_dir = Path(out_dir)
+        self.frames = frames
+        self.root = Path(root).resolve()
+        self.top = top
+        self.previous = None
+        self.history = []           # [(time, total bytes, {package: bytes})]
+        self.over_budget = False
+        self._package_cache = {}
+        self._started_tracing = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, background=True):
+        """Begin tracing (as early as possible) and optionally snapshot on a timer"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        if background and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='memory-monitor', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Final check, then stop tracing if we started it"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        report = self.check() if tracemalloc.is_tracing() else None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return report
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except OSError as e:
+                print(f"Error writing memory report: {e}")
+
+    def _package(self, filename):
+        package = self._package_cache.get(filename, False)
+        if package is False:
+            package = self._package_cache[filename] = package_of(filename, self.root)
+        return package
+
+    def attribute(self, snapshot):
+        """{package: bytes}; each trace goes to the innermost game frame in its stack"""
+        totals = dict.fromkeys(PACKAGES + ('other',), 0)
+        for stat in snapshot.statistics('traceback'):
+            owner = 'other'
+            for frame in reversed(stat.traceback):  # most recent call first
+                package = self._package(frame.filename)
+                if package is not None:
+                    owner = package
+                    break
+            totals[owner] += stat.size
+        return totals
+
+    def check(self, write=True):
+        """Snapshot now; returns the report dict (and writes it when asked)"""
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORE)
+        packages = self.attribute(snapshot)
+        total = sum(packages.values())
+        for package, size in packages.items():
+            PACKAGE_BYTES.labels(package).set(size)
+
+        report = {
+            'time': datetime.now(),
+            'total': total,
+            'packages': packages,
+            'peak_rss_mb': peak_rss_mb(),
+            'growth': snapshot.compare_to(self.previous, 'lineno')[:self.top] if self.previous else [],
+        }
+        self.history.append((report['time'], total, packages))
+
+        self.over_budget = total > self.budget_bytes
+        if self.over_budget:
+            print(f"Warning: traced memory {total / 2**20:.1f} MB exceeds the "
+                  f"{self.budget_bytes / 2**20:.0f} MB budget ({self._largest(packages)})")
+        self.previous = snapshot
+        if write:
+            report['path'] = self.write(report)
+        return report
+
+    @staticmethod
+    def _largest(packages):
+        package, size = max(packages.items(), key=lambda item: item[1])
+        return f"largest: {package} {size / 2**20:.1f} MB"
+
+    def format(self, report):
+        lines = [f"Memory report {report['time']:%Y-%m-%d %H:%M:%S}",
+                 f"Traced: {report['total'] / 2**20:.2f} MB (budget {self.budget_bytes / 2**20:.0f} MB"
+                 f"{', OVER' if report['total'] > self.budget_bytes else ''})"]
+        if report['peak_rss_mb'] is not None:
+            lines.append(f"Peak RSS: {report['peak_rss_mb']:.1f} MB")
+        lines.append("\nBy package:")
+        for package, size in sorted(report['packages'].items(), key=lambda item: -item[1]):
+            lines.append(f"  {size / 1024:10.1f} KiB  {package}")
+        if len(self.history) > 1:
+            _, first_total, first_packages = self.history[0]
+            lines.append("\nGrowth since first snapshot:")
+            for package, size in report['packages'].items():
+                lines.append(f"  {(size - first_packages[package]) / 1024:+10.1f} KiB  {package}")
+        if report['growth']:
+            lines.append(f"\nTop {len(report['growth'])} changes since previous snapshot:")
+            for stat in report['growth']:
+                lines.append(f"  {stat.size_diff / 1024:+10.1f} KiB  {stat.count_diff:+7d} blocks  "
+                             f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, report):
+        """Write a text report, keeping only the newest MAX_REPORTS"""
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        path = self.out_dir / f"memory-{report['time']:%Y%m%d-%H%M%S-%f}.txt"
+        path.write_text(self.format(report))
+        reports = sorted(self.out_dir.glob('memory-*.txt'))
+        for old in reports[:-MAX_REPORTS]:
+            old.unlink()
+        return path
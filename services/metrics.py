@@ -0,0 +1,267 @@
+"""
+Metrics registry with Prometheus text exposition
+Counters, gauges and histograms are declared once at module level and
+updated in place. Until the registry is enabled every update returns after
+one attribute check, so instrumented hot paths cost next to nothing; hot
+paths with labels check REGISTRY.enabled before the labels() lookup.
+"""
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, registry, name, help, label_names=(), label_values=()):
+        self._registry = registry
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.label_values = tuple(label_values)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """Child metric for one combination of label values (not free: check enabled first on hot paths)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}")
+            with self._lock:
+                child = self._children.setdefault(values, self._child(values))
+        return child
+
+    def _child(self, values):
+        return type(self)(self._registry, self.name, self.help, self.label_names, values)
+
+    def _series(self):
+        """Metrics that hold values: the children, or self when unlabelled"""
+        return list(self._children.values()) if self.label_names else [self]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for series in self._series():
+            lines.extend(series._samples())
+        return lines
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.value = 0
+
+    def inc(self, amount=1):
+        if not self._registry.enabled:
+            return
+        with self._lock:
+            self.value += amount
+
+    def _samples(self):
+        return [f"{self.name}_total{_format_labels(self.label_names, self.label_values)} "
+                f"{_format_value(self.value)}"]
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.value = 0
+
+    def set(self, value):
+        if self._registry.enabled:
+            self.value = value
+
+    def inc(self, amount=1):
+        if not self._registry.enabled:
+            return
+        with self._lock:
+            self.value += amount
+
+    def _samples(self):
+        return [f"{self.name}{_format_labels(self.label_names, self.label_values)} "
+                f"{_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, registry, name, help, label_names=(), label_values=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, help, label_names, label_values)
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def _child(self, values):
+        return Histogram(self._registry, self.name, self.help, self.label_names, values, self.buckets)
+
+    def observe(self, value):
+        if not self._registry.enabled:
+            return
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[slot] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self):
+        """Context manager observing the duration of its block in seconds"""
+        return _Timer(self)
+
+    def _samples(self):
+        names, values = self.label_names, self.label_values
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            cumulative += count
+            labels = _format_labels(names, values, [('le', _format_value(float(bound)))])
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        lines.append(f"{self.name}_sum{_format_labels(names, values)} {_format_value(self.sum)}")
+        lines.append(f"{self.name}_count{_format_labels(names, values)} {self.count}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter() if self.histogram._registry.enabled else None
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class MetricsRegistry:
+    """Named metrics; declaring the same name twice returns the first one"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help, labels, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(self, name, help, labels, (), **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"metric {name} already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name, help, labels=()):
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name, help, labels=()):
+        return self._get(Gauge, name, help, labels)
+
+    def histogram(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help, labels, buckets=buckets)
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """Write render() to path atomically, so readers never see half a file"""
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+# Process-wide registry the game modules declare their metrics on
+REGISTRY = MetricsRegistry()
+
+
+class MetricsServer:
+    """GET /metrics on a local port, served from a daemon thread"""
+
+    def __init__(self, registry=REGISTRY, port=9464, host='127.0.0.1'):
+        registry_ref = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry_ref.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # no per-scrape console noise
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self._thread = threading.Thread(target=self.server.serve_forever, name='metrics-http', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class MetricsDumper:
+    """Rewrites a metrics file every `interval` seconds until stopped"""
+
+    def __init__(self, path, registry=REGISTRY, interval=15.0):
+        self.path = path
+        self.registry = registry
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='metrics-dump', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.registry.dump(self.path)  # final values on shutdown
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.registry.dump(self.path)
+            except OSError as e:
+                print(f"Error writing metrics: {e}")
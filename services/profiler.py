@@ -0,0 +1,168 @@
+"""
+Sampling profiler for diagnosing stutter
+A background thread reads every other thread's current stack a few hundred
+times a second and counts identical stacks. Stopping writes a speedscope
+JSON file and a collapsed-stack (.folded) file under ~/.macan_ternak/profiles,
+deleting the oldest profiles when the directory grows past its size cap.
+"""
+from collections import Counter
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+
+PROFILE_DIR = Path.home() / '.macan_ternak' / 'profiles'
+PROFILE_DIR_MAX_BYTES = 50 * 1024 * 1024
+SAMPLE_INTERVAL = 0.005
+MAX_DEPTH = 128
+ENV_VAR = 'MACAN_PROFILE'
+
+
+def _label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Counts (thread, stack) samples from a daemon thread between start() and stop()"""
+
+    def __init__(self, interval=SAMPLE_INTERVAL, out_dir=PROFILE_DIR, max_bytes=PROFILE_DIR_MAX_BYTES):
+        self.interval = interval
+        self.out_dir = Path(out_dir)
+        self.max_bytes = max_bytes
+        self.samples = Counter()    # (thread name, (code, ...) root first) -> count
+        self.sample_count = 0
+        self.started_at = None
+        self.duration = 0.0
+        self._labels = {}           # code object -> frame label
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.samples.clear()
+        self.sample_count = 0
+        self._stop.clear()
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self, write=True):
+        """Stop sampling; returns the written file paths (or [] if nothing was sampled)"""
+        if self._thread is None:
+            return []
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.duration = time.time() - self.started_at
+        if not write or not self.samples:
+            return []
+        return self.write()
+
+    def toggle(self):
+        """Start, or stop and return the written paths"""
+        if self.running:
+            return self.stop()
+        self.start()
+        return []
+
+    def _run(self):
+        me = threading.get_ident()
+        interval = self.interval
+        while not self._stop.wait(interval):
+            self.sample(skip=me)
+
+    def sample(self, skip=None):
+        """Record the current stack of every thread except `skip`"""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == skip:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_DEPTH:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            stack.reverse()
+            self.samples[(names.get(ident, f'thread-{ident}'), tuple(stack))] += 1
+        self.sample_count += 1
+
+    def _frame_label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = _label(code)
+        return label
+
+    def collapsed(self):
+        """Brendan Gregg's folded format: 'thread;outer;...;inner count' lines"""
+        lines = []
+        for (thread, stack), count in sorted(self.samples.items(), key=lambda item: -item[1]):
+            frames = [thread] + [self._frame_label(code).replace(';', ':') for code in stack]
+            lines.append(f"{';'.join(frames)} {count}")
+        return '\n'.join(lines) + '\n'
+
+    def speedscope(self, name='macan_ternak'):
+        """speedscope file-format dict with one sampled profile per thread"""
+        frames, frame_index, profiles = [], {}, {}
+        for (thread, stack), count in self.samples.items():
+            indices = []
+            for code in stack:
+                index = frame_index.get(code)
+                if index is None:
+                    index = frame_index[code] = len(frames)
+                    frames.append({'name': code.co_name, 'file': code.co_filename,
+                                   'line': code.co_firstlineno})
+                indices.append(index)
+            profile = profiles.setdefault(thread, {'samples': [], 'weights': []})
+            profile['samples'].append(indices)
+            profile['weights'].append(count * self.interval)
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'macan_ternak sampling profiler',
+            'activeProfileIndex': 0,
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': thread,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(profile['weights']),
+                'samples': profile['samples'],
+                'weights': profile['weights'],
+            } for thread, profile in sorted(profiles.items())],
+        }
+
+    def write(self):
+        """Write both formats, then trim old profiles to the size cap"""
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        stem = datetime.fromtimestamp(self.started_at).strftime('profile-%Y%m%d-%H%M%S')
+        json_path = self.out_dir / f'{stem}.speedscope.json'
+        folded_path = self.out_dir / f'{stem}.folded'
+        with open(json_path, 'w') as f:
+            json.dump(self.speedscope(stem), f)
+        with open(folded_path, 'w') as f:
+            f.write(self.collapsed())
+        self._trim(keep=(json_path, folded_path))
+        return [json_path, folded_path]
+
+    def _trim(self, keep=()):
+        files = sorted((p for p in self.out_dir.iterdir() if p.is_file()), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        for path in files:
+            if total <= self.max_bytes:
+                break
+            if path in keep:
+                continue
+            total -= path.stat().st_size
+            path.unlink()
+
+
+def enabled_by_env():
+    return os.environ.get(ENV_VAR, '').lower() not in ('', '0', 'false', 'no')
@@ -3,26 +3,39 @@ Save and load game data using JSON
 """
 import json
 import os
+import time
 from pathlib import Path
+from services.metrics import REGISTRY
+
+SAVE_SECONDS = REGISTRY.histogram('macan_save_seconds', 'SaveManager.save_game latency in seconds')
+LOAD_SECONDS = REGISTRY.histogram('macan_load_seconds', 'SaveManager.load_game latency in seconds')
+SAVE_BYTES = REGISTRY.counter('macan_save_bytes', 'Bytes written by SaveManager.save_game')
+SAVE_ERRORS = REGISTRY.counter('macan_save_errors', 'Failed saves and loads', ('operation',))
 
 class SaveManager:
     """Handles saving and loading game data"""
     
-    def __init__(self):
-        # Create save directory in user's home
-        self.save_dir = Path.home() / '.macan_ternak'
-        self.save_file = self.save_dir / 'savegame.json'
+    def __init__(self, save_file=None):
+        # Default: one save in the user's home; servers pass a per-player file
+        if save_file is None:
+            save_file = Path.home() / '.macan_ternak' / 'savegame.json'
+        self.save_file = Path(save_file)
+        self.save_dir = self.save_file.parent
         
         # Ensure save directory exists
-        self.save_dir.mkdir(exist_ok=True)
+        self.save_dir.mkdir(parents=True, exist_ok=True)
         
     def save_game(self, game_data):
         """Save game data to JSON file"""
+        start = time.perf_counter()
         try:
             with open(self.save_file, 'w') as f:
                 json.dump(game_data, f, indent=2)
+                SAVE_BYTES.inc(f.tell())
+            SAVE_SECONDS.observe(time.perf_counter() - start)
             return True
         except Exception as e:
+            SAVE_ERRORS.labels('save').inc()
             print(f"Error saving game: {e}")
             return False
             
@@ -31,10 +44,14 @@ class SaveManager:
         if not self.save_file.exists():
             return None
             
+        start = time.perf_counter()
         try:
             with open(self.save_file, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
+            LOAD_SECONDS.observe(time.perf_counter() - start)
+            return data
         except Exception as e:
+            SAVE_ERRORS.labels('load').inc()
             print(f"Error loading game: {e}")
             return None
             
@@ -20,7 +20,8 @@ class SettingsManager:
             'auto_save_interval': 30,
             'graphics_quality': 'medium',
             'fullscreen': False,
-            'language': 'en'
+            'language': 'en',
+            'theme': 'light'
         }
         
         self.settings = self.defaults.copy()
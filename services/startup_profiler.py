@@ -0,0 +1,154 @@
+"""
+Startup profiler for time-to-first-frame budgeting
+Enabled with `python main.py --profile-startup`: an import hook times every
+module's execution (cumulative and self time), and named stages time the
+window setup steps. The report is printed once startup is complete.
+"""
+from contextlib import contextmanager
+import sys
+import threading
+import time
+
+STARTUP_BUDGET_MS = 1500.0
+
+
+class _TimedLoader:
+    """Wraps a module loader so create/exec time is attributed to the module"""
+
+    def __init__(self, loader, profiler, name):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        create = getattr(self._loader, 'create_module', None)
+        if create is None:
+            return None
+        self._profiler._enter(self._name)
+        try:
+            return create(spec)
+        finally:
+            self._profiler._exit()
+
+    def exec_module(self, module):
+        self._profiler._enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit()
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class _TimingFinder:
+    """First meta path entry: asks the real finders, then wraps the loader"""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        if getattr(self._local, 'busy', False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.busy = False
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self.profiler, name)
+        return spec
+
+
+class StartupProfiler:
+    """Import and stage timings; cheap no-op bookkeeping when disabled"""
+
+    def __init__(self, enabled=False, budget_ms=STARTUP_BUDGET_MS):
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.t0 = time.perf_counter()
+        self.imports = {}   # module -> [cumulative s, self s]
+        self.stages = []    # [(name, seconds)]
+        self.marks = {}     # name -> seconds since t0
+        self._local = threading.local()  # per-thread stack of [name, start, child seconds]
+        self._finder = None
+        self._reported = False
+
+    def install(self):
+        if self.enabled and self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def _stack(self):
+        # Imports also run on worker threads (the save load), each with its own nesting
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, name):
+        self._stack().append([name, time.perf_counter(), 0.0])
+
+    def _exit(self):
+        stack = self._stack()
+        name, start, child = stack.pop()
+        total = time.perf_counter() - start
+        entry = self.imports.setdefault(name, [0.0, 0.0])
+        entry[0] += total
+        entry[1] += total - child
+        if stack:
+            stack[-1][2] += total
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - start))
+
+    def mark(self, name):
+        """Record a milestone (e.g. 'first_frame') relative to process start"""
+        self.marks.setdefault(name, time.perf_counter() - self.t0)
+
+    def report(self, top=25, out=None):
+        """Print stage, milestone and slowest-import tables once"""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        self.uninstall()
+        out = out or sys.stdout
+        first_frame = self.marks.get('first_frame')
+        header = "Startup profile"
+        if first_frame is not None:
+            ms = first_frame * 1000
+            verdict = "OK" if ms <= self.budget_ms else "OVER BUDGET"
+            header += f" - first frame {ms:.1f} ms (budget {self.budget_ms:.0f} ms, {verdict})"
+        print(header, file=out)
+
+        print("\nMilestones:", file=out)
+        for name, seconds in sorted(self.marks.items(), key=lambda item: item[1]):
+            print(f"  {seconds * 1000:9.1f} ms  {name}", file=out)
+
+        print("\nStages:", file=out)
+        for name, seconds in self.stages:
+            print(f"  {seconds * 1000:9.1f} ms  {name}", file=out)
+
+        ranked = sorted(self.imports.items(), key=lambda item: -item[1][0])[:top]
+        print(f"\nImports (top {len(ranked)} of {len(self.imports)} by cumulative time):", file=out)
+        print(f"  {'cumulative':>10}  {'self':>9}  module", file=out)
+        for name, (cumulative, own) in ranked:
+            print(f"  {cumulative * 1000:7.1f} ms  {own * 1000:6.1f} ms  {name}", file=out)
@@ -0,0 +1,70 @@
+#`tests/test_animation.py`
+
+import unittest
+
+import numpy as np
+from engine3d.animation import AnimationController, HerdAnimator, PoseTable, CHANNELS
+
+class TestAnimation(unittest.TestCase):
+    def setUp(self):
+        self.table = PoseTable()
+
+    def test_keyframes_are_interpolated(self):
+        # idle breathing: 1.0 at t=0, 1.05 at t=0.5
+        self.assertAlmostEqual(self.table.sample('idle', 0.0)['body_scale'], 1.0, places=5)
+        self.assertAlmostEqual(self.table.sample('idle', 0.25)['body_scale'], 1.025, places=4)
+        self.assertAlmostEqual(self.table.sample('idle', 0.5)['body_scale'], 1.05, places=5)
+
+    def test_looping_clip_wraps(self):
+        a = self.table.sample('idle', 0.3)
+        b = self.table.sample('idle', 4.3)
+        for channel in CHANNELS:
+            self.assertAlmostEqual(a[channel], b[channel], places=4)
+
+    def test_batched_matches_keyframes(self):
+        # Interpolated by hand from CLIPS; short channels repeat with their own period
+        expected = {
+            #          body_scale      body_height  head_pitch  tail_angle  spin_speed
+            ('idle', 0.7): (1.03,           0.0,         0.0,        27.0,       30.0),
+            ('eat', 0.375): (1.0,           0.0,         -15.0,      30.0,       0.0),
+            ('sleep', 2.25): (1.0,          -0.25,       -20.0,      5.0,        0.0),
+            ('play', 2.2): (1.08 - 0.08 / 3, 0.5 - 0.5 / 3, 0.0,        50.0,       105.0),
+        }
+        clips = [self.table.clip_index[name] for name, _ in expected]
+        times = [t for _, t in expected]
+        poses = self.table.sample_many(clips, times)
+        for row, values in zip(poses, expected.values()):
+            np.testing.assert_allclose(row, values, rtol=1e-5, atol=1e-4)
+
+    def test_action_overrides_state_then_returns(self):
+        controller = AnimationController(self.table)
+        controller.set_state('tired')
+        self.assertEqual(controller.current_clip, 'sleep')
+        controller.trigger('feed')
+        controller.update(0.1)
+        self.assertEqual(controller.current_clip, 'eat')
+        controller.update(2.0)
+        self.assertEqual(controller.current_clip, 'sleep')
+
+    def test_herd_update_shape(self):
+        herd = HerdAnimator(1000, self.table)
+        herd.set_clip(np.arange(10), 'play')
+        poses = herd.update(1.0 / 60)
+        self.assertEqual(poses.shape, (1000, len(CHANNELS)))
+        herd.update(3.0)
+        self.assertTrue((herd.clip_ids[:10] == self.table.clip_index['idle']).all())
+
+    def test_herd_follows_pet_states(self):
+        herd = HerdAnimator(4, self.table)
+        herd.set_clip([1], 'eat')
+        changed = herd.set_states(['happy', 'tired', 'tired', 'sad'])
+        self.assertEqual(changed.tolist(), [1, 2])
+        sleep, eat = self.table.clip_index['sleep'], self.table.clip_index['eat']
+        self.assertEqual(herd.clip_ids.tolist()[1:3], [eat, sleep])     # the action plays out first
+        self.assertEqual(herd.times[2], 0.0)
+        herd.update(2.5)
+        self.assertEqual(herd.clip_ids[1], sleep)
+        self.assertEqual(herd.set_states(['happy', 'tired', 'tired', 'sad']).size, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+#`tests/test_bench.py`
+
+import unittest
+from bench.harness import Case, compare, measure, remeasure, run_cases
+from bench.run import exp_for_levels
+from logic.tiger_pet import TigerPet
+
+class TestBenchHarness(unittest.TestCase):
+    def test_measure_calibrates_call_count(self):
+        calls = []
+        result = measure(lambda: calls.append(1), min_time=0.01, rounds=3)
+        self.assertGreater(result['number'], 1)
+        self.assertGreaterEqual(len(calls), result['number'] * 3)
+        self.assertLessEqual(result['min_s'], result['median_s'])
+
+    def test_compare_flags_only_slowdowns_past_threshold(self):
+        baseline = {'results': {'a': {'min_s': 1.0}, 'b': {'min_s': 1.0}, 'gone': {'min_s': 1.0}}}
+        current = {'results': {'a': {'min_s': 1.2}, 'b': {'min_s': 1.5}, 'new': {'min_s': 9.0}}}
+        rows = {key: regressed for key, _, _, _, regressed in compare(current, baseline, 0.25)}
+        self.assertEqual(rows, {'a': False, 'b': True})
+
+    def test_run_cases_select_and_quick(self):
+        cases = [Case('x', lambda n: (lambda: None), params=(1, 2, 3), quick_params=(1,)),
+                 Case('y', lambda _: (lambda: None))]
+        results = run_cases(cases, quick=True, min_time=0.001, rounds=2, select='x')
+        self.assertEqual(list(results['results']), ['x[1]'])
+        self.assertIn('python', results['machine'])
+
+    def test_remeasure_keeps_the_faster_run(self):
+        cases = [Case('x', lambda n: (lambda: None), params=(1, 2), quick_params=(1,))]
+        results = {'results': {'x[2]': {'min_s': 10.0}, 'x[1]': {'min_s': 0.0}}}
+        remeasure(cases, results, ['x[2]', 'x[1]'], min_time=0.001, rounds=2)
+        self.assertLess(results['results']['x[2]']['min_s'], 10.0)
+        self.assertEqual(results['results']['x[1]'], {'min_s': 0.0})
+
+    def test_exp_for_levels(self):
+        pet = TigerPet()
+        pet.add_exp(exp_for_levels(10))
+        self.assertEqual(pet.level, 11)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+#`tests/test_culling.py`
+
+import random
+import unittest
+from engine3d import transforms
+from engine3d.culling import Frustum, SpatialGrid, INSIDE, OUTSIDE
+
+class TestCulling(unittest.TestCase):
+    def setUp(self):
+        projection = transforms.perspective(45, 16 / 9, 0.1, 100.0)
+        view = transforms.look_at((0, 5, 20), (0, 0, 0), (0, 1, 0))
+        self.frustum = Frustum.from_matrices(projection, view)
+        rng = random.Random(3)
+        self.grid = SpatialGrid(cell_size=8.0)
+        self.spheres = {}
+        for i in range(2000):
+            center = (rng.uniform(-150, 150), 0.0, rng.uniform(-150, 150))
+            self.spheres[i] = center
+            self.grid.insert(i, center, 1.8)
+
+    def test_sphere_in_front_and_behind(self):
+        self.assertTrue(self.frustum.intersects_sphere((0, 0, 0), 1.0))
+        self.assertFalse(self.frustum.intersects_sphere((0, 0, 40), 1.0))
+
+    def test_aabb_classification(self):
+        self.assertEqual(self.frustum.classify_aabb((-1, -1, -1), (1, 1, 1)), INSIDE)
+        self.assertEqual(self.frustum.classify_aabb((-1, -1, 30), (1, 1, 32)), OUTSIDE)
+
+    def test_grid_matches_brute_force(self):
+        expected = {i for i, c in self.spheres.items() if self.frustum.intersects_sphere(c, 1.8)}
+        self.assertEqual(set(self.grid.query_frustum(self.frustum)), expected)
+        self.assertLess(len(expected), len(self.spheres))
+
+    def test_radius_query_and_move(self):
+        self.grid.move(0, (500.0, 0.0, 500.0))
+        self.spheres[0] = (500.0, 0.0, 500.0)
+        found = set(self.grid.query_radius((500.0, 0.0, 500.0), 1.0))
+        self.assertEqual(found, {0})
+        center = (10.0, 0.0, -10.0)
+        expected = {i for i, (x, y, z) in self.spheres.items()
+                    if (x - center[0]) ** 2 + (z - center[2]) ** 2 <= (12.0 + 1.8) ** 2}
+        self.assertEqual(set(self.grid.query_radius(center, 12.0)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
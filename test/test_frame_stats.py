@@ -0,0 +1,88 @@
+#`tests/test_frame_stats.py`
+
+import csv
+import json
+import tempfile
+import time
+import unittest
+from engine3d.frame_stats import FrameStats, percentile
+
+def frame_record(index, frame_ms, cpu_ms=1.0, gpu_ms=None):
+    record = dict.fromkeys(FrameStats.FIELDS, 0)
+    record.update(frame=index, timestamp=1000.0 + index, frame_ms=frame_ms, cpu_ms=cpu_ms,
+                  gpu_ms=gpu_ms, camera_ms=0.1, ground_ms=0.2, tiger_ms=0.3 * index)
+    return record
+
+class TestPercentile(unittest.TestCase):
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile([7.5], 99), 7.5)
+        self.assertEqual(percentile([], 50), 0.0)
+
+class TestFrameStats(unittest.TestCase):
+    def test_history_is_a_ring_and_summary_covers_the_window(self):
+        stats = FrameStats(history=10, window=4)
+        for i in range(25):
+            stats.history.append(frame_record(i, frame_ms=float(i), gpu_ms=2.0 * i if i % 2 else None))
+        self.assertEqual(len(stats.history), 10)
+        self.assertEqual(stats.history[0]['frame'], 15)
+
+        summary = stats.summary()
+        self.assertEqual(summary['frames'], 4)                 # frames 21..24
+        self.assertEqual((summary['frame_p50'], summary['frame_p95'], summary['frame_p99']), (22.0, 24.0, 24.0))
+        self.assertEqual((summary['gpu_p50'], summary['gpu_p95']), (42.0, 46.0))
+        self.assertAlmostEqual(summary['tiger_avg'], 0.3 * 22.5)
+
+        stats.history.append(frame_record(25, frame_ms=99.0))
+        self.assertIs(stats.summary(), summary)                # cached until invalidated
+        stats.invalidate_summary()
+        self.assertEqual(stats.summary()['frame_p99'], 99.0)
+
+    def test_sections_draws_and_visibility_are_recorded_per_frame(self):
+        stats = FrameStats()
+        for _ in range(2):
+            stats.begin_frame()
+            stats.begin_section('tiger')
+            time.sleep(0.005)
+            stats.end_section()
+            stats.begin_section('tiger')             # a section may be entered twice per frame
+            stats.end_section()
+            stats.add_draw(24)
+            stats.add_draw(16 * 17 * 2, calls=16)
+            stats.set_visibility(3, 7)
+            stats.end_frame()
+        last = stats.history[-1]
+        self.assertEqual(stats.frame_index, 2)
+        self.assertGreaterEqual(last['tiger_ms'], 5.0)
+        self.assertGreaterEqual(last['cpu_ms'], last['tiger_ms'])
+        self.assertGreater(last['frame_ms'], 0.0)
+        self.assertEqual(stats.history[0]['frame_ms'], 0.0)   # no previous frame to measure from
+        self.assertEqual((last['draw_calls'], last['vertices']), (17, 24 + 16 * 17 * 2))
+        self.assertEqual((last['objects_drawn'], last['objects_culled']), (3, 7))
+        self.assertIsNone(last['gpu_ms'])                      # no GL context here
+        lines = stats.overlay_lines()
+        self.assertIn("gpu   n/a", lines)
+        self.assertEqual(lines[-1], "objects drawn 3  culled 7")
+
+    def test_export_trace_writes_csv_and_json(self):
+        stats = FrameStats()
+        for i in range(1, 6):
+            stats.history.append(frame_record(i, frame_ms=10.0 + i))
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path, json_path = stats.export_trace(tmp)
+            with open(csv_path, newline='') as f:
+                rows = list(csv.DictReader(f))
+            with open(json_path) as f:
+                trace = json.load(f)
+        self.assertEqual(list(rows[0]), list(FrameStats.FIELDS))
+        self.assertEqual([float(row['frame_ms']) for row in rows], [11.0, 12.0, 13.0, 14.0, 15.0])
+        self.assertEqual(len(trace['frames']), 5)
+        self.assertEqual(trace['summary']['frames'], 5)
+        self.assertEqual(trace['summary']['frame_p95'], 15.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#`tests/test_headless.py`
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from engine3d.frame_stats import FrameStats
+from engine3d.headless import camera_at, format_result, parse_args, run_benchmark
+from logic.game_manager import GameManager
+
+class StubViewport:
+    def __init__(self):
+        self.frame_stats = FrameStats()
+        self.herd_positions = []
+        self.snapshots = []
+        self.cameras = []
+        self.camera_distance, self.camera_rotation_x, self.camera_rotation_y = 8.0, 30.0, 45.0
+
+    def update_scene(self, snapshot):
+        self.snapshots.append(snapshot)
+
+class StubImage:
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(b'png')
+
+class StubRenderer:
+    """Stands in for HeadlessRenderer: records camera moves instead of drawing"""
+
+    def __init__(self):
+        self.game_manager = GameManager(None)
+        self.viewport = StubViewport()
+
+    def render_frame(self):
+        viewport = self.viewport
+        viewport.cameras.append((viewport.camera_distance, viewport.camera_rotation_x,
+                                 viewport.camera_rotation_y))
+        viewport.frame_stats.begin_frame()
+        viewport.frame_stats.add_draw(len(viewport.herd_positions) * 24, calls=len(viewport.herd_positions))
+        viewport.frame_stats.set_visibility(len(viewport.herd_positions), 0)
+        viewport.frame_stats.end_frame()
+
+    def grab(self):
+        return StubImage()
+
+class TestHeadlessArgs(unittest.TestCase):
+    def test_defaults(self):
+        args = parse_args([])
+        self.assertEqual(args.frames, 300)
+        self.assertEqual(args.herd, [1, 10, 100])
+        self.assertEqual(args.camera, 'orbit')
+        self.assertEqual(args.size, (1280, 720))
+        self.assertFalse(args.software)
+        self.assertIsNone(args.dump_dir)
+
+    def test_parses_herd_and_size(self):
+        args = parse_args(['--herd', '4,25', '--size', '640X480', '--camera', 'zoom',
+                           '--dump-dir', 'out', '--dump-every', '5', '--software'])
+        self.assertEqual(args.herd, [4, 25])
+        self.assertEqual(args.size, (640, 480))
+        self.assertEqual((args.camera, args.dump_dir, args.dump_every), ('zoom', 'out', 5))
+        self.assertTrue(args.software)
+
+    def test_rejects_malformed_values(self):
+        for argv in (['--size', '640'], ['--herd', '1,x'], ['--camera', 'dolly']):
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                parse_args(argv)
+
+class TestHeadlessBenchmark(unittest.TestCase):
+    def test_camera_paths(self):
+        self.assertEqual(camera_at('orbit', 0.25, 3.0), (8.0, 30.0, 90.0))
+        self.assertEqual(camera_at('static', 0.9, 3.0), (8.0, 30.0, 45.0))
+        self.assertEqual(camera_at('flyover', 0.5, 0.0), (5.0, 45.0, 90.0))
+        self.assertAlmostEqual(camera_at('zoom', 0.0, 3.0)[0], 10.0)
+        self.assertAlmostEqual(camera_at('zoom', 0.5, 3.0)[0], 2.0)
+
+    def test_summary_and_dumps(self):
+        renderer = StubRenderer()
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run_benchmark(renderer, 10, 4, 'orbit', dump_dir=tmp, dump_every=4)
+            dumps = sorted(os.listdir(tmp))
+        self.assertEqual(dumps, ['herd4_orbit_00000.png', 'herd4_orbit_00004.png', 'herd4_orbit_00008.png'])
+
+        viewport = renderer.viewport
+        self.assertEqual(len(viewport.herd_positions), 4)
+        self.assertEqual(len(viewport.snapshots), 1)
+        self.assertEqual(len(viewport.cameras), 11)                    # warm-up + 10 measured
+        self.assertEqual([c[2] for c in viewport.cameras[1:3]], [0.0, 36.0])
+
+        self.assertEqual((result['herd_size'], result['camera'], result['frames']), (4, 'orbit', 10))
+        self.assertEqual(len(viewport.frame_stats.history), 10)         # warm-up was reset away
+        self.assertEqual((result['draw_calls'], result['vertices']), (4, 96))
+        self.assertIsNone(result['gpu_p50_ms'])
+        self.assertGreater(result['fps'], 0.0)
+        self.assertLessEqual(result['frame_p50_ms'], result['frame_p95_ms'])
+        self.assertLessEqual(result['frame_p95_ms'], result['frame_p99_ms'])
+
+        line = format_result(result)
+        self.assertTrue(line.startswith("herd     4"))
+        self.assertIn("gpu n/a ms  draws 4  verts 96", line)
+
+    def test_no_dumps_without_dump_every(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            run_benchmark(StubRenderer(), 3, 1, 'static', dump_dir=tmp, dump_every=0)
+            self.assertEqual(os.listdir(tmp), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+#`tests/test_leaderboard.py`
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from logic.analytic import GameAnalytics
+from logic.game_manager import GameManager
+from logic.leaderboard import FenwickTree, Leaderboard, PetLeaderboards, RankedList, track_max_level
+from logic.shop import Shop
+from logic.tiger_pet import TigerPet
+
+class TestFenwickTree(unittest.TestCase):
+    def test_prefix_and_find(self):
+        counts = [3, 0, 2, 5, 1]
+        tree = FenwickTree(counts)
+        self.assertEqual([tree.prefix(i) for i in range(6)], [0, 3, 3, 5, 10, 11])
+        self.assertEqual(tree.find(0), (0, 0))
+        self.assertEqual(tree.find(3), (2, 0))
+        self.assertEqual(tree.find(9), (3, 4))
+        tree.add(1, 4)
+        self.assertEqual(tree.find(3), (1, 0))
+        self.assertEqual(tree.prefix(5), 15)
+
+class TestRankedList(unittest.TestCase):
+    def test_matches_a_sorted_list_under_random_edits(self):
+        rng = random.Random(5)
+        ranked = RankedList(rng.sample(range(10000), 300), block_size=8)
+        expected = sorted(ranked.islice(0, len(ranked)))
+        for _ in range(2000):
+            if expected and rng.random() < 0.45:
+                key = rng.choice(expected)
+                ranked.remove(key)
+                expected.remove(key)
+            else:
+                key = rng.randrange(10000)
+                if key in expected:
+                    continue
+                ranked.add(key)
+                expected.append(key)
+                expected.sort()
+            probe = rng.randrange(len(expected))
+            self.assertEqual(ranked[probe], expected[probe])
+            self.assertEqual(ranked.index(expected[probe]), probe)
+        self.assertEqual(list(ranked.islice(0, len(ranked))), expected)
+        self.assertEqual(list(ranked.islice(10, 20)), expected[10:20])
+
+    def test_missing_keys(self):
+        ranked = RankedList()
+        with self.assertRaises(KeyError):
+            ranked.remove(1)
+        ranked.add(1)
+        ranked.remove(1)
+        with self.assertRaises(KeyError):
+            ranked.index(1)
+        with self.assertRaises(IndexError):
+            ranked[0]
+
+class TestLeaderboard(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.scores = {entry: rng.randrange(50) for entry in range(500)}
+        self.board = Leaderboard(self.scores, block_size=16)
+
+    def brute(self):
+        return sorted(self.scores, key=lambda entry: (-self.scores[entry], entry))
+
+    def test_rank_top_and_around_match_a_full_sort(self):
+        rng = random.Random(3)
+        for _ in range(300):
+            entry = rng.randrange(600)
+            self.scores[entry] = rng.randrange(50)
+            self.board.set(entry, self.scores[entry])
+        order = self.brute()
+        self.assertEqual([e for _, e, _ in self.board.top(10)], order[:10])
+        for entry in rng.sample(order, 20):
+            rank = order.index(entry) + 1
+            self.assertEqual(self.board.rank(entry), rank)
+            self.assertEqual(self.board.at(rank), (entry, self.scores[entry]))
+            window = self.board.around(entry, 3)
+            self.assertEqual([e for _, e, _ in window], order[max(0, rank - 4):rank + 3])
+            self.assertIn((rank, entry, self.scores[entry]), window)
+
+    def test_discard(self):
+        best = self.board.top(1)[0][1]
+        self.board.discard(best)
+        self.assertNotIn(best, self.board)
+        self.assertNotEqual(self.board.top(1)[0][1], best)
+        self.assertEqual(len(self.board), 499)
+
+class TestPetLeaderboards(unittest.TestCase):
+    def test_boards_follow_level_ups_exp_and_coin_changes(self):
+        boards = PetLeaderboards()
+        pets = [TigerPet() for _ in range(5)]
+        for pet in pets:
+            boards.add(pet)
+        pets[3].add_exp(250)            # two level-ups
+        self.assertEqual(boards['level'].top(1)[0][1:], (3, pets[3].level))
+        self.assertEqual(boards['coins'].scores[3], int(pets[3].coins))
+
+        pets[1].set_coins(10_000)
+        self.assertEqual(boards['coins'].rank(1), 1)
+        Shop().buy_item(Shop().items[0], pets[1])
+        self.assertEqual(boards['coins'].scores[1], int(pets[1].coins))
+
+        pets[2].update(1.0)
+        self.assertEqual(boards['exp'].scores[2], pets[2].exp)
+
+        data = pets[0].to_dict()
+        data['level'] = 40
+        pets[0].from_dict(data)
+        self.assertEqual(boards['level'].rank(0), 1)
+
+        boards.remove(pets[0])
+        pets[0].level_up()
+        self.assertNotIn(0, boards['level'])
+        self.assertEqual(pets[0].listeners, {})
+
+    def test_subclassed_pets_report_coin_changes(self):
+        class ShowPet(TigerPet):
+            pass
+        boards = PetLeaderboards(('coins',))
+        pet = ShowPet()
+        boards.add(pet)
+        pet.add_exp(40)
+        self.assertEqual(boards['coins'].scores[0], 120)
+        pet.set_coins(7)
+        self.assertEqual(boards['coins'].scores[0], 7)
+
+    def test_max_level_reached(self):
+        board = Leaderboard()
+        with tempfile.TemporaryDirectory() as tmp:
+            players = []
+            for level in (3, 1, 2):
+                analytics = GameAnalytics()
+                analytics.stats_file = Path(tmp) / 'analytics.json'
+                analytics.stats = analytics._load_stats()
+                analytics.update_max_level(level)
+                track_max_level(board, analytics, len(players))
+                players.append(analytics)
+            self.assertEqual([entry for _, entry, _ in board.top(3)], [0, 2, 1])
+            players[1].update_max_level(9)
+            players[1].update_max_level(4)     # not a new maximum
+            self.assertEqual(board.top(1), [(1, 1, 9)])
+
+    def test_game_manager_reports_level_ups_to_analytics(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            analytics = GameAnalytics()
+            analytics.stats_file = Path(tmp) / 'analytics.json'
+            analytics.stats = analytics._load_stats()
+        board = Leaderboard()
+        track_max_level(board, analytics, 'player')
+        manager = GameManager(None, analytics)
+        manager.pet.add_exp(250)                   # two level-ups
+        self.assertEqual(board.scores['player'], 3)
+        index = manager.add_pet()
+        manager.pets[index].add_exp(1000)
+        self.assertEqual(board.scores['player'], manager.pets[index].level)
+        manager.pet.level_up()                     # below the best pet: not a new maximum
+        self.assertEqual(analytics.stats['max_level_reached'], manager.pets[index].level)
+
+if __name__ == '__main__':
+    unittest.main()
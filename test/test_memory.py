@@ -0,0 +1,52 @@
+#`tests/test_memory.py`
+
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+from services.memory import MemoryMonitor, ROOT, package_of
+from logic.stat_history import StatHistory
+
+class TestMemoryMonitor(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.monitor = MemoryMonitor(budget_mb=1000, out_dir=self.tmp.name)
+        self.monitor.start(background=False)
+
+    def tearDown(self):
+        if tracemalloc.is_tracing():
+            self.monitor.stop()
+        self.tmp.cleanup()
+
+    def test_package_of(self):
+        self.assertEqual(package_of(str(ROOT / 'logic' / 'tiger_pet.py')), 'logic')
+        self.assertEqual(package_of(str(ROOT / 'engine3d' / 'viewport.py')), 'engine3d')
+        self.assertIsNone(package_of(str(ROOT / 'main.py')))
+        self.assertIsNone(package_of(tracemalloc.__file__))
+
+    def test_growth_is_attributed_to_package(self):
+        first = self.monitor.check()
+        history = StatHistory(capacity=100_000)  # ~2.4 MB of sample arrays
+        second = self.monitor.check()
+        self.assertGreater(second['packages']['logic'] - first['packages']['logic'], 2_000_000)
+        self.assertTrue(second['growth'])
+        report = Path(second['path']).read_text()
+        self.assertIn('Growth since first snapshot', report)
+        self.assertIn('stat_history.py', report)
+        del history
+
+    def test_budget_warning(self):
+        self.monitor.check(write=False)
+        self.assertFalse(self.monitor.over_budget)
+        self.monitor.budget_bytes = 1
+        self.monitor.check(write=False)
+        self.assertTrue(self.monitor.over_budget)
+        self.monitor.budget_bytes = float('inf')
+
+    def test_stop_ends_tracing_it_started(self):
+        report = self.monitor.stop()
+        self.assertIn('path', report)
+        self.assertFalse(tracemalloc.is_tracing())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#`tests/test_metrics.py`
+
+import os
+import tempfile
+import unittest
+import urllib.request
+from services.metrics import MetricsRegistry, MetricsServer
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry(enabled=True)
+
+    def test_disabled_registry_ignores_updates(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('c', 'help')
+        histogram = registry.histogram('h', 'help')
+        counter.inc()
+        histogram.observe(0.1)
+        with histogram.time():
+            pass
+        self.assertEqual(counter.value, 0)
+        self.assertEqual(histogram.count, 0)
+
+    def test_same_name_returns_same_metric(self):
+        self.assertIs(self.registry.counter('c', 'help'), self.registry.counter('c', 'help'))
+        with self.assertRaises(ValueError):
+            self.registry.gauge('c', 'help')
+
+    def test_counter_with_labels(self):
+        actions = self.registry.counter('actions', 'Pet actions', ('action',))
+        actions.labels('feed').inc()
+        actions.labels('feed').inc(2)
+        actions.labels('play').inc()
+        text = self.registry.render()
+        self.assertIn('# TYPE actions counter', text)
+        self.assertIn('actions_total{action="feed"} 3', text)
+        self.assertIn('actions_total{action="play"} 1', text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = self.registry.histogram('tick_seconds', 'Tick', buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+        text = self.registry.render()
+        self.assertIn('tick_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('tick_seconds_bucket{le="1.0"} 3', text)
+        self.assertIn('tick_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn('tick_seconds_count 4', text)
+        self.assertIn('tick_seconds_sum 6.05', text)
+
+    def test_dump_and_http_exposition(self):
+        self.registry.gauge('pets', 'Pets').set(7)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metrics.prom')
+            self.registry.dump(path)
+            with open(path) as f:
+                self.assertIn('pets 7', f.read())
+
+        server = MetricsServer(self.registry, port=0).start()
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{server.port}/metrics') as response:
+                self.assertIn('text/plain', response.headers['Content-Type'])
+                self.assertIn('pets 7', response.read().decode())
+        finally:
+            server.stop()
+
+if __name__ == '__main__':
+    unittest.main()
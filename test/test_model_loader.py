@@ -0,0 +1,77 @@
+#`tests/test_model_loader.py`
+
+import base64
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from engine3d.model_loader import MeshCache, load_mesh, parse_obj, parse_gltf
+
+QUAD_OBJ = """
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vt 0 0
+vt 1 0
+vt 1 1
+vt 0 1
+vn 0 0 1
+f 1/1/1 2/2/1 3/3/1 4/4/1
+"""
+
+class TestModelLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.obj_path = self.dir / 'quad.obj'
+        self.obj_path.write_text(QUAD_OBJ)
+        self.cache = MeshCache(self.dir / 'cache')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_obj_quad_is_triangulated(self):
+        mesh = parse_obj(self.obj_path)
+        self.assertEqual(mesh.vertex_count, 4)
+        self.assertEqual(list(mesh.indices), [0, 1, 2, 0, 2, 3])
+        self.assertEqual(mesh.vertices.shape, (4, 8))
+        self.assertEqual(tuple(mesh.vertices[2, 3:6]), (0.0, 0.0, 1.0))
+
+    def test_cache_round_trip(self):
+        first = load_mesh(self.obj_path, self.cache)
+        self.assertFalse(first.from_cache)
+        second = load_mesh(self.obj_path, self.cache)
+        self.assertTrue(second.from_cache)
+        np.testing.assert_array_equal(first.vertices, second.vertices)
+        np.testing.assert_array_equal(first.indices, second.indices)
+        self.assertEqual(second.bounds_max, (1.0, 1.0, 0.0))
+
+    def test_changed_source_misses_cache(self):
+        load_mesh(self.obj_path, self.cache)
+        self.obj_path.write_text(QUAD_OBJ + "v 2 2 2\n")
+        self.assertFalse(load_mesh(self.obj_path, self.cache).from_cache)
+
+    def test_gltf_embedded_buffer(self):
+        positions = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+        indices = np.array([0, 1, 2, 0], dtype=np.uint16)  # padded to 4-byte alignment
+        blob = positions.tobytes() + indices.tobytes()
+        document = {
+            'buffers': [{'byteLength': len(blob),
+                         'uri': 'data:application/octet-stream;base64,' + base64.b64encode(blob).decode()}],
+            'bufferViews': [{'buffer': 0, 'byteOffset': 0, 'byteLength': 36},
+                            {'buffer': 0, 'byteOffset': 36, 'byteLength': 6}],
+            'accessors': [{'bufferView': 0, 'componentType': 5126, 'count': 3, 'type': 'VEC3'},
+                          {'bufferView': 1, 'componentType': 5123, 'count': 3, 'type': 'SCALAR'}],
+            'meshes': [{'primitives': [{'attributes': {'POSITION': 0}, 'indices': 1}]}],
+        }
+        path = self.dir / 'tri.gltf'
+        path.write_text(json.dumps(document))
+        mesh = parse_gltf(path)
+        self.assertEqual(list(mesh.indices), [0, 1, 2])
+        np.testing.assert_allclose(mesh.vertices[:, 3:6], [[0, 0, 1]] * 3)
+
+if __name__ == '__main__':
+    unittest.main()
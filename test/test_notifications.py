@@ -0,0 +1,59 @@
+#`tests/test_notifications.py`
+
+import unittest
+from logic.notifications import NotificationQueue
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+class TestNotificationQueue(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.queue = NotificationQueue(min_interval=1.0, display_time=2.5, max_pending=3, clock=self.clock)
+
+    def test_first_message_shows_immediately(self):
+        self.queue.push("Fed!")
+        self.assertEqual(self.queue.pop_ready().text, "Fed!")
+        self.assertIsNone(self.queue.pop_ready())
+
+    def test_repeats_coalesce_into_visible_message(self):
+        self.queue.push("Fed!")
+        self.queue.pop_ready()
+        self.queue.push("Fed!")
+        self.queue.push("Fed!")
+        note = self.queue.pop_ready()
+        self.assertEqual(note.text, "Fed! ×3")
+        self.assertEqual(len(self.queue.pending), 0)
+
+    def test_rate_limit_between_different_messages(self):
+        self.queue.push("Fed!")
+        self.queue.pop_ready()
+        self.queue.push("Played!", False)
+        self.assertIsNone(self.queue.pop_ready())
+        self.assertAlmostEqual(self.queue.wait_time(), 1.0)
+        self.clock.now += 1.0
+        note = self.queue.pop_ready()
+        self.assertEqual((note.text, note.success), ("Played!", False))
+
+    def test_expired_message_is_not_extended(self):
+        self.queue.push("Fed!")
+        self.queue.pop_ready()
+        self.clock.now += 3.0
+        self.queue.push("Fed!")
+        self.assertEqual(self.queue.pop_ready().text, "Fed!")
+
+    def test_burst_is_bounded_and_aggregated(self):
+        for i in range(50):
+            self.queue.push("Fed!" if i % 2 else "Cleaned!")
+        self.assertLessEqual(len(self.queue.pending), 3)
+        self.assertEqual(sum(n.count for n in self.queue.pending) + self.queue.dropped, 50)
+        self.assertEqual(self.queue.aggregate(), [("Cleaned!", True, 25), ("Fed!", True, 25)])
+        self.queue.reset_aggregate()
+        self.assertEqual(self.queue.aggregate(), [])
+
+if __name__ == '__main__':
+    unittest.main()
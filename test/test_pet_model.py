@@ -0,0 +1,65 @@
+#`tests/test_pet_model.py`
+
+import unittest
+from logic.pet_model import ObservablePetModel
+from logic.tiger_pet import TigerPet
+
+class TestObservablePetModel(unittest.TestCase):
+    def setUp(self):
+        self.model = ObservablePetModel()
+        self.pet = TigerPet()
+        self.stats = []
+        self.coins = []
+        self.model.subscribe(('hunger', 'energy', 'mood', 'cleanliness'), self.stats.append)
+        self.model.subscribe(('coins',), self.coins.append)
+        self.model.apply(self.pet)
+        self.model.flush()
+
+    def test_first_flush_delivers_everything(self):
+        self.assertEqual(self.stats, [{'hunger': 100, 'energy': 100, 'mood': 100, 'cleanliness': 100}])
+        self.assertEqual(self.coins, [{'coins': 100}])
+
+    def test_steady_tick_notifies_nobody(self):
+        for field in ('hunger', 'energy', 'mood', 'cleanliness'):
+            setattr(self.pet, field, 50.9)
+        self.model.apply(self.pet)
+        self.model.flush()
+        self.pet.update(0.5)  # decay stays within the same whole number
+        self.model.apply(self.pet)
+        self.model.flush()
+        self.assertEqual(len(self.stats), 2)
+        self.assertEqual(len(self.coins), 1)
+
+    def test_only_changed_fields_reach_subscribers(self):
+        self.pet.hunger = 55.7
+        self.model.apply(self.pet)
+        self.model.flush()
+        self.assertEqual(self.stats[-1], {'hunger': 55})
+        self.assertEqual(len(self.coins), 1)
+
+    def test_changes_batched_until_flush(self):
+        self.model.set('hunger', 80)
+        self.model.set('hunger', 70)
+        self.model.set('coins', 90)
+        self.assertEqual(len(self.stats), 1)
+        self.model.flush()
+        self.assertEqual(self.stats[-1], {'hunger': 70})
+        self.assertEqual(self.coins[-1], {'coins': 90})
+
+    def test_reverted_change_is_dropped(self):
+        self.model.set('mood', 40)
+        self.model.set('mood', 100.4)
+        self.model.flush()
+        self.assertEqual(len(self.stats), 1)
+
+    def test_late_subscriber_gets_current_values(self):
+        seen = []
+        self.model.subscribe(('level', 'state'), seen.append)
+        self.assertEqual(seen, [{'level': 1, 'state': 'happy'}])
+
+    def test_unknown_field_rejected(self):
+        with self.assertRaises(ValueError):
+            self.model.subscribe(('hungr',), print)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+#`tests/test_pet_server.py`
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from logic.game_manager import GameManager
+from server.pet_server import PetServer, PetService
+from server.protocol import (OP_CLOSE, OP_TEXT, encode_frame, encode_request, read_frame,
+                             read_response)
+from services.save_manager import SaveManager
+
+class TestGameManagerServerHooks(unittest.TestCase):
+    def test_advance_updates_every_pet_without_saving(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            save_file = os.path.join(tmp, 'nested', 'p.json')
+            manager = GameManager(SaveManager(save_file))
+            manager.add_pet()
+            before = [pet.hunger for pet in manager.pets]
+            manager.advance(10.0)
+            self.assertTrue(all(pet.hunger < h for pet, h in zip(manager.pets, before)))
+            self.assertFalse(os.path.exists(save_file))
+
+    def test_save_data_round_trips(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = GameManager(SaveManager(os.path.join(tmp, 'p.json')))
+            manager.pet.coins = 321
+            manager.save_game()
+            loaded = GameManager(SaveManager(os.path.join(tmp, 'p.json')))
+            loaded.load_game()
+            self.assertEqual(loaded.pet.coins, 321)
+            self.assertEqual(set(manager.save_data()), {'pet', 'pets', 'active_pet_index', 'last_save_time'})
+
+class TestPetServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def run_server(self, scenario, **server_args):
+        async def main():
+            service = PetService(self.tmp.name, tick_interval=0.05, save_interval=3600, tick_slice=2)
+            server = PetServer(service, **server_args)
+            port = await server.start('127.0.0.1', 0)
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+            async def request(method, path, payload=None):
+                writer.write(encode_request(method, path, payload))
+                await writer.drain()
+                status, headers, body = await read_response(reader)
+                return status, json.loads(body) if body else None
+            try:
+                return await scenario(service, request, port)
+            finally:
+                writer.close()
+                await server.close()
+        return asyncio.run(main())
+
+    def test_create_read_and_act(self):
+        async def scenario(service, request, port):
+            self.assertEqual((await request('PUT', '/pets/alice'))[0], 201)
+            self.assertEqual((await request('PUT', '/pets/alice'))[0], 200)
+            status, state = await request('GET', '/pets/alice')
+            self.assertEqual(status, 200)
+            self.assertEqual(state['player'], 'alice')
+            self.assertEqual(len(state['pets']), 1)
+
+            service.tenants['alice'].pet.hunger = 10
+            status, result = await request('POST', '/pets/alice/feed')
+            self.assertTrue(result['success'])
+            self.assertGreater(result['pet']['hunger'], 10)
+
+            status, result = await request('POST', '/pets/alice/buy', {'item': 0})
+            self.assertEqual(status, 200)
+            self.assertIn('coins', result)
+            status, result = await request('POST', '/pets/alice/buy', {'item': 'Nothing'})
+            self.assertFalse(result['success'])
+            status, result = await request('POST', '/pets/alice/buy', {'item': True})
+            self.assertEqual((result['success'], result['message']), (False, 'Unknown item'))
+        self.run_server(scenario)
+
+    def test_errors(self):
+        async def scenario(service, request, port):
+            self.assertEqual((await request('GET', '/pets/nobody'))[0], 404)
+            self.assertEqual((await request('GET', '/elsewhere'))[0], 404)
+            self.assertEqual((await request('PUT', '/pets/bad%20name'))[0], 400)
+            await request('PUT', '/pets/bob')
+            self.assertEqual((await request('POST', '/pets/bob/dance'))[0], 405)
+            for body in ([1], 'x', 3):
+                status, result = await request('POST', '/pets/bob/buy', body)
+                self.assertEqual(status, 400)
+                self.assertIn('JSON object', result['error'])
+        self.run_server(scenario)
+
+    def test_leaderboard_routes(self):
+        async def scenario(service, request, port):
+            for name in ('low', 'high', 'mid'):
+                await request('PUT', f'/pets/{name}')
+            service.tenants['high'].pet.add_exp(1000)
+            service.tenants['mid'].pet.add_exp(150)
+            status, body = await request('GET', '/leaderboard/level?top=2')
+            self.assertEqual(status, 200)
+            self.assertEqual([row['player'] for row in body['entries']], ['high', 'mid'])
+            status, body = await request('GET', '/pets/low/rank?board=level&radius=1')
+            self.assertEqual(body['rank'], 3)
+            self.assertEqual([row['player'] for row in body['around']], ['mid', 'low'])
+            self.assertEqual((await request('GET', '/leaderboard/exp'))[0], 404)
+        self.run_server(scenario)
+
+    def test_queued_save_loads_shed_new_players_with_503(self):
+        async def scenario(service, request, port):
+            await request('PUT', '/pets/early')
+            service.max_pending_loads = 0
+            status, body = await request('PUT', '/pets/late')
+            self.assertEqual(status, 503)
+            self.assertTrue(body['error'].startswith('overloaded'))
+            self.assertEqual((await request('GET', '/pets/early'))[0], 200)
+            status, stats = await request('GET', '/stats')
+            self.assertEqual((stats['rejected'], stats['pending_loads']), (1, 0))
+        self.run_server(scenario)
+
+    def test_a_failing_tick_does_not_stop_ticking(self):
+        async def scenario(service, request, port):
+            advance = service.advance
+            failures = []
+            async def flaky_advance(delta_time):
+                if not failures:
+                    failures.append(delta_time)
+                    raise RuntimeError('boom')
+                await advance(delta_time)
+            service.advance = flaky_advance
+            tick = service.tick
+            with redirect_stdout(StringIO()) as output:
+                for _ in range(100):
+                    if service.tick >= tick + 2:
+                        break
+                    await asyncio.sleep(0.02)
+            self.assertGreaterEqual(service.tick, tick + 2)
+            self.assertIn("failed: boom", output.getvalue())
+        self.run_server(scenario)
+
+    def test_websocket_messages_of_the_wrong_shape_get_an_error_reply(self):
+        service = PetService(self.tmp.name)
+        self.addCleanup(service._writer.shutdown)
+        server = PetServer(service)
+        for payload in ('{"action": ["x"]}', '{"action": {"feed": 1}}', '[1]', 'feed'):
+            self.assertIn('error', server._ws_message('alice', payload))
+
+    def test_ticks_advance_every_tenant_and_stats_report_them(self):
+        async def scenario(service, request, port):
+            for name in ('a', 'b', 'c', 'd', 'e'):
+                await request('PUT', f'/pets/{name}')
+            hunger = {name: m.pet.hunger for name, m in service.tenants.items()}
+            await service.advance(60.0)
+            for name, manager in service.tenants.items():
+                self.assertLess(manager.pet.hunger, hunger[name])
+            status, stats = await request('GET', '/stats')
+            self.assertEqual(stats['tenants'], 5)
+            self.assertGreaterEqual(stats['tick'], 1)
+            self.assertGreater(stats['tick_max_ms'], 0)
+        self.run_server(scenario)
+
+    def test_save_all_writes_each_player_and_reloads(self):
+        async def scenario(service, request, port):
+            await request('PUT', '/pets/carol')
+            service.tenants['carol'].pet.coins = 777
+            await service.save_all()
+            self.assertEqual(service.saves_written, 1)
+        self.run_server(scenario)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, 'carol.json')))
+
+        async def reload(service, request, port):
+            status, state = await request('PUT', '/pets/carol')
+            self.assertEqual(status, 201)
+            self.assertEqual(state['pets'][0]['coins'], 777)
+        self.run_server(reload)
+
+    def test_websocket_pushes_ticks_and_accepts_actions(self):
+        async def scenario(service, request, port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'GET /pets/dave/ws HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\n'
+                         b'Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n'
+                         b'Sec-WebSocket-Version: 13\r\n\r\n')
+            head = await reader.readuntil(b'\r\n\r\n')
+            self.assertIn(b'101', head)
+            self.assertIn(b's3pPLMBiTxaQ9kYGzzhZRbK+xOo=', head)
+
+            opcode, payload = await asyncio.wait_for(read_frame(reader), 2)
+            self.assertEqual(opcode, OP_TEXT)
+            self.assertEqual(json.loads(payload)['player'], 'dave')
+
+            writer.write(encode_frame(OP_TEXT, json.dumps({'action': 'play'}), mask=b'\x01\x02\x03\x04'))
+            while True:
+                opcode, payload = await asyncio.wait_for(read_frame(reader), 2)
+                message = json.loads(payload)
+                if 'action' in message:
+                    break
+            self.assertEqual(message['action'], 'play')
+            writer.write(encode_frame(OP_CLOSE, mask=b'\x01\x02\x03\x04'))
+            writer.close()
+        self.run_server(scenario)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#`tests/test_picking.py`
+
+import random
+import time
+import unittest
+from engine3d import transforms
+from engine3d.picking import BVH, ground_boxes, unproject_ray
+from engine3d.tiger_model import herd_layout
+
+def brute_force(bounds_min, bounds_max, origin, direction):
+    best = None
+    for i, (lo, hi) in enumerate(zip(bounds_min, bounds_max)):
+        t0, t1 = 0.0, float('inf')
+        for axis in range(3):
+            if direction[axis] == 0:
+                if not lo[axis] <= origin[axis] <= hi[axis]:
+                    break
+                continue
+            a = (lo[axis] - origin[axis]) / direction[axis]
+            b = (hi[axis] - origin[axis]) / direction[axis]
+            t0, t1 = max(t0, min(a, b)), min(t1, max(a, b))
+        else:
+            if t0 <= t1 and (best is None or t0 < best[1]):
+                best = (i, t0)
+    return best
+
+class TestPicking(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(5)
+        bounds_min, bounds_max = ground_boxes(herd_layout(500), 1.3, -1.0, 1.1)
+        bvh = BVH(bounds_min, bounds_max)
+        for _ in range(200):
+            origin = (rng.uniform(-40, 40), rng.uniform(2, 20), rng.uniform(-40, 40))
+            direction = (rng.uniform(-1, 1), -1.0, rng.uniform(-1, 1))
+            length = sum(d * d for d in direction) ** 0.5
+            direction = tuple(d / length for d in direction)
+            expected = brute_force(bounds_min.tolist(), bounds_max.tolist(), origin, direction)
+            hit = bvh.intersect(origin, direction)
+            if expected is None:
+                self.assertIsNone(hit)
+            else:
+                self.assertAlmostEqual(hit[1], expected[1], places=6)
+
+    def test_screen_centre_picks_target(self):
+        positions = [(0.0, 0.0), (6.0, 0.0), (-6.0, 0.0)]
+        bvh = BVH(*ground_boxes(positions, 1.3, -1.0, 1.1))
+        projection = transforms.perspective(45, 4 / 3, 0.1, 100.0)
+        view = transforms.look_at((6.0, 4.0, 8.0), (6.0, 0.0, 0.0), (0, 1, 0))
+        ray = unproject_ray(400, 300, 800, 600, projection, view)
+        self.assertEqual(bvh.intersect(*ray)[0], 1)
+        ray = unproject_ray(0, 0, 800, 600, projection, view)
+        self.assertIsNone(bvh.intersect(*ray))
+
+    def test_pick_latency_at_100k(self):
+        bvh = BVH(*ground_boxes(herd_layout(100000), 1.3, -1.0, 1.1))
+        projection = transforms.perspective(45, 16 / 9, 0.1, 100.0)
+        rng = random.Random(9)
+        start = time.perf_counter()
+        for _ in range(100):
+            eye = (rng.uniform(-350, 350), 20.0, rng.uniform(-350, 350))
+            view = transforms.look_at(eye, (eye[0] + 10, 0.0, eye[2] + 10), (0, 1, 0))
+            ray = unproject_ray(rng.uniform(0, 1280), rng.uniform(0, 720), 1280, 720, projection, view)
+            bvh.intersect(*ray)
+        self.assertLess((time.perf_counter() - start) / 100, 0.001)
+
+if __name__ == '__main__':
+    unittest.main()
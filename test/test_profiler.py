@@ -0,0 +1,68 @@
+#`tests/test_profiler.py`
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from services.profiler import SamplingProfiler
+
+def busy_worker(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+class TestSamplingProfiler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_samples_worker_threads_and_writes_both_formats(self):
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_worker, args=(stop,), name='busy')
+        worker.start()
+        profiler = SamplingProfiler(interval=0.001, out_dir=self.out_dir)
+        try:
+            profiler.start()
+            time.sleep(0.1)
+            paths = profiler.stop()
+        finally:
+            stop.set()
+            worker.join()
+
+        self.assertGreater(profiler.sample_count, 0)
+        json_path, folded_path = paths
+        folded = folded_path.read_text()
+        self.assertTrue(any(line.startswith('busy;') and 'busy_worker' in line
+                            for line in folded.splitlines()))
+        self.assertNotIn('sampling-profiler', folded)
+
+        data = json.loads(json_path.read_text())
+        names = [profile['name'] for profile in data['profiles']]
+        self.assertIn('busy', names)
+        frame_names = {frame['name'] for frame in data['shared']['frames']}
+        self.assertIn('busy_worker', frame_names)
+        for profile in data['profiles']:
+            self.assertEqual(len(profile['samples']), len(profile['weights']))
+
+    def test_stop_without_start_writes_nothing(self):
+        self.assertEqual(SamplingProfiler(out_dir=self.out_dir).stop(), [])
+        self.assertEqual(list(self.out_dir.iterdir()), [])
+
+    def test_old_profiles_trimmed_to_cap(self):
+        for i in range(5):
+            path = self.out_dir / f'old-{i}.folded'
+            path.write_text('x' * 1000)
+        profiler = SamplingProfiler(out_dir=self.out_dir, max_bytes=2500)
+        profiler.started_at = time.time()
+        profiler.sample()
+        paths = profiler.write()
+        remaining = list(self.out_dir.iterdir())
+        self.assertTrue(all(path in remaining for path in paths))
+        self.assertLessEqual(sum(p.stat().st_size for p in remaining if p not in paths), 2500)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+#`tests/test_rules.py`
+
+import copy
+import json
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from multiprocessing import shared_memory
+import numpy as np
+from logic.rules import RULES, RULES_FILE, STATES, RuleSet, RulesError
+from logic.sharded import PetArrays, ShardedSimulation, act_many, nbytes
+from logic.tiger_pet import PetState, TigerPet
+
+def random_herd(count, seed=3):
+    rng = random.Random(seed)
+    herd = []
+    for _ in range(count):
+        pet = TigerPet()
+        for stat in ('hunger', 'energy', 'mood', 'cleanliness'):
+            # whole numbers too, so the threshold edges get exercised
+            setattr(pet, stat, float(rng.randrange(101)) if rng.random() < 0.3 else rng.uniform(0, 100))
+        pet.exp = rng.uniform(0, 99)
+        pet.age = rng.randrange(30)
+        herd.append(pet)
+    return herd
+
+def reference_state(pet):
+    # The ladder TigerPet hardcoded before the rules file
+    if pet.hunger < 20: return PetState.HUNGRY
+    if pet.energy < 20: return PetState.TIRED
+    if pet.cleanliness < 20: return PetState.DIRTY
+    if pet.mood < 30: return PetState.SAD
+    if pet.mood > 70 and pet.hunger > 50 and pet.energy > 50: return PetState.HAPPY
+    return PetState.NEUTRAL
+
+class PetColumns:
+    """numpy columns for a list of pets, shaped like PetArrays"""
+    def __init__(self, pets):
+        for field in ('hunger', 'energy', 'mood', 'cleanliness', 'level', 'exp', 'coins', 'age'):
+            setattr(self, field, np.array([float(getattr(pet, field)) for pet in pets]))
+        self.size = len(pets)
+
+    def __len__(self):
+        return self.size
+
+class TestShippedRules(unittest.TestCase):
+    def test_scalar_kernels_match_the_original_rules(self):
+        for pet in random_herd(2000):
+            modifier = 0
+            if pet.hunger < 30: modifier -= 0.2
+            if pet.energy < 30: modifier -= 0.15
+            if pet.cleanliness < 30: modifier -= 0.1
+            self.assertEqual(RULES.mood_modifier(pet), modifier)
+            self.assertIs(RULES.state_of(pet), reference_state(pet))
+            self.assertEqual(RULES.is_healthy(pet), pet.hunger > 40 and pet.energy > 40 and
+                             pet.mood > 40 and pet.cleanliness > 30)
+
+    def test_vector_kernels_match_the_scalar_kernels(self):
+        herd = random_herd(2000)
+        columns = PetColumns(herd)
+        self.assertEqual(RULES.mood_modifiers(columns).tolist(), [RULES.mood_modifier(pet) for pet in herd])
+        self.assertEqual([STATES[code] for code in RULES.state_codes(columns)], [RULES.state_of(pet) for pet in herd])
+        self.assertEqual(RULES.healthy_mask(columns).tolist(), [RULES.is_healthy(pet) for pet in herd])
+
+    def test_actions(self):
+        pet = TigerPet()
+        self.assertEqual(pet.feed(), (False, "Tiger says: No thanks, I'm full! 🍖"))
+        pet.hunger, pet.energy, pet.mood = 50.0, 95.0, 90.0
+        success, message = pet.play()
+        self.assertTrue(success)
+        self.assertIn(message, RULES.actions['play'].messages)
+        self.assertEqual((pet.mood, pet.energy, pet.hunger, pet.exp), (100, 80.0, 40.0, 8))
+
+    def test_act_many_matches_the_scalar_actions(self):
+        herd = random_herd(500, seed=9)
+        block = shared_memory.SharedMemory(create=True, size=nbytes(len(herd)))
+        try:
+            pets = PetArrays(block.buf, len(herd))
+            for i, pet in enumerate(herd):
+                pets.store(i, pet)
+            for action in ('feed', 'clean', 'sleep', 'play'):
+                expected = [i for i, pet in enumerate(herd) if getattr(pet, action)()[0]]
+                accepted = act_many(pets, np.arange(len(herd)), action)
+                self.assertEqual(accepted.tolist(), expected, action)
+            for i, pet in enumerate(herd):
+                self.assertEqual(pets.load(i).to_dict(), pet.to_dict(), f"pet {i}")
+            del pets
+        finally:
+            block.close()
+            block.unlink()
+
+class TestRuleFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'rules.json'
+        self.data = json.loads(RULES_FILE.read_text(encoding='utf-8'))
+        self.stamp = 1_700_000_000 * 10**9
+        self.write()
+        self.rules = RuleSet(self.path, check_interval=5.0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, data=None):
+        self.path.write_text(json.dumps(self.data if data is None else data), encoding='utf-8')
+        # a distinct mtime per write, even on coarse-grained filesystems
+        self.stamp += 10**9
+        os.utime(self.path, ns=(self.stamp, self.stamp))
+
+    def test_hot_reload_after_the_file_changes(self):
+        pet = TigerPet()
+        pet.hunger = 25.0
+        self.assertIs(self.rules.state_of(pet), PetState.NEUTRAL)
+        self.assertFalse(self.rules.reload_if_changed(now=100.0))
+
+        self.data['states'][0]['when'][0]['below'] = 30
+        self.write()
+        self.assertFalse(self.rules.reload_if_changed(now=101.0))     # inside the check interval
+        self.assertTrue(self.rules.reload_if_changed(now=105.0))
+        self.assertIs(self.rules.state_of(pet), PetState.HUNGRY)
+        self.assertEqual(self.rules.generation, 2)
+        self.assertFalse(self.rules.reload_if_changed(now=110.0))
+
+    def test_an_invalid_edit_keeps_the_previous_rules(self):
+        self.data['healthy'][0] = {'stat': 'hunger', 'roughly': 40}
+        self.write()
+        output = StringIO()
+        with redirect_stdout(output):
+            self.assertFalse(self.rules.reload_if_changed(now=100.0))
+        self.assertIn("Error loading rules", output.getvalue())
+        self.assertEqual(self.rules.generation, 1)
+        self.assertTrue(self.rules.is_healthy(TigerPet()))
+        with redirect_stdout(output):
+            self.assertFalse(self.rules.reload_if_changed(now=110.0))
+        self.assertEqual(output.getvalue().count("Error loading rules"), 1)
+
+        self.data['mood_modifiers'] = [1]                   # valid JSON, wrong shape
+        self.write()
+        with redirect_stdout(output):
+            self.assertFalse(self.rules.reload_if_changed(now=150.0))
+        self.assertEqual(self.rules.generation, 1)
+
+        self.path.write_text('{"states": [', encoding='utf-8')
+        with redirect_stdout(StringIO()):
+            self.assertFalse(self.rules.reload_if_changed(now=200.0))
+        self.assertEqual(self.rules.generation, 1)
+
+    def test_sharded_workers_pick_up_a_reload(self):
+        original = RULES.path
+        RULES.path = self.path
+        try:
+            RULES.reload()
+            herd = [TigerPet() for _ in range(4)]
+            for pet in herd:
+                pet.hunger = 26.0
+            with ShardedSimulation(herd, workers=2) as simulation:
+                simulation.tick(0.0)
+                self.assertIs(simulation.pet(3).state, PetState.NEUTRAL)
+                self.data['states'][0]['when'][0]['below'] = 30
+                self.write()
+                RULES._next_check = 0.0
+                simulation.tick(0.0)
+                self.assertEqual({simulation.pet(i).state for i in range(4)}, {PetState.HUNGRY})
+        finally:
+            RULES.path = original
+            RULES.reload()
+
+    def test_validation(self):
+        rules = RuleSet(self.path)
+        for edit in (
+            lambda data: data['states'].pop(),                                      # no default state
+            lambda data: data['states'][0].update(state='grumpy'),
+            lambda data: data['mood_modifiers'][0]['when'][0].update(stat='__class__'),
+            lambda data: data['actions']['feed']['effects'].update(level=1),
+            lambda data: data.update(passive_exp_per_second='0.1'),
+            lambda data: data.update(mood_modifiers=[1]),
+            lambda data: data.update(states=['x']),
+            lambda data: data.update(states={'state': 'happy'}),
+            lambda data: data['actions'].pop('play'),
+            lambda data: data['actions']['feed'].update(messages='Yum'),
+        ):
+            data = copy.deepcopy(self.data)
+            edit(data)
+            with self.assertRaises(RulesError):
+                rules.compile(data)
+        self.assertEqual(rules.generation, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#`tests/test_scene_graph.py`
+
+import unittest
+from engine3d import transforms
+from engine3d.scene_graph import SceneGraph, SceneNode, Material, CubeMesh
+from engine3d.tiger_model import TigerModel, instance_matrix
+
+class TestSceneGraph(unittest.TestCase):
+    def setUp(self):
+        self.model = TigerModel()
+        # Prime every cached world matrix
+        for _, nodes in self.model.draw_list():
+            for node in nodes:
+                node.world_matrix()
+        self.model.graph.world_updates = 0
+
+    def test_world_matrix_matches_gl_chain(self):
+        self.model.set_pose(rotation=90.0, scale=1.0)
+        eye = self.model.nodes['eye_left']
+        expected = transforms.multiply(
+            transforms.multiply(transforms.rotation(90.0, 0, 1, 0), transforms.translation(0.9, 0.2, 0)),
+            transforms.translation(0.3, 0.15, 0.25)
+        )
+        for a, b in zip(eye.world_matrix(), expected):
+            self.assertAlmostEqual(a, b)
+
+    def test_tail_animation_only_updates_tail(self):
+        self.model.set_pose(tail_angle=35.0)
+        for _, nodes in self.model.draw_list():
+            for node in nodes:
+                node.world_matrix()
+        self.assertEqual(self.model.graph.world_updates, 1)
+
+    def test_unchanged_pose_is_free(self):
+        self.model.set_pose(rotation=0.0, scale=1.0)
+        self.model.nodes['body'].world_matrix()
+        self.assertEqual(self.model.graph.world_updates, 0)
+
+    def test_herd_instances_only_repose_head_and_tail(self):
+        posed = TigerModel()
+        posed.set_pose(rotation=40.0, scale=1.05, body_height=0.3, head_pitch=0.0, tail_angle=25.0)
+        self.model.set_pose(head_pitch=0.0)
+        self.model.nodes['eye_left'].world_matrix()
+        self.model.nodes['eye_right'].world_matrix()
+        self.model.graph.world_updates = 0
+        for tail in (25.0, 12.0, 31.0):
+            self.model.set_pose(head_pitch=0.0, tail_angle=tail)
+            for _, nodes in self.model.draw_list():
+                for node in nodes:
+                    node.world_matrix()
+        self.assertEqual(self.model.graph.world_updates, 3)
+
+        self.model.set_pose(tail_angle=25.0)
+        for name in ('eye_left', 'tail', 'leg_back_right'):
+            drawn = transforms.multiply(instance_matrix(40.0, 1.05, 0.3), self.model.nodes[name].world_matrix())
+            for a, b in zip(drawn, posed.nodes[name].world_matrix()):
+                self.assertAlmostEqual(a, b)
+
+    def test_eyes_stay_dark_without_a_texture_atlas(self):
+        eye = self.model.materials['eye']
+        self.assertEqual(eye.tint(False), [0.0, 0.0, 0.0])
+        self.assertEqual(eye.tint(True), [1.0, 1.0, 1.0])
+        fur = self.model.materials['fur']
+        self.assertIs(fur.tint(True), fur.color)
+
+    def test_draw_list_sorted_by_material(self):
+        keys = [material.key for material, _ in self.model.draw_list()]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(sum(len(nodes) for _, nodes in self.model.draw_list()), 9)
+
+    def test_hidden_subtree_is_skipped(self):
+        graph = SceneGraph()
+        parent = graph.add(SceneNode('parent', mesh=CubeMesh(1, 1, 1), material=Material('a', (1, 1, 1))))
+        parent.add_child(SceneNode('child', mesh=CubeMesh(1, 1, 1), material=Material('b', (1, 1, 1))))
+        self.assertEqual(len(graph.draw_list()), 2)
+        parent.visible = False
+        self.assertEqual(graph.draw_list(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#`tests/test_sharded.py`
+
+import copy
+import random
+import unittest
+from logic.sharded import ShardedSimulation, shard_bounds
+from logic.tiger_pet import PetState, TigerPet
+
+def random_herd(count, seed=7):
+    rng = random.Random(seed)
+    herd = []
+    for _ in range(count):
+        pet = TigerPet()
+        for stat in ('hunger', 'energy', 'mood', 'cleanliness'):
+            setattr(pet, stat, rng.uniform(0, 100))
+        pet.exp = rng.uniform(0, 99.9)  # some pets level up mid-run
+        pet.age = rng.randrange(30)
+        herd.append(pet)
+    return herd
+
+# Normal ticks, fractional ticks, and offline catch-up where coins are always paid
+DELTAS = [1.0] * 40 + [0.5] * 10 + [25.0] * 4 + [3.0] * 20
+
+class TestShardBounds(unittest.TestCase):
+    def test_bounds_cover_every_pet_evenly(self):
+        self.assertEqual(shard_bounds(10, 3), [(0, 4), (4, 7), (7, 10)])
+        self.assertEqual(shard_bounds(2, 8), [(0, 1), (1, 2)])
+        self.assertEqual(shard_bounds(0, 4), [(0, 0)])
+
+class TestShardedSimulation(unittest.TestCase):
+    def assert_matches(self, simulation, reference):
+        for i, expected in enumerate(reference):
+            actual = simulation.pet(i)
+            self.assertEqual(actual.to_dict(), expected.to_dict(), f"pet {i}")
+            self.assertEqual(actual.coins, expected.coins, f"pet {i}")
+            self.assertIs(actual.state, expected.state, f"pet {i}")
+
+    def run_equivalence(self, workers):
+        herd = random_herd(300)
+        reference = copy.deepcopy(herd)
+        with ShardedSimulation(herd, workers=workers) as simulation:
+            for delta in DELTAS:
+                simulation.tick(delta)
+                for pet in reference:
+                    pet.update(delta)
+            self.assertGreater(max(pet.level for pet in reference), 1)
+            self.assert_matches(simulation, reference)
+
+    def test_in_process_matches_tiger_pet_update(self):
+        self.run_equivalence(workers=0)
+
+    def test_worker_processes_match_tiger_pet_update(self):
+        self.run_equivalence(workers=3)
+
+    def test_actions_are_routed_to_the_owning_shard(self):
+        herd = random_herd(9, seed=1)
+        for pet in herd:
+            pet.hunger = 10.0
+        with ShardedSimulation(herd, workers=3) as simulation:
+            self.assertEqual([simulation.owner(i) for i in (0, 3, 8)], [0, 1, 2])
+            tickets = {simulation.act(i, 'feed'): i for i in (0, 4, 8)}
+            results = simulation.tick(1.0)
+            self.assertEqual(set(results), set(tickets))
+            self.assertTrue(all(success for success, _ in results.values()))
+            for i in range(9):
+                fed = simulation.pet(i).hunger > 40
+                self.assertEqual(fed, i in tickets.values())
+            self.assertEqual(simulation.tick(1.0), {})
+
+    def test_unknown_action_and_index_are_rejected(self):
+        with ShardedSimulation(2, workers=0) as simulation:
+            with self.assertRaises(ValueError):
+                simulation.act(0, 'dance')
+            with self.assertRaises(IndexError):
+                simulation.act(5, 'feed')
+
+    def test_close_releases_shared_memory(self):
+        simulation = ShardedSimulation(4, workers=2)
+        name = simulation.block.name
+        simulation.tick()
+        self.assertEqual(simulation.pet(0).state, PetState.HAPPY)
+        simulation.close()
+        from multiprocessing import shared_memory
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        self.assertFalse(any(p.is_alive() for p in simulation._processes))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+#`tests/test_shop_search.py`
+
+import random
+import time
+import unittest
+from logic.shop import Shop, ShopItem
+from logic.shop_search import ShopSearchIndex
+
+class TestShopSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ShopSearchIndex(Shop().items)
+
+    def names(self, indices):
+        return [self.index.items[i].name for i in indices]
+
+    def test_empty_query_returns_catalog(self):
+        self.assertEqual(self.index.search(""), list(range(5)))
+
+    def test_substring_case_insensitive(self):
+        self.assertEqual(self.names(self.index.search("SNACK")), ["Magic Snack"])
+        self.assertEqual(self.names(self.index.search("al")), ["Golden Ball", "Royal Spa"])
+
+    def test_prefix_matches_rank_first(self):
+        self.assertEqual(self.names(self.index.search("e")),
+                         ["Energy Drink", "Premium Steak", "Golden Ball"])
+
+    def test_incremental_narrowing_matches_fresh_search(self):
+        for query in ("g", "go", "gol", "golden b"):
+            narrowed = self.index.search(query)
+        fresh = ShopSearchIndex(Shop().items).search("golden b")
+        self.assertEqual(narrowed, fresh)
+        # Backspacing to a shorter query widens again
+        self.assertEqual(self.names(self.index.search("g")), ["Golden Ball", "Energy Drink", "Magic Snack"])
+
+    def test_price_band(self):
+        self.assertEqual(sorted(self.names(self.index.price_band(30, 50))),
+                         ["Energy Drink", "Premium Steak", "Royal Spa"])
+        self.assertEqual(self.index.price_band(51, 1000), [])
+
+    def test_large_catalog_keystrokes(self):
+        rng = random.Random(2)
+        words = ['steak', 'ball', 'spa', 'snack', 'drink', 'golden', 'royal', 'magic', 'fish', 'bone']
+        items = [ShopItem(f"{rng.choice(words)} {rng.choice(words)} {i}", "", rng.randint(5, 500), "mood", 5)
+                 for i in range(50000)]
+        index = ShopSearchIndex(items)
+        expected = [i for i, item in enumerate(items) if "royal sp" in item.name]
+        start = time.perf_counter()
+        for query in ("r", "ro", "roy", "roya", "royal", "royal ", "royal s", "royal sp"):
+            result = index.search(query)
+        self.assertEqual(sorted(result), expected)
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#`tests/test_simulation.py`
+
+import time
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from logic.game_manager import GameManager
+from logic.tiger_pet import TigerPet
+from logic.simulation import SimulationWorker, world_snapshot
+
+class MemorySaveManager:
+    def __init__(self):
+        self.saved = None
+
+    def save_game(self, data):
+        self.saved = data
+
+    def load_game(self):
+        return self.saved
+
+class TestSimulationWorker(unittest.TestCase):
+    def setUp(self):
+        self.manager = GameManager(MemorySaveManager())
+        self.worker = SimulationWorker(self.manager, interval=0.01)
+
+    def tearDown(self):
+        self.worker.stop()
+
+    def wait_for(self, condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.005)
+        return False
+
+    def test_initial_snapshot_before_start(self):
+        snapshot = self.worker.latest
+        self.assertEqual(snapshot.tick, 0)
+        self.assertEqual(snapshot.pet.hunger, 100)
+        self.assertEqual(snapshot.pet.state, 'happy')
+        with self.assertRaises(AttributeError):
+            snapshot.pet.hunger = 5
+
+    def test_ticks_publish_new_snapshots(self):
+        first = self.worker.latest
+        self.worker.start()
+        self.assertTrue(self.wait_for(lambda: self.worker.latest.tick >= 3))
+        # Earlier snapshots are never modified in place
+        self.assertEqual(first.tick, 0)
+
+    def test_commands_run_on_worker(self):
+        self.manager.pet.hunger = 50
+        self.worker.start()
+        self.worker.submit('feed', self.manager.feed_pet)
+        results = []
+        self.assertTrue(self.wait_for(lambda: results.extend(self.worker.poll_results()) or results))
+        tag, (success, message), error = results[0]
+        self.assertEqual(tag, 'feed')
+        self.assertTrue(success)
+        self.assertIsNone(error)
+        self.assertTrue(self.wait_for(lambda: self.worker.latest.pet.hunger > 50))
+
+    def test_failed_command_reports_error(self):
+        self.worker.start()
+        self.worker.submit('select', lambda: 1 / 0)
+        results = []
+        self.assertTrue(self.wait_for(lambda: results.extend(self.worker.poll_results()) or results))
+        self.assertIsInstance(results[0][2], ZeroDivisionError)
+
+    def test_failed_tick_keeps_the_worker_running(self):
+        update = self.manager.update
+        calls = []
+        def flaky_update():
+            calls.append(1)
+            if len(calls) == 1:
+                raise KeyError('feed')
+            update()
+        self.manager.update = flaky_update
+        with redirect_stdout(StringIO()) as output:
+            self.worker.start()
+            self.assertTrue(self.wait_for(lambda: self.worker.latest.tick >= 3))
+        self.assertIn("Simulation tick 1 failed", output.getvalue())
+
+    def test_publishes_only_after_a_tick_or_completed_command(self):
+        worker = SimulationWorker(self.manager, interval=60.0)
+        try:
+            worker.start()
+            initial = worker.latest
+            with redirect_stdout(StringIO()):
+                worker.submit('select', lambda: 1 / 0)
+                self.assertTrue(self.wait_for(worker.poll_results))
+            self.assertIs(worker.latest, initial)
+            worker.submit('feed', self.manager.feed_pet)
+            self.assertTrue(self.wait_for(lambda: worker.latest is not initial))
+            self.assertEqual(worker.latest.tick, 0)
+        finally:
+            worker.stop()
+
+class TestMultiPetSave(unittest.TestCase):
+    def setUp(self):
+        self.save_manager = MemorySaveManager()
+        self.manager = GameManager(self.save_manager)
+
+    def test_roster_round_trip(self):
+        index = self.manager.add_pet()
+        self.manager.select_pet(index)
+        self.manager.pet.coins = 123
+        self.manager.save_game()
+
+        loaded = GameManager(self.save_manager)
+        loaded.load_game()
+        self.assertEqual(len(loaded.pets), 2)
+        self.assertEqual(loaded.active_pet_index, 1)
+        self.assertEqual(loaded.pet.coins, 123)
+
+    def test_single_pet_save_still_loads(self):
+        old = TigerPet()
+        old.coins = 77
+        self.save_manager.saved = {'pet': old.to_dict(), 'last_save_time': time.time()}
+        self.manager.load_game()
+        self.assertEqual(len(self.manager.pets), 1)
+        self.assertEqual(self.manager.pet.coins, 77)
+
+    def test_world_snapshot_lists_every_pet(self):
+        self.manager.add_pet()
+        self.manager.pets[1].hunger = 10
+        snapshot = world_snapshot(self.manager, tick=5)
+        self.assertEqual(snapshot.tick, 5)
+        self.assertEqual(len(snapshot.pets), 2)
+        self.assertEqual(snapshot.pets[1].hunger, 10)
+        self.assertIs(snapshot.pet, snapshot.pets[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#`tests/test_startup_profiler.py`
+
+import io
+import sys
+import threading
+import unittest
+from services.startup_profiler import StartupProfiler
+
+class TestStartupProfiler(unittest.TestCase):
+    def test_disabled_profiler_installs_nothing(self):
+        profiler = StartupProfiler()
+        before = list(sys.meta_path)
+        profiler.install()
+        self.assertEqual(sys.meta_path, before)
+        with profiler.stage('work'):
+            pass
+        self.assertEqual(profiler.stages[0][0], 'work')
+
+    def test_import_times_and_report(self):
+        sys.modules.pop('colorsys', None)
+        profiler = StartupProfiler(enabled=True, budget_ms=10000)
+        profiler.install()
+        try:
+            import colorsys  # noqa: F401
+        finally:
+            profiler.uninstall()
+        self.assertIn('colorsys', profiler.imports)
+        cumulative, own = profiler.imports['colorsys']
+        self.assertGreaterEqual(cumulative, own)
+        self.assertGreater(cumulative, 0)
+
+        profiler.mark('first_frame')
+        out = io.StringIO()
+        profiler.report(out=out)
+        text = out.getvalue()
+        self.assertIn('first frame', text)
+        self.assertIn('OK', text)
+        self.assertIn('colorsys', text)
+        # Only reported once
+        profiler.report(out=out)
+        self.assertEqual(out.getvalue(), text)
+
+    def test_worker_thread_imports_do_not_nest_under_main_thread(self):
+        sys.modules.pop('colorsys', None)
+        profiler = StartupProfiler(enabled=True)
+        profiler.install()
+        try:
+            profiler._enter('main_module')
+            worker = threading.Thread(target=__import__, args=('colorsys',))
+            worker.start()
+            worker.join()
+            profiler._exit()
+        finally:
+            profiler.uninstall()
+        self.assertIn('colorsys', profiler.imports)
+        cumulative, own = profiler.imports['main_module']
+        self.assertEqual(own, cumulative)  # the worker's import is not a child of this frame
+        self.assertEqual(profiler._stack(), [])
+
+if __name__ == '__main__':
+    unittest.main()
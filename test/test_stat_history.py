@@ -0,0 +1,50 @@
+#`tests/test_stat_history.py`
+
+import math
+import unittest
+from logic.stat_history import StatHistory, lttb
+
+class TestStatHistory(unittest.TestCase):
+    def fill(self, history, count, start=0):
+        for i in range(start, start + count):
+            wave = 50 + 40 * math.sin(i / 500.0)
+            history.append(float(i), [wave, 100 - wave, 50.0, (i * 7) % 100])
+
+    def test_short_series_is_not_decimated(self):
+        history = StatHistory()
+        self.fill(history, 50)
+        xs, ys = history.decimated('hunger', 200)
+        self.assertEqual(len(xs), 50)
+
+    def test_decimated_to_width_keeps_extremes(self):
+        history = StatHistory(capacity=16)
+        self.fill(history, 20000)
+        history.values[12345, 0] = 99.5  # spike a bucket must not hide
+        xs, ys = history.decimated('hunger', 300)
+        self.assertLessEqual(len(xs), 300)
+        self.assertEqual(xs[0], 0.0)
+        self.assertEqual(xs[-1], 19999.0)
+        self.assertEqual(xs, sorted(xs))
+        self.assertIn(99.5, ys)
+
+    def test_incremental_matches_full_rebuild(self):
+        history = StatHistory()
+        self.fill(history, 5000)
+        history.decimated('mood', 120)
+        self.fill(history, 777, start=5000)
+        incremental = history.decimated('cleanliness', 120)
+        fresh = StatHistory()
+        self.fill(fresh, 5777)
+        self.assertEqual(incremental, fresh.decimated('cleanliness', 120))
+
+    def test_lttb_endpoints_and_peak(self):
+        xs = list(range(100))
+        ys = [0.0] * 100
+        ys[40] = 10.0
+        keep = lttb(xs, ys, 10)
+        self.assertEqual(len(keep), 10)
+        self.assertEqual((keep[0], keep[-1]), (0, 99))
+        self.assertIn(40, keep)
+
+if __name__ == '__main__':
+    unittest.main()
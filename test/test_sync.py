@@ -0,0 +1,112 @@
+#`tests/test_sync.py`
+
+import asyncio
+import unittest
+from logic.tiger_pet import TigerPet
+from server.sync import (DELTA, KEYFRAME, SyncClient, SyncError, SyncPeer, SyncSource, decode_ack,
+                         quantize_pet)
+from server.sync_report import measure
+
+class TestSyncCodec(unittest.TestCase):
+    def setUp(self):
+        self.pets = [TigerPet(), TigerPet()]
+        self.source = SyncSource(history=16, keyframe_interval=10)
+        self.peer = SyncPeer()
+        self.client = SyncClient(history=16)
+
+    def step(self, ack=True):
+        for pet in self.pets:
+            pet.update(1.0)
+        self.source.commit(self.pets, 1)
+        message = self.source.encode(self.peer)
+        self.client.apply(message)
+        if ack:
+            self.source.ack(self.peer, decode_ack(self.client.ack()))
+        return message
+
+    def assert_synced(self):
+        self.assertEqual(self.client.active_pet_index, 1)
+        for synced, pet in zip(self.client.pets, self.pets):
+            for field in ('hunger', 'energy', 'mood', 'cleanliness', 'exp'):
+                self.assertAlmostEqual(synced[field], getattr(pet, field), delta=0.005 + 1e-9)
+            self.assertEqual(synced['level'], pet.level)
+            self.assertEqual(synced['coins'], round(pet.coins))
+            self.assertEqual(synced['state'], pet.state.value)
+
+    def test_first_message_is_a_keyframe_then_small_deltas(self):
+        first = self.step()
+        second = self.step()
+        self.assertEqual(first[0], KEYFRAME)
+        self.assertEqual(second[0], DELTA)
+        self.assertLess(len(second), len(first))
+        self.assertLess(len(second), 30)
+        self.assert_synced()
+
+    def test_unchanged_state_keeps_its_version_and_sends_nothing(self):
+        self.step()
+        version = self.source.version
+        self.assertEqual(self.source.commit(self.pets, 1), version)
+        self.assertIsNone(self.source.encode(self.peer))
+
+    def test_periodic_keyframes(self):
+        kinds = [self.step()[0] for _ in range(25)]
+        self.assertEqual([i for i, kind in enumerate(kinds) if kind == KEYFRAME], [0, 10, 20])
+        self.assert_synced()
+
+    def test_late_acks_use_an_older_baseline(self):
+        self.step()
+        acks = []
+        for _ in range(8):
+            self.step(ack=False)
+            acks.append(decode_ack(self.client.ack()))
+            if len(acks) > 3:
+                self.source.ack(self.peer, acks.pop(0))
+            self.assert_synced()
+        self.assertLess(self.peer.acked, self.source.version - 1)
+
+    def test_baseline_outside_history_gets_a_keyframe(self):
+        self.step()
+        for _ in range(20):
+            for pet in self.pets:
+                pet.update(1.0)
+            self.source.commit(self.pets, 1)
+        self.peer.keyframe_version = self.source.version  # rule out the periodic keyframe
+        self.assertEqual(self.step()[0], KEYFRAME)
+        self.assert_synced()
+
+    def test_clients_on_the_same_baseline_share_one_encoding(self):
+        self.step()
+        other = SyncPeer()
+        self.source.encode(other)
+        self.source.ack(other, self.source.version)
+        self.source.commit([TigerPet(), TigerPet()], 1)
+        self.assertIs(self.source.encode(self.peer), self.source.encode(other))
+
+    def test_quantization(self):
+        pet = TigerPet()
+        pet.hunger = 12.3449
+        pet.coins = 100.4
+        values = quantize_pet(pet)
+        self.assertEqual(values[0], 1234)
+        self.assertEqual(values[7], 100)
+
+    def test_delta_without_baseline_is_rejected(self):
+        self.step()
+        message = self.step()
+        with self.assertRaises(SyncError):
+            SyncClient().apply(message)
+        with self.assertRaises(SyncError):
+            SyncClient().apply(message[:2])
+
+class TestSyncLoopback(unittest.TestCase):
+    def test_bytes_per_client_per_tick(self):
+        result = asyncio.run(measure(clients=3, ticks=70, pets=2))
+        full, sync = result['json'], result['sync']
+        self.assertLess(sync['bytes_per_client_tick'] * 10, full['bytes_per_client_tick'])
+        # connect + one periodic each, plus a repeat if a tick beats the first ack
+        self.assertGreaterEqual(sync['keyframes'], 3 * 2)
+        self.assertLessEqual(sync['keyframes'], 3 * 3)
+        self.assertLessEqual(result['max_error'], 0.005)
+
+if __name__ == '__main__':
+    unittest.main()
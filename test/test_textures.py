@@ -0,0 +1,53 @@
+#`tests/test_textures.py`
+
+import tempfile
+import unittest
+
+import numpy as np
+from engine3d.textures import (TextureAtlas, TextureDiskCache, TextureManager,
+                               build_atlas, build_mip_chain, load_skin_atlas)
+
+class TestTextures(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_atlas_regions_do_not_overlap(self):
+        images = {name: np.full((h, w, 4), i, dtype=np.uint8)
+                  for i, (name, w, h) in enumerate([('a', 128, 128), ('b', 32, 32), ('c', 64, 16)])}
+        atlas, regions = build_atlas(images)
+        size = atlas.shape[0]
+        self.assertEqual(size & (size - 1), 0)
+        boxes = [(u0 * size, v0 * size, u1 * size, v1 * size) for u0, v0, u1, v1 in regions.values()]
+        for i, a in enumerate(boxes):
+            for b in boxes[i + 1:]:
+                self.assertTrue(a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1])
+
+    def test_mip_chain_reaches_one_pixel(self):
+        levels = build_mip_chain(np.zeros((64, 64, 4), dtype=np.uint8))
+        self.assertEqual([level.shape[0] for level in levels], [64, 32, 16, 8, 4, 2, 1])
+
+    def test_disk_cache_skips_rebuild(self):
+        cache = TextureDiskCache(self.tmp.name)
+        first = load_skin_atlas('default', textures_dir=self.tmp.name, cache=cache)
+        second = load_skin_atlas('default', textures_dir=self.tmp.name, cache=cache)
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(first.regions, second.regions)
+        np.testing.assert_array_equal(first.mips[-1], second.mips[-1])
+
+    def test_lru_eviction_within_budget(self):
+        def loader(skin):
+            return TextureAtlas(skin, [np.zeros((16, 16, 4), dtype=np.uint8)], {})
+        manager = TextureManager(budget_bytes=2 * 16 * 16 * 4, loader=loader)
+        manager.get('tiger')
+        manager.get('snow')
+        manager.get('tiger')   # tiger becomes most recently used
+        manager.get('golden')
+        self.assertEqual(manager.loaded_skins(), ['tiger', 'golden'])
+        self.assertEqual(manager.evictions, 1)
+
+if __name__ == '__main__':
+    unittest.main()
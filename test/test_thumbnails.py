@@ -0,0 +1,50 @@
+#`tests/test_thumbnails.py`
+
+import unittest
+from engine3d.thumbnails import ThumbnailCache, thumbnail_signature
+from logic.simulation import snapshot_pet
+from logic.tiger_pet import TigerPet
+
+class TestThumbnailCache(unittest.TestCase):
+    def setUp(self):
+        self.rendered = []
+        self.cache = ThumbnailCache(lambda signature: self.rendered.append(signature) or signature)
+
+    def test_miss_queues_until_rendered(self):
+        signature = ('happy', (1.0, 0.6, 0.2))
+        self.assertIsNone(self.cache.get(signature))
+        self.assertIsNone(self.cache.get(signature))
+        self.assertEqual(self.cache.render_pending(), [signature])
+        self.assertEqual(self.cache.get(signature), signature)
+        self.assertEqual(self.rendered, [signature])
+
+    def test_render_budget(self):
+        for i in range(5):
+            self.cache.get(('happy', i))
+        self.assertEqual(len(self.cache.render_pending(budget=2)), 2)
+        self.assertEqual(len(self.cache.render_pending(budget=10)), 3)
+        self.assertEqual(self.cache.render_pending(), [])
+
+    def test_identical_pets_share_one_render(self):
+        pets = [TigerPet() for _ in range(300)]
+        for pet in pets:
+            self.cache.get(thumbnail_signature(pet))
+        self.cache.render_pending(budget=1000)
+        self.assertEqual(self.cache.renders, 1)
+
+    def test_signature_follows_state_and_colour(self):
+        pet = TigerPet()
+        before = thumbnail_signature(snapshot_pet(pet))
+        self.assertEqual(before, thumbnail_signature(pet))
+        pet.mood = 10
+        self.assertNotEqual(thumbnail_signature(pet), before)
+
+    def test_appearance_change_invalidates(self):
+        self.cache.get('a')
+        self.cache.render_pending()
+        self.assertTrue(self.cache.set_appearance(('default', False)))
+        self.assertFalse(self.cache.set_appearance(('default', False)))
+        self.assertEqual(len(self.cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,59 +24,37 @@ class ControlPanel(QWidget):
         
         # Title
         title = QLabel("🕹️ Actions")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
+        title.setObjectName("panelTitle")
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         # Action buttons group
         actions_group = QGroupBox()
-        actions_group.setStyleSheet("""
-            QGroupBox {
-                border: none;
-            }
-        """)
+        actions_group.setObjectName("plainGroup")
         actions_layout = QVBoxLayout(actions_group)
         actions_layout.setSpacing(12)
         
-        # Helper to create styled buttons
-        def create_btn(text, color, hover_color, signal):
+        # Helper to create action buttons; colours come from the theme's
+        # QPushButton[action="..."] rules
+        def create_btn(text, action, signal):
             btn = QPushButton(text)
             btn.setMinimumHeight(55)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: bold;
-                    text-align: left;
-                    padding-left: 20px;
-                }}
-                QPushButton:hover {{
-                    background-color: {hover_color};
-                    margin-left: 2px;
-                }}
-                QPushButton:pressed {{
-                    background-color: {color};
-                    margin-top: 2px;
-                }}
-            """)
+            btn.setProperty("action", action)
             btn.clicked.connect(signal.emit)
             return btn
         
         # Buttons with Material Colors
-        self.feed_btn = create_btn("🍖  Feed", "#4CAF50", "#45a049", self.feed_clicked)
+        self.feed_btn = create_btn("🍖  Feed", "feed", self.feed_clicked)
         actions_layout.addWidget(self.feed_btn)
         
-        self.clean_btn = create_btn("🛁  Clean", "#2196F3", "#1976D2", self.clean_clicked)
+        self.clean_btn = create_btn("🛁  Clean", "clean", self.clean_clicked)
         actions_layout.addWidget(self.clean_btn)
         
-        self.sleep_btn = create_btn("😴  Sleep", "#9C27B0", "#7B1FA2", self.sleep_clicked)
+        self.sleep_btn = create_btn("😴  Sleep", "sleep", self.sleep_clicked)
         actions_layout.addWidget(self.sleep_btn)
         
-        self.play_btn = create_btn("🎾  Play", "#FF9800", "#F57C00", self.play_clicked)
+        self.play_btn = create_btn("🎾  Play", "play", self.play_clicked)
         actions_layout.addWidget(self.play_btn)
         
         layout.addWidget(actions_group)
@@ -88,13 +66,7 @@ class ControlPanel(QWidget):
             "Use coins in the shop."
         )
         info_box.setWordWrap(True)
-        info_box.setStyleSheet("""
-            background-color: #ECEFF1;
-            border-radius: 8px;
-            padding: 10px;
-            color: #455A64;
-            font-size: 12px;
-        """)
+        info_box.setObjectName("tipBox")
         layout.addWidget(info_box)
         
         layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Stat history chart shown under the stats panel
+Plots each stat decimated to one point per pixel column; polylines are
+rebuilt only when new samples arrive or the widget is resized.
+"""
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygonF
+from logic.stat_history import STAT_FIELDS
+
+
+class StatHistoryChart(QWidget):
+
+    def __init__(self, history, theme):
+        super().__init__()
+        self.history = history
+        self.theme = theme
+        self.setMinimumHeight(110)
+        self._cache_key = None
+        self._polylines = {}
+
+    def refresh(self):
+        """Call after appending samples; repaints only if there is new data"""
+        if self._cache_key != (self.history.count, self.width(), self.height()):
+            self.update()
+
+    def _rebuild(self, rect):
+        history = self.history
+        self._polylines = {}
+        if history.count < 2:
+            return
+        t0 = history.times[0]
+        span = (history.times[history.count - 1] - t0) or 1.0
+        width = max(2, int(rect.width()))
+        for field in STAT_FIELDS:
+            xs, ys = history.decimated(field, width)
+            self._polylines[field] = QPolygonF([
+                QPointF(rect.left() + (x - t0) / span * rect.width(),
+                        rect.bottom() - y / 100.0 * rect.height())
+                for x, y in zip(xs, ys)
+            ])
+
+    def paintEvent(self, event):
+        rect = self.rect().adjusted(4, 4, -4, -4)
+        key = (self.history.count, self.width(), self.height())
+        if key != self._cache_key:
+            self._cache_key = key
+            self._rebuild(rect)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(self.theme.color('bar_track')), 1))
+        painter.drawRect(rect)
+        for field, polyline in self._polylines.items():
+            painter.setPen(QPen(QColor(self.theme.color(field)), 1.5))
+            painter.drawPolyline(polyline)
+        if not self._polylines:
+            painter.setPen(QColor(self.theme.color('stat_label')))
+            painter.drawText(rect, Qt.AlignCenter, "Collecting history...")
+        painter.end()
@@ -0,0 +1,130 @@
+"""
+Pet roster panel
+One list row per pet with a cached 3D thumbnail instead of a live GL
+widget; rows repaint only when their pet's label or thumbnail changes.
+"""
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QListView
+from PySide6.QtCore import Signal, Qt, QSize, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QPixmap, QPainter, QFont
+from engine3d.thumbnails import THUMBNAIL_SIZE, thumbnail_signature
+
+
+class PetRosterModel(QAbstractListModel):
+    """Rows are WorldSnapshot.pets; thumbnails come from a ThumbnailCache"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pets = ()
+        self.signatures = []
+        self.thumbnails = None
+        self._placeholder = self._placeholder_icon()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.pets)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._label(row, self.pets[row])
+        if role == Qt.DecorationRole:
+            # Only rows the view paints ask for an image, so only they render
+            image = self.thumbnails.get(self.signatures[row]) if self.thumbnails is not None else None
+            return image if image is not None else self._placeholder
+        return None
+
+    @staticmethod
+    def _label(row, pet):
+        return f"Tiger #{row + 1}\nLv {pet.level} · {pet.state}"
+
+    @staticmethod
+    def _placeholder_icon():
+        pixmap = QPixmap(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPixelSize(THUMBNAIL_SIZE // 2)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, "🐯")
+        painter.end()
+        return pixmap
+
+    def set_thumbnails(self, cache):
+        self.thumbnails = cache
+        self._emit_rows(range(len(self.pets)), [Qt.DecorationRole])
+
+    def set_pets(self, pets):
+        """Take a new snapshot's pets; unchanged rows are not repainted"""
+        old, self.pets = self.pets, pets
+        signatures = [thumbnail_signature(pet) for pet in pets]
+        old_signatures, self.signatures = self.signatures, signatures
+        if len(pets) != len(old):
+            self.beginResetModel()
+            self.endResetModel()
+            return
+        changed = [row for row in range(len(pets))
+                   if signatures[row] != old_signatures[row]
+                   or self._label(row, pets[row]) != self._label(row, old[row])]
+        self._emit_rows(changed, [Qt.DisplayRole, Qt.DecorationRole])
+
+    def thumbnails_ready(self, signatures):
+        """Repaint the rows showing any of the newly rendered signatures"""
+        ready = set(signatures)
+        self._emit_rows([row for row, signature in enumerate(self.signatures)
+                         if signature in ready], [Qt.DecorationRole])
+
+    def _emit_rows(self, rows, roles):
+        """One dataChanged per contiguous run of rows"""
+        start = prev = None
+        for row in list(rows) + [None]:
+            if row is not None and prev is not None and row == prev + 1:
+                prev = row
+                continue
+            if start is not None:
+                self.dataChanged.emit(self.createIndex(start, 0), self.createIndex(prev, 0), roles)
+            start = prev = row
+
+
+class RosterPanel(QWidget):
+    pet_selected = Signal(int)
+    adopt_clicked = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+
+        title = QLabel("🐯 Tigers")
+        title.setObjectName("panelTitle")
+        title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title)
+
+        self.roster_model = PetRosterModel(self)
+        self.roster_list = QListView()
+        self.roster_list.setObjectName("rosterList")
+        self.roster_list.setModel(self.roster_model)
+        self.roster_list.setUniformItemSizes(True)
+        self.roster_list.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.roster_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.roster_list.clicked.connect(lambda index: self.pet_selected.emit(index.row()))
+        layout.addWidget(self.roster_list)
+
+        self.adopt_btn = QPushButton("➕ Adopt Tiger")
+        self.adopt_btn.setObjectName("adoptButton")
+        self.adopt_btn.clicked.connect(self.adopt_clicked.emit)
+        layout.addWidget(self.adopt_btn)
+
+    def set_thumbnails(self, cache):
+        self.roster_model.set_thumbnails(cache)
+
+    def update_roster(self, snapshot):
+        self.roster_model.set_pets(snapshot.pets)
+        active = snapshot.active_pet_index
+        # A model reset clears the current row, so compare against the view
+        current = self.roster_list.currentIndex()
+        if not current.isValid() or current.row() != active:
+            self.roster_list.setCurrentIndex(self.roster_model.index(active))
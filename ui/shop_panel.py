@@ -0,0 +1,166 @@
+"""
+Shop UI Panel
+Model/view list: only visible rows are laid out and painted, icons are
+rendered on first use and cached, and search goes through ShopSearchIndex.
+"""
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton,
+                               QListView, QLineEdit, QGroupBox,
+                               QHBoxLayout, QMessageBox)
+from PySide6.QtCore import Signal, Qt, QSize, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QFont, QColor, QBrush, QPixmap, QPainter
+from logic.shop_search import ShopSearchIndex
+
+ICON_SIZE = 28
+ItemRole = Qt.UserRole
+AffordableRole = Qt.UserRole + 1
+
+
+class ShopItemModel(QAbstractListModel):
+    """Rows are the items matching the current search, in index order"""
+    
+    def __init__(self, items, parent=None):
+        super().__init__(parent)
+        self.search_index = ShopSearchIndex(items)
+        self.items = self.search_index.items
+        self.rows = list(range(len(self.items)))
+        self.row_of = None  # item index -> row, built when first needed
+        self.coins = 0
+        self._icons = {}
+        self._unaffordable = QBrush(QColor(150, 150, 150))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[self.rows[index.row()]]
+        if role == Qt.DisplayRole:
+            return f"{item.name}\n{item.description}  ·  💰 {item.price}"
+        if role == Qt.DecorationRole:
+            return self._icon(item.icon)
+        if role == Qt.ToolTipRole:
+            return item.description
+        if role == Qt.ForegroundRole:
+            return None if item.price <= self.coins else self._unaffordable
+        if role == ItemRole:
+            return item
+        if role == AffordableRole:
+            return item.price <= self.coins
+        return None
+    
+    def _icon(self, text):
+        """Emoji rendered to a pixmap once per distinct icon"""
+        pixmap = self._icons.get(text)
+        if pixmap is None:
+            pixmap = QPixmap(ICON_SIZE, ICON_SIZE)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            font = QFont()
+            font.setPixelSize(ICON_SIZE - 6)
+            painter.setFont(font)
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, text)
+            painter.end()
+            self._icons[text] = pixmap
+        return pixmap
+    
+    def set_filter(self, query):
+        self.beginResetModel()
+        self.rows = self.search_index.search(query)
+        self.row_of = None
+        self.endResetModel()
+    
+    def set_coins(self, coins):
+        """Repaint only rows whose affordability flips between old and new coins"""
+        old, self.coins = self.coins, coins
+        if old == coins:
+            return
+        changed = self.search_index.price_band(min(old, coins), max(old, coins))
+        if not changed:
+            return
+        if self.row_of is None:
+            self.row_of = {item: row for row, item in enumerate(self.rows)}
+        rows = sorted(self.row_of[i] for i in changed if i in self.row_of)
+        roles = [Qt.ForegroundRole, AffordableRole]
+        # One dataChanged per contiguous run of rows
+        start = prev = None
+        for row in rows + [None]:
+            if row is not None and prev is not None and row == prev + 1:
+                prev = row
+                continue
+            if start is not None:
+                self.dataChanged.emit(self.createIndex(start, 0), self.createIndex(prev, 0), roles)
+            start = prev = row
+
+
+class ShopPanel(QWidget):
+    item_purchased = Signal(object)  # Emits ShopItem
+    
+    def __init__(self, shop):
+        super().__init__()
+        self.shop = shop
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        # Header
+        header = QLabel("🏪 Shop")
+        header.setObjectName("shopHeader")
+        header.setAlignment(Qt.AlignCenter)
+        layout.addWidget(header)
+        
+        # Coins Display
+        self.coins_container = QGroupBox()
+        self.coins_container.setObjectName("coinsBox")
+        coins_layout = QHBoxLayout(self.coins_container)
+        
+        self.coins_label = QLabel("💰 0")
+        self.coins_label.setObjectName("coinsLabel")
+        self.coins_label.setAlignment(Qt.AlignCenter)
+        coins_layout.addWidget(self.coins_label)
+        layout.addWidget(self.coins_container)
+        
+        # Search
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search items...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self._on_search)
+        layout.addWidget(self.search_edit)
+        
+        # Item List (uniform rows let the view skip measuring every item)
+        self.item_model = ShopItemModel(self.shop.items, self)
+        self.item_list = QListView()
+        self.item_list.setObjectName("shopList")
+        self.item_list.setModel(self.item_model)
+        self.item_list.setUniformItemSizes(True)
+        self.item_list.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
+        self.item_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.item_list.doubleClicked.connect(self._on_buy)
+        layout.addWidget(self.item_list)
+        
+        # Buy Button
+        self.buy_btn = QPushButton("Buy Selected")
+        self.buy_btn.setObjectName("buyButton")
+        self.buy_btn.clicked.connect(self._on_buy)
+        layout.addWidget(self.buy_btn)
+    
+    def _on_search(self, text):
+        self.item_model.set_filter(text)
+    
+    def _on_buy(self):
+        current = self.item_list.currentIndex()
+        if current.isValid():
+            item = current.data(ItemRole)
+            self.item_purchased.emit(item)
+        else:
+            QMessageBox.information(self, "Shop", "Please select an item first!")
+    
+    def bind(self, model):
+        """Follow the coin count of an ObservablePetModel"""
+        model.subscribe(('coins',), lambda changes: self.update_coins(changes['coins']))
+    
+    def update_coins(self, coins):
+        self.coins_label.setText(f"💰 {int(coins)}")
+        self.item_model.set_coins(int(coins))
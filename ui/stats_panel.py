@@ -4,8 +4,12 @@ Right stats panel with modern UI
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, 
                                QProgressBar, QGroupBox, QSpacerItem,
                                QSizePolicy, QGraphicsOpacityEffect)
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
 from PySide6.QtGui import QFont
+from ui.theme import set_variant
+from logic.notifications import NotificationQueue
+
+FADE_MS = 2500
 
 class StatsPanel(QWidget):
     
@@ -19,24 +23,22 @@ class StatsPanel(QWidget):
         
         # Title
         title = QLabel("📊 Status")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
+        title.setObjectName("panelTitle")
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         # Level Badge
         self.level_container = QWidget()
-        self.level_container.setStyleSheet("""
-            background-color: #673AB7;
-            border-radius: 10px;
-        """)
+        self.level_container.setObjectName("levelBadge")
+        self.level_container.setAttribute(Qt.WA_StyledBackground, True)
         lvl_layout = QVBoxLayout(self.level_container)
         self.level_label = QLabel("LEVEL 1")
-        self.level_label.setStyleSheet("color: white; font-weight: bold; font-size: 16px;")
+        self.level_label.setObjectName("levelLabel")
         self.level_label.setAlignment(Qt.AlignCenter)
         lvl_layout.addWidget(self.level_label)
         
         self.exp_label = QLabel("0 / 100 XP")
-        self.exp_label.setStyleSheet("color: rgba(255,255,255,0.8); font-size: 11px;")
+        self.exp_label.setObjectName("expLabel")
         self.exp_label.setAlignment(Qt.AlignCenter)
         lvl_layout.addWidget(self.exp_label)
         
@@ -44,35 +46,25 @@ class StatsPanel(QWidget):
         
         # Stats Group
         stats_group = QGroupBox()
-        stats_group.setStyleSheet("border: none;")
+        stats_group.setObjectName("plainGroup")
         stats_layout = QVBoxLayout(stats_group)
         stats_layout.setSpacing(15)
         
-        def create_stat(label_text, color):
+        def create_stat(label_text, stat):
             lbl = QLabel(label_text)
-            lbl.setStyleSheet("font-weight: bold; color: #555;")
+            lbl.setObjectName("statLabel")
             bar = QProgressBar()
             bar.setFixedHeight(12)
             bar.setTextVisible(False)
-            bar.setStyleSheet(f"""
-                QProgressBar {{
-                    border: none;
-                    background-color: #E0E0E0;
-                    border-radius: 6px;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {color};
-                    border-radius: 6px;
-                }}
-            """)
+            bar.setProperty("stat", stat)
             stats_layout.addWidget(lbl)
             stats_layout.addWidget(bar)
             return bar
             
-        self.hunger_bar = create_stat("🍖 Hunger", "#4CAF50")
-        self.energy_bar = create_stat("⚡ Energy", "#9C27B0")
-        self.mood_bar = create_stat("😊 Mood", "#FF9800")
-        self.clean_bar = create_stat("✨ Hygiene", "#2196F3")
+        self.hunger_bar = create_stat("🍖 Hunger", "hunger")
+        self.energy_bar = create_stat("⚡ Energy", "energy")
+        self.mood_bar = create_stat("😊 Mood", "mood")
+        self.clean_bar = create_stat("✨ Hygiene", "cleanliness")
         
         layout.addWidget(stats_group)
         
@@ -80,48 +72,63 @@ class StatsPanel(QWidget):
         self.notification_label = QLabel("")
         self.notification_label.setAlignment(Qt.AlignCenter)
         self.notification_label.setWordWrap(True)
-        self.notification_label.setStyleSheet("""
-            background-color: #333;
-            color: white;
-            padding: 12px;
-            border-radius: 8px;
-            font-size: 12px;
-            margin-top: 10px;
-        """)
+        self.notification_label.setObjectName("notification")
         self.notification_label.hide()
         layout.addWidget(self.notification_label)
         
+        # The bubble's effect and fade are created once and reused; the
+        # queue decides what to show and how often
+        self.notifications = NotificationQueue(display_time=FADE_MS / 1000)
+        self._fade_effect = QGraphicsOpacityEffect(self.notification_label)
+        self.notification_label.setGraphicsEffect(self._fade_effect)
+        self.fade_animation = QPropertyAnimation(self._fade_effect, b"opacity", self)
+        self.fade_animation.setDuration(FADE_MS)
+        self.fade_animation.setStartValue(1.0)
+        self.fade_animation.setEndValue(0.0)
+        self.fade_animation.setEasingCurve(QEasingCurve.InQuad)
+        self.fade_animation.finished.connect(self.notification_label.hide)
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.timeout.connect(self._pump_notifications)
+        
         layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         
-    def update_stats(self, hunger, energy, mood, cleanliness, level, exp, exp_to_next):
-        """Update stat visuals"""
-        self.hunger_bar.setValue(int(hunger))
-        self.energy_bar.setValue(int(energy))
-        self.mood_bar.setValue(int(mood))
-        self.clean_bar.setValue(int(cleanliness))
+    def bind(self, model):
+        """Follow an ObservablePetModel; only changed fields touch widgets"""
+        self._model = model
+        self._bars = {
+            'hunger': self.hunger_bar,
+            'energy': self.energy_bar,
+            'mood': self.mood_bar,
+            'cleanliness': self.clean_bar,
+        }
+        model.subscribe(self._bars, self._on_stats_changed)
+        model.subscribe(('level', 'exp', 'exp_to_next_level'), self._on_level_changed)
         
-        self.level_label.setText(f"LEVEL {level}")
-        self.exp_label.setText(f"{int(exp)} / {int(exp_to_next)} XP")
+    def _on_stats_changed(self, changes):
+        for field, value in changes.items():
+            self._bars[field].setValue(value)
+            
+    def _on_level_changed(self, changes):
+        if 'level' in changes:
+            self.level_label.setText(f"LEVEL {changes['level']}")
+        if 'exp' in changes or 'exp_to_next_level' in changes:
+            self.exp_label.setText(f"{self._model.value('exp')} / {self._model.value('exp_to_next_level')} XP")
         
     def show_notification(self, message, success=True):
-        color = "#2E7D32" if success else "#C62828"
-        self.notification_label.setStyleSheet(f"""
-            background-color: {color};
-            color: white;
-            padding: 12px;
-            border-radius: 8px;
-            font-weight: bold;
-        """)
-        self.notification_label.setText(message)
-        self.notification_label.show()
+        """Queue a message; repeats are merged and display is rate limited"""
+        self.notifications.push(message, success)
+        self._pump_notifications()
         
-        effect = QGraphicsOpacityEffect(self.notification_label)
-        self.notification_label.setGraphicsEffect(effect)
-        
-        self.fade_animation = QPropertyAnimation(effect, b"opacity")
-        self.fade_animation.setDuration(2500)
-        self.fade_animation.setStartValue(1.0)
-        self.fade_animation.setEndValue(0.0)
-        self.fade_animation.setEasingCurve(QEasingCurve.InQuad)
-        self.fade_animation.finished.connect(self.notification_label.hide)
-        self.fade_animation.start()
\ No newline at end of file
+    def _pump_notifications(self):
+        note = self.notifications.pop_ready()
+        if note is not None:
+            set_variant(self.notification_label, "variant", "success" if note.success else "error")
+            self.notification_label.setText(note.text)
+            self.notification_label.show()
+            self.fade_animation.stop()
+            self.fade_animation.start()
+            
+        wait = self.notifications.wait_time()
+        if wait is not None and not self._notify_timer.isActive():
+            self._notify_timer.start(int(wait * 1000) + 1)
@@ -0,0 +1,220 @@
+"""
+Application theme: one stylesheet compiled per palette
+Widgets carry an objectName or dynamic properties (variant, action, stat)
+and never call setStyleSheet themselves; switching a variant only
+re-polishes that widget, and switching theme re-applies one stylesheet.
+"""
+from string import Template
+
+from PySide6.QtWidgets import QApplication
+
+PALETTES = {
+    'light': {
+        'window_bg': '#f5f5f5',
+        'title': '#2c3e50',
+        'viewport_bg': 'black',
+        'badge_bg': '#673AB7',
+        'badge_text': 'white',
+        'badge_subtext': 'rgba(255,255,255,0.8)',
+        'stat_label': '#555',
+        'bar_track': '#E0E0E0',
+        'hunger': '#4CAF50',
+        'energy': '#9C27B0',
+        'mood': '#FF9800',
+        'cleanliness': '#2196F3',
+        'notice_bg': '#333',
+        'notice_text': 'white',
+        'success': '#2E7D32',
+        'error': '#C62828',
+        'feed': '#4CAF50', 'feed_hover': '#45a049',
+        'clean': '#2196F3', 'clean_hover': '#1976D2',
+        'sleep': '#9C27B0', 'sleep_hover': '#7B1FA2',
+        'play': '#FF9800', 'play_hover': '#F57C00',
+        'tip_bg': '#ECEFF1',
+        'tip_text': '#455A64',
+        'shop_header': '#333',
+        'coins_bg': '#FFF8E1',
+        'coins_border': '#FFC107',
+        'coins_text': '#F57C00',
+        'list_bg': 'white',
+        'list_text': '#212121',
+        'list_border': '#ddd',
+        'list_divider': '#eee',
+        'list_selected_bg': '#E3F2FD',
+        'list_selected_text': '#1565C0',
+        'buy': '#FF9800', 'buy_hover': '#F57C00', 'buy_pressed': '#E65100',
+    },
+    'dark': {
+        'window_bg': '#1e2127',
+        'title': '#e0e6ed',
+        'viewport_bg': 'black',
+        'badge_bg': '#512DA8',
+        'badge_text': 'white',
+        'badge_subtext': 'rgba(255,255,255,0.7)',
+        'stat_label': '#b0bec5',
+        'bar_track': '#37474F',
+        'hunger': '#66BB6A',
+        'energy': '#AB47BC',
+        'mood': '#FFA726',
+        'cleanliness': '#42A5F5',
+        'notice_bg': '#424242',
+        'notice_text': 'white',
+        'success': '#388E3C',
+        'error': '#D32F2F',
+        'feed': '#388E3C', 'feed_hover': '#43A047',
+        'clean': '#1976D2', 'clean_hover': '#1E88E5',
+        'sleep': '#7B1FA2', 'sleep_hover': '#8E24AA',
+        'play': '#F57C00', 'play_hover': '#FB8C00',
+        'tip_bg': '#263238',
+        'tip_text': '#b0bec5',
+        'shop_header': '#e0e6ed',
+        'coins_bg': '#3E2723',
+        'coins_border': '#FFB300',
+        'coins_text': '#FFCA28',
+        'list_bg': '#263238',
+        'list_text': '#eceff1',
+        'list_border': '#37474F',
+        'list_divider': '#2f3d44',
+        'list_selected_bg': '#0D47A1',
+        'list_selected_text': 'white',
+        'buy': '#F57C00', 'buy_hover': '#FB8C00', 'buy_pressed': '#E65100',
+    },
+}
+
+STYLESHEET = Template("""
+QMainWindow { background-color: $window_bg; }
+QWidget#viewportContainer { background-color: $viewport_bg; border-radius: 12px; }
+QLabel#viewportPlaceholder { color: $stat_label; font-size: 14px; }
+QGroupBox#plainGroup { border: none; }
+
+QLabel#panelTitle { font-size: 18px; font-weight: bold; color: $title; }
+QLabel#shopHeader { font-size: 16px; font-weight: bold; color: $shop_header; }
+
+QPushButton[action] {
+    color: white;
+    border: none;
+    border-radius: 8px;
+    font-size: 14px;
+    font-weight: bold;
+    text-align: left;
+    padding-left: 20px;
+}
+QPushButton[action="feed"] { background-color: $feed; }
+QPushButton[action="feed"]:hover { background-color: $feed_hover; margin-left: 2px; }
+QPushButton[action="clean"] { background-color: $clean; }
+QPushButton[action="clean"]:hover { background-color: $clean_hover; margin-left: 2px; }
+QPushButton[action="sleep"] { background-color: $sleep; }
+QPushButton[action="sleep"]:hover { background-color: $sleep_hover; margin-left: 2px; }
+QPushButton[action="play"] { background-color: $play; }
+QPushButton[action="play"]:hover { background-color: $play_hover; margin-left: 2px; }
+QPushButton[action]:pressed { margin-top: 2px; }
+
+QLabel#tipBox {
+    background-color: $tip_bg;
+    border-radius: 8px;
+    padding: 10px;
+    color: $tip_text;
+    font-size: 12px;
+}
+
+QWidget#levelBadge { background-color: $badge_bg; border-radius: 10px; }
+QLabel#levelLabel { color: $badge_text; font-weight: bold; font-size: 16px; }
+QLabel#expLabel { color: $badge_subtext; font-size: 11px; }
+QLabel#statLabel { font-weight: bold; color: $stat_label; }
+
+QProgressBar[stat] { border: none; background-color: $bar_track; border-radius: 6px; }
+QProgressBar[stat]::chunk { border-radius: 6px; }
+QProgressBar[stat="hunger"]::chunk { background-color: $hunger; }
+QProgressBar[stat="energy"]::chunk { background-color: $energy; }
+QProgressBar[stat="mood"]::chunk { background-color: $mood; }
+QProgressBar[stat="cleanliness"]::chunk { background-color: $cleanliness; }
+
+QLabel#notification {
+    background-color: $notice_bg;
+    color: $notice_text;
+    padding: 12px;
+    border-radius: 8px;
+    font-size: 12px;
+    margin-top: 10px;
+}
+QLabel#notification[variant="success"] { background-color: $success; font-weight: bold; }
+QLabel#notification[variant="error"] { background-color: $error; font-weight: bold; }
+
+QGroupBox#coinsBox {
+    background-color: $coins_bg;
+    border: 2px solid $coins_border;
+    border-radius: 8px;
+    margin-top: 10px;
+}
+QLabel#coinsLabel { font-size: 14px; font-weight: bold; color: $coins_text; }
+
+QListView#shopList, QListView#rosterList {
+    border: 1px solid $list_border;
+    border-radius: 5px;
+    background-color: $list_bg;
+    color: $list_text;
+    outline: none;
+}
+QListView#shopList::item, QListView#rosterList::item { padding: 10px; border-bottom: 1px solid $list_divider; }
+QListView#shopList::item:selected, QListView#rosterList::item:selected { background-color: $list_selected_bg; color: $list_selected_text; }
+
+QPushButton#buyButton, QPushButton#adoptButton {
+    background-color: $buy;
+    color: white;
+    border: none;
+    border-radius: 5px;
+    padding: 10px;
+    font-weight: bold;
+    font-size: 13px;
+}
+QPushButton#buyButton:hover, QPushButton#adoptButton:hover { background-color: $buy_hover; }
+QPushButton#buyButton:pressed, QPushButton#adoptButton:pressed { background-color: $buy_pressed; }
+""")
+
+_compiled = {}
+
+
+def compile_stylesheet(name):
+    """Stylesheet text for a palette, built once per theme"""
+    if name not in _compiled:
+        _compiled[name] = STYLESHEET.substitute(PALETTES[name])
+    return _compiled[name]
+
+
+def palette_color(name, token):
+    """Raw colour for code that paints itself (charts, GL clear colour)"""
+    return PALETTES[name][token]
+
+
+class ThemeManager:
+    """Applies compiled stylesheets at application level"""
+
+    def __init__(self, name='light'):
+        self.name = name if name in PALETTES else 'light'
+
+    def apply(self, name=None, app=None):
+        """Switch theme: one app-wide setStyleSheet, no per-widget parsing"""
+        if name is not None:
+            if name not in PALETTES:
+                raise ValueError(f"Unknown theme: {name}")
+            self.name = name
+        app = app or QApplication.instance()
+        app.setStyleSheet(compile_stylesheet(self.name))
+
+    def toggle(self):
+        names = list(PALETTES)
+        self.apply(names[(names.index(self.name) + 1) % len(names)])
+        return self.name
+
+    def color(self, token):
+        return palette_color(self.name, token)
+
+
+def set_variant(widget, prop, value):
+    """Set a dynamic style property and re-polish only if it changed"""
+    if widget.property(prop) == value:
+        return
+    widget.setProperty(prop, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)